@@ -4,17 +4,97 @@ from __future__ import annotations
 
 import asyncio
 
+import voluptuous as vol
+
 from homeassistant.config_entries import ConfigEntry, ConfigEntryState
-from homeassistant.const import Platform
-from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.const import (
+    CONF_MODE,
+    CONF_PATH,
+    EVENT_HOMEASSISTANT_CLOSE,
+    EVENT_HOMEASSISTANT_STOP,
+    Platform,
+)
+from homeassistant.core import Event, HomeAssistant, ServiceCall, callback
 import homeassistant.helpers.config_validation as cv
+from homeassistant.helpers.discovery import async_load_platform
+from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.helpers.typing import ConfigType
 
-from .const import DOMAIN
+from .api import PremierInnApiClient, async_get_api_client
+from .catalogue import PremierInnHotelCatalogue
+from .const import (
+    CONF_METRICS,
+    CONF_RECORDING,
+    CONF_RES_NO,
+    CONF_SPEED,
+    CONF_STARTUP_CONCURRENCY,
+    DATA_CALENDARS,
+    DATA_CATALOGUE,
+    DATA_CLIENT,
+    DATA_COORDINATORS,
+    DATA_FEED,
+    DATA_HANDOFF,
+    DATA_HOTELS,
+    DATA_INSTRUMENTATION,
+    DATA_NOTICES,
+    DATA_PRICES,
+    DATA_PROFILER,
+    DATA_PROXIMITY,
+    DATA_RECORDER,
+    DATA_SCHEDULER,
+    DATA_STAYS,
+    DATA_SWEEPER,
+    DOMAIN,
+    RECORDING_MODE_RECORD,
+    RECORDING_MODE_REPLAY,
+    RECORDING_SPEED_FAST,
+    RECORDING_SPEED_ORIGINAL,
+    SIGNAL_BOOKINGS_CHANGED,
+    STARTUP_CONCURRENCY,
+)
+from .coordinator import PremierInnCoordinator
+from .feed import PremierInnCalendarFeed, PremierInnCalendarFeedView
+from .geo_location import PremierInnHotelRegistry
+from .handoff import PremierInnHandoff
+from .instrumentation import PremierInnInstrumentation
+from .metrics import PremierInnMetricsView
+from .notices import PremierInnHotelNotices
+from .prices import PremierInnPriceHistory
+from .profiler import PremierInnProfiler
+from .proximity import PremierInnProximity
+from .recorder import PremierInnRecorder
+from .scheduler import PremierInnRefreshScheduler
 from .services import async_cleanup_services, async_setup_services
+from .stays import PremierInnStays
+from .sweeper import PremierInnSweeper
+from .websocket import async_register_websocket_commands
 
 PLATFORMS = [Platform.CALENDAR, Platform.GEO_LOCATION, Platform.SENSOR]
-CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+# Bookings are config entries; YAML only tunes startup and traffic recording.
+CONFIG_SCHEMA = vol.Schema(
+    {
+        DOMAIN: vol.Schema(
+            {
+                vol.Optional(
+                    CONF_STARTUP_CONCURRENCY, default=STARTUP_CONCURRENCY
+                ): vol.All(vol.Coerce(int), vol.Range(min=1)),
+                vol.Optional(CONF_METRICS, default=False): cv.boolean,
+                vol.Optional(CONF_RECORDING): vol.Schema(
+                    {
+                        vol.Required(CONF_MODE): vol.In(
+                            [RECORDING_MODE_RECORD, RECORDING_MODE_REPLAY]
+                        ),
+                        vol.Required(CONF_PATH): cv.string,
+                        vol.Optional(
+                            CONF_SPEED, default=RECORDING_SPEED_ORIGINAL
+                        ): vol.In([RECORDING_SPEED_ORIGINAL, RECORDING_SPEED_FAST]),
+                    }
+                ),
+            }
+        )
+    },
+    extra=vol.ALLOW_EXTRA,
+)
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
@@ -33,6 +113,19 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     entry.async_on_unload(unsub_options_update_listener)
 
     hass.data[DOMAIN][entry.entry_id] = hass_data
+
+    # Every platform shares the booking's coordinator. Entities are added
+    # straight away and become available once the first refresh completes in
+    # the background, so slow bookings do not hold up startup.
+    coordinator = PremierInnCoordinator(hass, async_get_api_client(hass), entry.data)
+    hass.data[DATA_COORDINATORS][entry.entry_id] = coordinator
+    entry.async_on_unload(
+        hass.data[DATA_SCHEDULER].async_add_coordinator(
+            coordinator, first_refresh=not coordinator.async_use_handoff()
+        )
+    )
+    async_dispatcher_send(hass, SIGNAL_BOOKINGS_CHANGED)
+
     # Forward the setup to each platform.
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
     return True
@@ -64,14 +157,28 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     # Remove config entry from domain.
     if unload_ok:
         hass.data[DOMAIN].pop(entry.entry_id)
+        hass.data[DATA_COORDINATORS].pop(entry.entry_id, None)
+        async_dispatcher_send(hass, SIGNAL_BOOKINGS_CHANGED)
 
     # If this was the last config entry, unregister the services
     if not hass.data[DOMAIN]:
         async_cleanup_services(hass)
 
+        if (calendars := hass.data.pop(DATA_CALENDARS, None)) is not None:
+            calendars.async_stop()
+
+        if (client := hass.data.pop(DATA_CLIENT, None)) is not None:
+            await client.async_close()
+
     return unload_ok
 
 
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Forget the price history of a removed booking."""
+    if (prices := hass.data.get(DATA_PRICES)) is not None:
+        prices.async_remove_booking(entry.data[CONF_RES_NO])
+
+
 async def handle_get_events(call: ServiceCall) -> None:
     """Your logic to handle the service call."""
 
@@ -81,4 +188,63 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
 
     hass.services.async_register("calendar", "get_events", handle_get_events)
     hass.data.setdefault(DOMAIN, {})
+
+    feed = hass.data[DATA_FEED] = PremierInnCalendarFeed(hass)
+    hass.http.register_view(PremierInnCalendarFeedView(feed))
+    hass.data[DATA_HOTELS] = PremierInnHotelRegistry(hass)
+    notices = hass.data[DATA_NOTICES] = PremierInnHotelNotices(hass)
+    await notices.async_load()
+    hass.data[DATA_PROXIMITY] = PremierInnProximity(hass)
+
+    catalogue = hass.data[DATA_CATALOGUE] = PremierInnHotelCatalogue(hass)
+    await catalogue.async_load()
+
+    prices = hass.data[DATA_PRICES] = PremierInnPriceHistory(hass)
+    await prices.async_load()
+    hass.data[DATA_STAYS] = PremierInnStays(hass)
+
+    hass.data[DATA_COORDINATORS] = {}
+    hass.data[DATA_SCHEDULER] = PremierInnRefreshScheduler(
+        hass,
+        startup_concurrency=config.get(DOMAIN, {}).get(
+            CONF_STARTUP_CONCURRENCY, STARTUP_CONCURRENCY
+        ),
+    )
+    hass.data[DATA_HANDOFF] = PremierInnHandoff()
+    sweeper = hass.data[DATA_SWEEPER] = PremierInnSweeper(hass)
+    unsub_sweep = sweeper.async_start()
+    instrumentation = hass.data[DATA_INSTRUMENTATION] = PremierInnInstrumentation()
+    hass.data[DATA_PROFILER] = PremierInnProfiler(hass)
+
+    if (recording := config.get(DOMAIN, {}).get(CONF_RECORDING)) is not None:
+        recorder = hass.data[DATA_RECORDER] = PremierInnRecorder(
+            hass,
+            recording[CONF_MODE],
+            hass.config.path(recording[CONF_PATH]),
+            recording[CONF_SPEED],
+        )
+        await recorder.async_load()
+    if config.get(DOMAIN, {}).get(CONF_METRICS):
+        hass.http.register_view(PremierInnMetricsView(hass, instrumentation))
+    async_register_websocket_commands(hass)
+
+    async def async_close_client(event: Event) -> None:
+        """Close the API client when Home Assistant stops."""
+        client: PremierInnApiClient | None = hass.data.pop(DATA_CLIENT, None)
+        if client is not None:
+            await client.async_close()
+
+    hass.bus.async_listen_once(EVENT_HOMEASSISTANT_CLOSE, async_close_client)
+
+    @callback
+    def async_stop_sweeper(event: Event) -> None:
+        """Stop sweeping for expired bookings when Home Assistant stops."""
+        unsub_sweep()
+
+    hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, async_stop_sweeper)
+
+    # Integration-wide sensors are not tied to a single booking.
+    hass.async_create_task(
+        async_load_platform(hass, Platform.SENSOR, DOMAIN, {}, config)
+    )
     return True
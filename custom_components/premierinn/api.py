@@ -0,0 +1,233 @@
+"""Premier Inn API client."""
+
+from __future__ import annotations
+
+import asyncio
+import copy
+import logging
+import random
+import time
+from typing import Any
+
+import aiohttp
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.util.ssl import get_default_context
+
+from .const import (
+    API_CONNECT_TIMEOUT,
+    API_DNS_CACHE_TTL,
+    API_HEDGE_DELAY,
+    API_HEDGE_MIN_REQUESTS,
+    API_HEDGED_OPERATIONS,
+    API_KEEPALIVE_TIMEOUT,
+    API_LIMIT_PER_HOST,
+    API_READ_TIMEOUT,
+    API_RETRY_ATTEMPTS,
+    API_RETRY_BACKOFF,
+    API_RETRY_MAX_BACKOFF,
+    API_RETRY_STATUSES,
+    API_TOTAL_TIMEOUT,
+    CONF_POST,
+    DATA_CLIENT,
+    DATA_INSTRUMENTATION,
+    DATA_RECORDER,
+    HOST,
+    REQUEST_HEADER,
+)
+from .exceptions import APIRatelimitExceeded, CannotConnect
+from .recorder import PremierInnRecorder
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class PremierInnApiClient:
+    """HTTP client shared by every Premier Inn coordinator."""
+
+    def __init__(
+        self, hass: HomeAssistant, recorder: PremierInnRecorder | None = None
+    ) -> None:
+        """Initialize."""
+        self.hass = hass
+        self.recorder = recorder
+        self._session: aiohttp.ClientSession | None = None
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        """Return the session, creating its connection pool on first use."""
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit_per_host=API_LIMIT_PER_HOST,
+                ttl_dns_cache=API_DNS_CACHE_TTL,
+                keepalive_timeout=API_KEEPALIVE_TIMEOUT,
+                ssl=get_default_context(),
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(
+                    total=API_TOTAL_TIMEOUT,
+                    connect=API_CONNECT_TIMEOUT,
+                    sock_read=API_READ_TIMEOUT,
+                ),
+            )
+        return self._session
+
+    async def async_post(
+        self, operation: str, country: str, post_body: dict[str, Any]
+    ) -> bytes:
+        """Post a GraphQL operation, retrying transient failures.
+
+        Returns the raw payload, which is decoded by the response parser.
+        Raises a typed error for any status other than 200.
+        """
+        # Retries and hedges may be sent after other bookings reuse the body.
+        post_body = copy.deepcopy(post_body)
+        instrumentation = self.hass.data.get(DATA_INSTRUMENTATION)
+        attempts = API_RETRY_ATTEMPTS.get(operation, 1)
+        for attempt in range(attempts):
+            last_attempt = attempt + 1 == attempts
+            try:
+                status, payload = await self._async_hedged_request(
+                    operation, country, post_body
+                )
+            except (aiohttp.ClientError, TimeoutError) as err:
+                if last_attempt:
+                    raise CannotConnect(f"{operation} failed: {err!r}") from err
+                _LOGGER.debug("Retrying %s after %r", operation, err)
+            else:
+                if status not in API_RETRY_STATUSES or last_attempt:
+                    break
+                _LOGGER.debug("Retrying %s after status %s", operation, status)
+
+            if instrumentation is not None:
+                instrumentation.record_retry(operation, country)
+            # Full jitter keeps bookings that failed together from retrying
+            # together.
+            await asyncio.sleep(
+                random.uniform(
+                    0, min(API_RETRY_MAX_BACKOFF, API_RETRY_BACKOFF * 2**attempt)
+                )
+            )
+
+        if status == 429:
+            raise APIRatelimitExceeded(f"{operation} was rate limited")
+        # The API takes no credentials, so a refusal comes from bot protection
+        # in front of it and is a failure to connect like any other status.
+        if status != 200:
+            raise CannotConnect(f"{operation} failed with status {status}")
+        return payload
+
+    def _hedge_delay(self, operation: str, country: str) -> float | None:
+        """Return how long to wait before hedging a request, if it is hedged."""
+        if operation not in API_HEDGED_OPERATIONS or (
+            self.recorder is not None and self.recorder.replaying
+        ):
+            return None
+
+        instrumentation = self.hass.data.get(DATA_INSTRUMENTATION)
+        stats = (
+            instrumentation.stats.get((operation, country))
+            if instrumentation is not None
+            else None
+        )
+        if stats is None or stats.requests < API_HEDGE_MIN_REQUESTS:
+            return API_HEDGE_DELAY
+        # Past the last bucket the API is struggling, and a second request
+        # would only add to its load.
+        return stats.quantile(0.95)
+
+    async def _async_hedged_request(
+        self, operation: str, country: str, post_body: dict[str, Any]
+    ) -> tuple[int, bytes]:
+        """Send a request, and a second one if the first is slow to answer.
+
+        The first successful response wins and the other request is cancelled.
+        """
+        if (delay := self._hedge_delay(operation, country)) is None:
+            return await self._async_request(operation, country, post_body)
+
+        instrumentation = self.hass.data.get(DATA_INSTRUMENTATION)
+        pending = {
+            asyncio.create_task(self._async_request(operation, country, post_body))
+        }
+        try:
+            done, _ = await asyncio.wait(pending, timeout=delay)
+            if not done:
+                if instrumentation is not None:
+                    instrumentation.record_hedge(operation, country)
+                pending.add(
+                    asyncio.create_task(
+                        self._async_request(operation, country, post_body)
+                    )
+                )
+
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    if task.exception() is None and task.result()[0] == 200:
+                        return task.result()
+            # Neither request succeeded, so surface the last outcome.
+            return task.result()
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def _async_request(
+        self, operation: str, country: str, post_body: dict[str, Any]
+    ) -> tuple[int, bytes]:
+        """Send a request once, recording its timing and payload size."""
+        instrumentation = self.hass.data.get(DATA_INSTRUMENTATION)
+        status = 0
+        size = 0
+        cancelled = False
+        start = time.perf_counter()
+        try:
+            if self.recorder is not None and self.recorder.replaying:
+                status, payload = await self.recorder.async_replay(operation, post_body)
+            else:
+                async with self.session.request(
+                    method=CONF_POST,
+                    url=HOST,
+                    json=post_body,
+                    headers=REQUEST_HEADER,
+                ) as resp:
+                    status = resp.status
+                    payload = await resp.read()
+            size = len(payload)
+        except asyncio.CancelledError:
+            # A hedged request that lost the race was not a failure.
+            cancelled = True
+            raise
+        finally:
+            latency = time.perf_counter() - start
+            if instrumentation is not None and not cancelled:
+                instrumentation.record_request(
+                    operation, country, status, latency, size
+                )
+
+        if self.recorder is not None:
+            await self.recorder.async_record(
+                operation, post_body, status, latency, payload
+            )
+
+        return status, payload
+
+    async def async_close(self) -> None:
+        """Close the connection pool and write out any recorded exchanges."""
+        if self.recorder is not None:
+            await self.recorder.async_flush()
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+
+@callback
+def async_get_api_client(hass: HomeAssistant) -> PremierInnApiClient:
+    """Return the API client, creating it if needed."""
+    if (client := hass.data.get(DATA_CLIENT)) is None:
+        client = hass.data[DATA_CLIENT] = PremierInnApiClient(
+            hass, hass.data.get(DATA_RECORDER)
+        )
+    return client
@@ -0,0 +1,93 @@
+"""Premier Inn booking model."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from datetime import datetime, tzinfo
+from typing import Any
+
+from .const import CONF_BOOKING_CONFIRMATION
+
+
+def parse_time(date: str, time: str, time_zone: tzinfo | None) -> datetime:
+    """Return the local datetime of a date and HH:MM time."""
+    return datetime.strptime(f"{date}T{time}:00", "%Y-%m-%dT%H:%M:%S").replace(
+        tzinfo=time_zone
+    )
+
+
+@dataclass(frozen=True)
+class PremierInnRoom:
+    """A single room of a booking."""
+
+    index: int
+    reservation_id: str
+    name: str
+    check_in: datetime
+    check_out: datetime
+    reservation: dict[str, Any]
+
+    @property
+    def room_stay(self) -> dict[str, Any]:
+        """Return the raw roomStay of the reservation."""
+        return self.reservation["roomStay"]
+
+
+@dataclass
+class PremierInnBooking:
+    """Every room of a booking, parsed once per refresh."""
+
+    booking_reference: str
+    rooms: list[PremierInnRoom]
+    by_reservation_id: dict[str, PremierInnRoom] = field(default_factory=dict)
+
+    def __post_init__(self) -> None:
+        """Index the rooms by reservation id."""
+        self.by_reservation_id = {room.reservation_id: room for room in self.rooms}
+
+    @property
+    def multi_room(self) -> bool:
+        """Return True if the booking has more than one room."""
+        return len(self.rooms) > 1
+
+    @property
+    def check_in(self) -> datetime:
+        """Return the earliest check in of any room."""
+        return min(room.check_in for room in self.rooms)
+
+    @property
+    def check_out(self) -> datetime:
+        """Return the latest check out of any room."""
+        return max(room.check_out for room in self.rooms)
+
+    def room(self, index: int) -> PremierInnRoom | None:
+        """Return the room at the given position, if it still exists."""
+        return self.rooms[index] if index < len(self.rooms) else None
+
+
+def parse_booking(
+    data: dict[str, Any] | None, time_zone: tzinfo | None
+) -> PremierInnBooking | None:
+    """Parse the reservations of a booking into rooms."""
+    if not data or not (booking_confirmation := data.get(CONF_BOOKING_CONFIRMATION)):
+        return None
+
+    rooms = []
+    for index, reservation in enumerate(booking_confirmation["reservationByIdList"]):
+        room_stay = reservation["roomStay"]
+        rooms.append(
+            PremierInnRoom(
+                index=index,
+                reservation_id=str(reservation.get("reservationId") or index),
+                name=(room_stay.get("roomExtraInfo") or {}).get("roomName") or "",
+                check_in=parse_time(
+                    room_stay["arrivalDate"], room_stay["checkInTime"], time_zone
+                ),
+                check_out=parse_time(
+                    room_stay["departureDate"], room_stay["checkOutTime"], time_zone
+                ),
+                reservation=reservation,
+            )
+        )
+
+    return PremierInnBooking(booking_confirmation.get("bookingReference", ""), rooms)
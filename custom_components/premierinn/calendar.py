@@ -3,34 +3,30 @@
 from datetime import datetime
 import hashlib
 import json
+from typing import Any
 import uuid
 
 from homeassistant.components.calendar import CalendarEntity, CalendarEvent
-from homeassistant.components.sensor import SensorEntityDescription
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
-from homeassistant.util import dt as dt_util
 
+from .booking import PremierInnBooking
 from .const import (
     CONF_BOOKING_CONFIRMATION,
     CONF_CALENDARS,
     CONF_HOTEL_INFORMATION,
     CONF_RES_NO,
+    DATA_COORDINATORS,
+    DATA_FEED,
+    DATA_INSTRUMENTATION,
     DOMAIN,
 )
 from .coordinator import PremierInnCoordinator
-
-DATE_SENSOR_TYPES = [
-    SensorEntityDescription(
-        key="holiday",
-        name="Holiday",
-    ),
-]
+from .instrumentation import timed
 
 
 async def async_setup_entry(
@@ -44,10 +40,7 @@ async def async_setup_entry(
     if entry.options:
         config.update(entry.options)
 
-    session = async_get_clientsession(hass)
-    coordinator = PremierInnCoordinator(hass, session, entry.data)
-
-    await coordinator.async_refresh()
+    coordinator: PremierInnCoordinator = hass.data[DATA_COORDINATORS][entry.entry_id]
 
     name = entry.data[CONF_RES_NO]
 
@@ -55,15 +48,37 @@ async def async_setup_entry(
 
     sensors = [PremierInnCalendarSensor(coordinator, name)]
 
-    for calendar in calendars:
-        if calendar != "None":
-            for sensor in sensors:
-                events = sensor.get_events(datetime.today(), hass)
-                for event in events:
-                    await add_to_calendar(hass, calendar, event, entry)
+    # Publish the booking to the domain-wide iCalendar feed.
+    entry.async_on_unload(
+        hass.data[DATA_FEED].async_add_booking(entry.entry_id, coordinator, name)
+    )
+
+    async def async_add_to_calendars() -> None:
+        """Add the booking's events to the selected calendars."""
+        for calendar in calendars:
+            if calendar != "None":
+                for sensor in sensors:
+                    events = sensor.get_events(datetime.today(), hass)
+                    for event in events:
+                        await add_to_calendar(hass, calendar, event, entry)
+
+    @callback
+    def async_booking_ready() -> None:
+        """Fill the calendars in the background once the booking has data."""
+        entry.async_create_background_task(
+            hass, async_add_to_calendars(), f"{DOMAIN} add {name} to calendars"
+        )
+
+    entry.async_on_unload(coordinator.async_when_ready(async_booking_ready))
 
     if "None" in calendars:
-        async_add_entities(sensors, update_before_add=True)
+        async_add_entities(sensors)
+
+
+def record_calendar_call(hass: HomeAssistant, operation: str, success: bool) -> None:
+    """Count a calendar service call."""
+    if (instrumentation := hass.data.get(DATA_INSTRUMENTATION)) is not None:
+        instrumentation.record_calendar(operation, success)
 
 
 async def create_event(hass: HomeAssistant, service_data):
@@ -77,12 +92,14 @@ async def create_event(hass: HomeAssistant, service_data):
             return_response=True,
         )
     except (ServiceValidationError, HomeAssistantError):
+        record_calendar_call(hass, "create_event", False)
         await hass.services.async_call(
             "calendar",
             "create_event",
             service_data,
             blocking=True,
         )
+    record_calendar_call(hass, "create_event", True)
 
 
 class DateTimeEncoder(json.JSONEncoder):
@@ -126,6 +143,8 @@ async def get_event_uid(hass: HomeAssistant, service_data) -> str | None:
     except (ServiceValidationError, HomeAssistantError):
         events = None
 
+    record_calendar_call(hass, "get_events", events is not None)
+
     if events is not None and entity_id in events:
         for event in events[entity_id].get("events"):
             if (
@@ -138,6 +157,7 @@ async def get_event_uid(hass: HomeAssistant, service_data) -> str | None:
     return None
 
 
+@timed
 async def add_to_calendar(
     hass: HomeAssistant, calendar: str, event: CalendarEvent, entry: ConfigEntry
 ):
@@ -170,6 +190,45 @@ async def add_to_calendar(
         hass.config_entries.async_update_entry(entry, data=updated_data)
 
 
+EVENT_NAME = "Premier Inn"
+
+
+def booking_events(
+    coordinator: PremierInnCoordinator, start_date: datetime
+) -> list[CalendarEvent]:
+    """Return an event for each room of a booking checking in from a date on."""
+    events: list[CalendarEvent] = []
+    booking = coordinator.booking
+    if not coordinator.data or booking is None:
+        return events
+
+    formatted_address = [
+        value
+        for key, value in coordinator.data[CONF_HOTEL_INFORMATION]["address"].items()
+        if value and value not in {"None", ""} and key != "country"
+    ]
+    event_location = ", ".join(formatted_address)
+    booking_reference = coordinator.data[CONF_BOOKING_CONFIRMATION]["bookingReference"]
+
+    for room in booking.rooms:
+        event_description = f"PremierInn|{booking_reference}"
+        if booking.multi_room:
+            # Keeps rooms of the same type apart when matching events.
+            event_description += f"|{room.reservation_id}"
+
+        if room.check_in.date() >= start_date.date():
+            events.append(
+                CalendarEvent(
+                    start=room.check_in,
+                    end=room.check_out,
+                    summary=f"{EVENT_NAME}: {room.name}",
+                    location=event_location,
+                    description=event_description,
+                )
+            )
+    return events
+
+
 class PremierInnCalendarSensor(
     CoordinatorEntity[PremierInnCoordinator], CalendarEntity
 ):
@@ -178,94 +237,53 @@ class PremierInnCalendarSensor(
     def __init__(self, coordinator: PremierInnCoordinator, name: str) -> None:
         """Initialize."""
         super().__init__(coordinator)
-        self.data = coordinator.data
-        self.booking_confirmation = self.data.get(CONF_BOOKING_CONFIRMATION)
-        self.room_stay = self.booking_confirmation["reservationByIdList"][0]["roomStay"]
-        self.hotel_info = self.data.get(CONF_HOTEL_INFORMATION)
-        self.event_name = "Premier Inn"
+        self.event_name = EVENT_NAME
         self._attr_device_info = DeviceInfo(
             identifiers={(DOMAIN, f"{name}")},
             manufacturer=self.event_name,
-            model=self.hotel_info["name"],
-            name=f'{self.event_name}: {self.room_stay["roomExtraInfo"]["roomName"]}',
+            name=self.event_name,
             configuration_url="https://github.com/jampez77/PremierInn/",
         )
+        if coordinator.data and coordinator.booking is not None:
+            self._attr_device_info["model"] = self.hotel_info["name"]
+            self._attr_device_info["name"] = (
+                f"{self.event_name}: {self.booking.rooms[0].name}"
+            )
         self._attr_unique_id = f"{DOMAIN}-{name}-calendar".lower()
         self._attr_name = f"{DOMAIN.title()} - {name.upper()}"
 
+    @property
+    def booking(self) -> PremierInnBooking | None:
+        """Return the parsed rooms of the booking."""
+        return self.coordinator.booking
+
+    @property
+    def booking_confirmation(self) -> dict[str, Any]:
+        """Return the booking confirmation."""
+        return self.coordinator.data.get(CONF_BOOKING_CONFIRMATION)
+
+    @property
+    def hotel_info(self) -> dict[str, Any]:
+        """Return the hotel information."""
+        return self.coordinator.data.get(CONF_HOTEL_INFORMATION)
+
     @property
     def available(self) -> bool:
         """Return True if entity is available."""
-        return bool(self.coordinator.data)
+        return bool(self.coordinator.data) and self.booking is not None
 
     @property
     def event(self) -> CalendarEvent | None:
         """Return the next upcoming event."""
         events = self.get_events(datetime.today(), self.hass)
-        return sorted(events, key=lambda c: c.start)[0]
+        return min(events, key=lambda c: c.start) if events else None
 
+    @timed
     def get_events(
         self, start_date: datetime, hass: HomeAssistant
     ) -> list[CalendarEvent]:
         """Return calendar events."""
-        events = []
-
-        for date_sensor_type in DATE_SENSOR_TYPES:
-            event_end_raw = None
-            event_description = (
-                f"PremierInn|{self.booking_confirmation["bookingReference"]}"
-            )
-            formatted_address = [
-                value
-                for key, value in self.hotel_info["address"].items()
-                if value and value not in {"None", ""} and key != "country"
-            ]
-
-            event_location = ", ".join(formatted_address)
-            event_name = date_sensor_type.name
-
-            event_start_raw = (
-                f"{self.room_stay['arrivalDate']}T{self.room_stay['checkInTime']}:00"
-            )
-            event_end_raw = (
-                f"{self.room_stay['departureDate']}T{self.room_stay['checkOutTime']}:00"
-            )
-
-            event_name = (
-                f'{self.event_name}: {self.room_stay["roomExtraInfo"]["roomName"]}'
-            )
-
-            if not event_start_raw:
-                continue
-
-            user_timezone = dt_util.get_time_zone(hass.config.time_zone)
-
-            start_dt_utc = datetime.strptime(
-                event_start_raw, "%Y-%m-%dT%H:%M:%S"
-            ).replace(tzinfo=user_timezone)
-            # Convert the datetime to the default timezone
-            event_start = start_dt_utc.astimezone(user_timezone)
-
-            if event_end_raw is None:
-                event_end_raw = event_start_raw
-
-            end_dt_utc = datetime.strptime(event_end_raw, "%Y-%m-%dT%H:%M:%S").replace(
-                tzinfo=user_timezone
-            )
-            # Convert the datetime to the default timezone
-            event_end = end_dt_utc.astimezone(user_timezone)
-
-            if event_start.date() >= start_date.date():
-                events.append(
-                    CalendarEvent(
-                        start=event_start,
-                        end=event_end,
-                        summary=event_name,
-                        location=event_location,
-                        description=event_description,
-                    )
-                )
-        return events
+        return booking_events(self.coordinator, start_date)
 
     async def async_get_events(
         self,
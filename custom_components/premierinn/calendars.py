@@ -0,0 +1,120 @@
+"""Premier Inn index of calendars that can hold booking events."""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from typing import Any
+
+from homeassistant.components.calendar import (
+    DOMAIN as CALENDAR_DOMAIN,
+    CalendarEntityFeature,
+)
+from homeassistant.const import ATTR_SUPPORTED_FEATURES
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.event import (
+    TrackStates,
+    async_track_state_change_filtered,
+)
+
+from .const import DATA_CALENDARS
+
+CALENDAR_PREFIX = f"{CALENDAR_DOMAIN}."
+
+
+@callback
+def is_calendar_update(event_data: Mapping[str, Any]) -> bool:
+    """Return True if a registry update concerns a calendar."""
+    return any(
+        (event_data.get(key) or "").startswith(CALENDAR_PREFIX)
+        for key in ("entity_id", "old_entity_id")
+    )
+
+
+class PremierInnCalendarIndex:
+    """Keep the calendars that support creating events, by entity id.
+
+    The index is built from the calendar states once, then kept current from
+    state changes and entity registry updates.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize."""
+        self.hass = hass
+        self._calendars: dict[str, str] = {}
+        self._unsub_states: CALLBACK_TYPE | None = None
+        self._unsub_registry: CALLBACK_TYPE | None = None
+
+    def __contains__(self, entity_id: str) -> bool:
+        """Return True if the calendar can hold booking events."""
+        return entity_id in self._calendars
+
+    @property
+    def calendars(self) -> dict[str, str]:
+        """Return the names of the create-capable calendars, by entity id."""
+        return dict(self._calendars)
+
+    @callback
+    def async_start(self) -> None:
+        """Build the index and start following changes."""
+        for state in self.hass.states.async_all(CALENDAR_DOMAIN):
+            self._async_update(state.entity_id)
+
+        self._unsub_states = async_track_state_change_filtered(
+            self.hass,
+            TrackStates(False, set(), {CALENDAR_DOMAIN}),
+            self._async_state_changed,
+        ).async_remove
+        self._unsub_registry = self.hass.bus.async_listen(
+            er.EVENT_ENTITY_REGISTRY_UPDATED,
+            self._async_registry_updated,
+            event_filter=is_calendar_update,
+        )
+
+    @callback
+    def async_stop(self) -> None:
+        """Stop following changes."""
+        if self._unsub_states is not None:
+            self._unsub_states()
+            self._unsub_states = None
+        if self._unsub_registry is not None:
+            self._unsub_registry()
+            self._unsub_registry = None
+
+    @callback
+    def _async_state_changed(self, event: Event) -> None:
+        """Update a calendar whose state changed."""
+        self._async_update(event.data["entity_id"])
+
+    @callback
+    def _async_registry_updated(self, event: Event) -> None:
+        """Update a calendar that was renamed or removed."""
+        if event.data["entity_id"].startswith(CALENDAR_PREFIX):
+            self._async_update(event.data["entity_id"])
+        if (old_entity_id := event.data.get("old_entity_id")) is not None:
+            self._calendars.pop(old_entity_id, None)
+
+    @callback
+    def _async_update(self, entity_id: str) -> None:
+        """Add or remove a calendar."""
+        state = self.hass.states.get(entity_id)
+        entity = er.async_get(self.hass).async_get(entity_id)
+        if (
+            state is None
+            or entity is None
+            or not state.attributes.get(ATTR_SUPPORTED_FEATURES, 0)
+            & CalendarEntityFeature.CREATE_EVENT
+        ):
+            self._calendars.pop(entity_id, None)
+            return
+
+        self._calendars[entity_id] = entity.original_name or entity_id
+
+
+@callback
+def async_get_calendar_index(hass: HomeAssistant) -> PremierInnCalendarIndex:
+    """Return the calendar index, building it on first use."""
+    if (index := hass.data.get(DATA_CALENDARS)) is None:
+        index = hass.data[DATA_CALENDARS] = PremierInnCalendarIndex(hass)
+        index.async_start()
+    return index
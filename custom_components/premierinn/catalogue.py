@@ -0,0 +1,149 @@
+"""Premier Inn hotel catalogue."""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+import json
+import logging
+import time
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.storage import Store
+
+from .const import (
+    CATALOGUE_MAX_AGE,
+    CATALOGUE_SAVE_DELAY,
+    CATALOGUE_STORAGE_KEY,
+    CATALOGUE_STORAGE_VERSION,
+    CONF_HOTEL_ID,
+    CONF_HOTEL_INFORMATION,
+)
+from .exceptions import InvalidResponse
+from .response import VALIDATORS
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def is_valid_hotel(hotel: Any) -> bool:
+    """Return True if a hotel has the fields a fetched one is checked for."""
+    try:
+        VALIDATORS[CONF_HOTEL_INFORMATION](hotel, CONF_HOTEL_INFORMATION)
+    except InvalidResponse as err:
+        _LOGGER.debug("Skipping invalid hotel: %s", err)
+        return False
+    return True
+
+
+def read_hotels(path: str) -> list[dict[str, Any]]:
+    """Read hotel information from a JSON file."""
+    with open(path, encoding="utf-8") as file:
+        data = json.load(file)
+
+    if isinstance(data, dict):
+        data = data.get("hotels", [])
+
+    hotels = []
+    for row in data:
+        # Accept both raw hotelInformation payloads and exported catalogue rows.
+        hotel = row[2] if isinstance(row, list) and len(row) == 3 else row
+        if is_valid_hotel(hotel):
+            hotels.append(hotel)
+    return hotels
+
+
+class PremierInnHotelCatalogue:
+    """Sorted index of hotel information keyed by hotel id."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize."""
+        self.hass = hass
+        self._store: Store[dict[str, list[list[Any]]]] = Store(
+            hass, CATALOGUE_STORAGE_VERSION, CATALOGUE_STORAGE_KEY
+        )
+        self._ids: list[str] = []
+        self._seen: list[float] = []
+        self._hotels: list[dict[str, Any]] = []
+
+    def __len__(self) -> int:
+        """Return the number of known hotels."""
+        return len(self._ids)
+
+    async def async_load(self) -> None:
+        """Load the catalogue from storage."""
+        data = await self._store.async_load()
+        if not data:
+            return
+
+        rows = sorted(
+            (row for row in data.get("hotels", []) if is_valid_hotel(row[2])),
+            key=lambda row: row[0],
+        )
+        self._ids = [row[0] for row in rows]
+        self._seen = [row[1] for row in rows]
+        self._hotels = [row[2] for row in rows]
+
+    def get(self, hotel_id: str, max_age: float | None = None) -> dict[str, Any] | None:
+        """Return the hotel information, if known and recent enough."""
+        index = bisect_left(self._ids, hotel_id)
+        if index == len(self._ids) or self._ids[index] != hotel_id:
+            return None
+        if max_age is not None and time.time() - self._seen[index] > max_age:
+            return None
+        return self._hotels[index]
+
+    @callback
+    def async_add(self, hotel_info: dict[str, Any]) -> None:
+        """Add or update a hotel and schedule a save.
+
+        Fields missing from a trimmed response are kept from the known record
+        while it is recent, along with its age, so the record is never younger
+        than its oldest field.
+        """
+        seen = time.time()
+        index = bisect_left(self._ids, hotel_info[CONF_HOTEL_ID])
+        existing = self.get(hotel_info[CONF_HOTEL_ID], CATALOGUE_MAX_AGE)
+        if existing is not None and not existing.keys() <= hotel_info.keys():
+            hotel_info = {**existing, **hotel_info}
+            seen = self._seen[index]
+        self._insert(hotel_info, seen)
+        self._store.async_delay_save(self._data_to_save, CATALOGUE_SAVE_DELAY)
+
+    async def async_import(self, path: str) -> int:
+        """Bulk-load hotels from a JSON file."""
+        try:
+            hotels = await self.hass.async_add_executor_job(read_hotels, path)
+        except (OSError, ValueError, TypeError) as err:
+            raise HomeAssistantError(f"Unable to import hotels from {path}: {err}")
+
+        seen = time.time()
+        for hotel_info in hotels:
+            self._insert(hotel_info, seen)
+
+        await self._store.async_save(self._data_to_save())
+        _LOGGER.debug("Imported %s hotels from %s", len(hotels), path)
+        return len(hotels)
+
+    def _insert(self, hotel_info: dict[str, Any], seen: float) -> None:
+        """Insert a hotel while keeping the index sorted."""
+        hotel_id = hotel_info[CONF_HOTEL_ID]
+        index = bisect_left(self._ids, hotel_id)
+        if index < len(self._ids) and self._ids[index] == hotel_id:
+            self._seen[index] = seen
+            self._hotels[index] = hotel_info
+            return
+
+        self._ids.insert(index, hotel_id)
+        self._seen.insert(index, seen)
+        self._hotels.insert(index, hotel_info)
+
+    @callback
+    def _data_to_save(self) -> dict[str, list[list[Any]]]:
+        """Return the catalogue as compact sorted rows."""
+        return {
+            "hotels": [
+                [hotel_id, seen, hotel]
+                for hotel_id, seen, hotel in zip(self._ids, self._seen, self._hotels)
+            ]
+        }
@@ -9,49 +9,39 @@ from typing import Any
 import voluptuous as vol
 
 from homeassistant import config_entries
-from homeassistant.components.calendar import CalendarEntityFeature
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.data_entry_flow import FlowResult
 from homeassistant.exceptions import HomeAssistantError
-from homeassistant.helpers import entity_registry as er
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
 import homeassistant.helpers.config_validation as cv
 
+from .api import async_get_api_client
+from .calendars import async_get_calendar_index
 from .const import (
     CONF_ARRIVAL_DATE,
+    CONF_AUTO,
+    CONF_BASKET_REFERENCE,
     CONF_CALENDARS,
     CONF_COUNTRY,
     CONF_GERMANY,
     CONF_GREAT_BRITAIN,
     CONF_LAST_NAME,
     CONF_RES_NO,
+    CONF_SEARCH_WINDOW,
+    COUNTRIES,
+    DATA_HANDOFF,
     DOMAIN,
+    LOOKUP_MAX_WINDOW,
 )
 from .coordinator import PremierInnCoordinator
+from .exceptions import APIRatelimitExceeded, CannotConnect, PremierInnError
+from .lookup import async_locate_booking
 
 _LOGGER = logging.getLogger(__name__)
 
 
-async def _get_calendar_entities(hass: HomeAssistant) -> list[str]:
+async def _get_calendar_entities(hass: HomeAssistant) -> dict[str, str]:
     """Retrieve calendar entities."""
-    entity_registry = er.async_get(hass)
-    calendar_entities = {}
-    for entity_id, entity in entity_registry.entities.items():
-        if entity_id.startswith("calendar."):
-            calendar_entity = hass.states.get(entity_id)
-            if calendar_entity:
-                supported_features = calendar_entity.attributes.get(
-                    "supported_features", 0
-                )
-
-                supports_create_event = (
-                    supported_features & CalendarEntityFeature.CREATE_EVENT
-                )
-
-                if supports_create_event:
-                    calendar_name = entity.original_name or entity_id
-                    calendar_entities[entity_id] = calendar_name
-
+    calendar_entities = async_get_calendar_index(hass).calendars
     calendar_entities["None"] = "Create a new calendar"
     return calendar_entities
 
@@ -73,19 +63,43 @@ def async_get_options_flow(config_entry):
     return PremierInnFlowHandler(config_entry)
 
 
+@callback
+def async_handoff(hass: HomeAssistant, res_no: str, data: dict[str, Any]) -> None:
+    """Pass validated booking data on to the setup of the new entry."""
+    if data and (handoff := hass.data.get(DATA_HANDOFF)) is not None:
+        handoff.async_put(res_no, data)
+
+
 async def validate_input(hass: HomeAssistant, data: dict[str, Any]) -> dict[str, Any]:
     """Validate the user input allows us to connect."""
 
-    session = async_get_clientsession(hass)
+    window = data.get(CONF_SEARCH_WINDOW, 0)
+    data = {key: value for key, value in data.items() if key != CONF_SEARCH_WINDOW}
+    basket_reference = None
+    if data[CONF_COUNTRY] == CONF_AUTO or window:
+        countries = (
+            list(COUNTRIES) if data[CONF_COUNTRY] == CONF_AUTO else [data[CONF_COUNTRY]]
+        )
+        if (found := await async_locate_booking(hass, data, countries, window)) is None:
+            raise InvalidAuth
+        country, arrival_date, basket_reference = found
+        data = {**data, CONF_COUNTRY: country, CONF_ARRIVAL_DATE: arrival_date}
+
+    client = async_get_api_client(hass)
 
-    coordinator = PremierInnCoordinator(hass, session, data)
+    coordinator = PremierInnCoordinator(hass, client, data, basket_reference)
 
     await coordinator.async_refresh()
 
-    if coordinator.last_exception is not None and data is not None:
-        raise InvalidAuth
+    if (err := coordinator.last_exception) is not None:
+        # Failures to reach the API are not the user's details being wrong.
+        if isinstance(err.__cause__, (CannotConnect, APIRatelimitExceeded)):
+            raise CannotConnect from err
+        raise InvalidAuth from err
+
+    async_handoff(hass, data[CONF_RES_NO], coordinator.data)
 
-    return {"title": str(data[CONF_RES_NO]).upper()}
+    return {"title": str(data[CONF_RES_NO]).upper(), "data": data}
 
 
 class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
@@ -115,8 +129,11 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                     CONF_RES_NO, default=user_input.get(CONF_RES_NO, "")
                 ): cv.string,
                 vol.Required(CONF_COUNTRY, default=CONF_GREAT_BRITAIN): vol.In(
-                    [CONF_GREAT_BRITAIN, CONF_GERMANY]
+                    [CONF_GREAT_BRITAIN, CONF_GERMANY, CONF_AUTO]
                 ),
+                vol.Optional(
+                    CONF_SEARCH_WINDOW, default=user_input.get(CONF_SEARCH_WINDOW, 0)
+                ): vol.All(vol.Coerce(int), vol.Range(min=0, max=LOOKUP_MAX_WINDOW)),
                 vol.Required(
                     CONF_CALENDARS, default=user_input.get(CONF_CALENDARS, [])
                 ): cv.multi_select(calendar_entities),
@@ -144,7 +161,9 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             if not errors:
                 try:
                     info = await validate_input(self.hass, user_input)
-                except CannotConnect:
+                except APIRatelimitExceeded:
+                    errors["base"] = "rate_limited"
+                except (CannotConnect, PremierInnError):
                     errors["base"] = "cannot_connect"
                 except InvalidAuth:
                     errors["base"] = "invalid_auth"
@@ -152,7 +171,9 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                     _LOGGER.exception("Unexpected exception")
                     errors["base"] = "unknown"
                 else:
-                    return self.async_create_entry(title=info["title"], data=user_input)
+                    return self.async_create_entry(
+                        title=info["title"], data=info["data"]
+                    )
 
         return self.async_show_form(
             step_id="user",
@@ -165,9 +186,15 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
         if import_data is not None:
             try:
-                session = async_get_clientsession(self.hass)
+                # A basket found by the service's lookup is not kept in the entry.
+                import_data = dict(import_data)
+                basket_reference = import_data.pop(CONF_BASKET_REFERENCE, None)
 
-                coordinator = PremierInnCoordinator(self.hass, session, import_data)
+                client = async_get_api_client(self.hass)
+
+                coordinator = PremierInnCoordinator(
+                    self.hass, client, import_data, basket_reference
+                )
 
                 await coordinator.async_refresh()
 
@@ -175,6 +202,8 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                     await self.async_set_unique_id(import_data[CONF_RES_NO])
                     self._abort_if_unique_id_configured()
 
+                    async_handoff(self.hass, import_data[CONF_RES_NO], coordinator.data)
+
                     return self.async_create_entry(
                         title=import_data[CONF_RES_NO], data=import_data
                     )
@@ -205,9 +234,5 @@ class PremierInnFlowHandler(config_entries.OptionsFlow):
         )
 
 
-class CannotConnect(HomeAssistantError):
-    """Error to indicate we cannot connect."""
-
-
 class InvalidAuth(HomeAssistantError):
     """Error to indicate there is invalid auth."""
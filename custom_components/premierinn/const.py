@@ -14,6 +14,7 @@ CONF_CREATE_CALENDAR = "create_calendar"
 CONF_COUNTRY = "country"
 CONF_GERMANY = "Germany"
 CONF_GREAT_BRITAIN = "Great Britain"
+CONF_AUTO = "Automatic"
 CONF_GB = "gb"
 CONF_DE = "de"
 CONF_FIND_BOOKING_CRITERIA = "findBookingCriteria"
@@ -26,6 +27,158 @@ CONF_HOTEL_INFORMATION = "hotelInformation"
 CONF_HOTEL_ID = "hotelId"
 CONF_ADD_BOOKING = "add_booking"
 CONF_REMOVE_BOOKING = "remove_booking"
+CONF_IMPORT_HOTELS = "import_hotels"
+CONF_METRICS = "metrics"
+CONF_REFRESH = "refresh"
+CONF_PROFILE = "profile"
+CONF_PURGE_EXPIRED = "purge_expired"
+
+# Countries tried, in order of preference, when the country is automatic.
+COUNTRIES = {CONF_GREAT_BRITAIN: CONF_GB, CONF_GERMANY: CONF_DE}
+CONF_SEARCH_WINDOW = "search_window"
+# Days either side of the arrival date a lookup may search.
+LOOKUP_MAX_WINDOW = 7
+DATA_LOOKUP = f"{DOMAIN}_lookup"
+# findBooking lookups in flight across every search.
+LOOKUP_CONCURRENCY = 4
+# findBooking calls a single search may make, as each one opens a basket.
+LOOKUP_MAX_PROBES = 12
+
+DATA_FEED = f"{DOMAIN}_feed"
+DATA_HOTELS = f"{DOMAIN}_hotels"
+DATA_PROXIMITY = f"{DOMAIN}_proximity"
+DATA_CATALOGUE = f"{DOMAIN}_catalogue"
+
+CATALOGUE_STORAGE_KEY = f"{DOMAIN}_hotels"
+CATALOGUE_STORAGE_VERSION = 1
+CATALOGUE_SAVE_DELAY = 60
+# Hotel information is refreshed once a day to pick up new notices.
+CATALOGUE_MAX_AGE = 86400
+
+DATA_INSTRUMENTATION = f"{DOMAIN}_instrumentation"
+# Upper bounds of the request latency histogram, in seconds.
+INSTRUMENTATION_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+DATA_CLIENT = f"{DOMAIN}_client"
+API_LIMIT_PER_HOST = 8
+API_DNS_CACHE_TTL = 300
+API_KEEPALIVE_TIMEOUT = 60
+API_TOTAL_TIMEOUT = 30
+API_CONNECT_TIMEOUT = 10
+API_READ_TIMEOUT = 20
+# Attempts per operation for connection errors and server errors. Every
+# findBooking call opens a new basket, so it is retried the least.
+API_RETRY_ATTEMPTS = {
+    CONF_FIND_BOOKING: 2,
+    CONF_BOOKING_CONFIRMATION: 3,
+    CONF_HOTEL_INFORMATION: 3,
+}
+API_RETRY_STATUSES = (500, 502, 503, 504)
+# Backoff before each retry is drawn between zero and this many seconds,
+# doubling per attempt up to the maximum.
+API_RETRY_BACKOFF = 0.5
+API_RETRY_MAX_BACKOFF = 8
+# Operations that get a second, hedged request when the first is slow. The
+# hedge waits for the operation's p95 latency once enough requests were seen.
+API_HEDGED_OPERATIONS = (CONF_BOOKING_CONFIRMATION,)
+API_HEDGE_DELAY = 2.0
+API_HEDGE_MIN_REQUESTS = 20
+
+DATA_RECORDER = f"{DOMAIN}_recorder"
+CONF_RECORDING = "recording"
+CONF_SPEED = "speed"
+RECORDING_MODE_RECORD = "record"
+RECORDING_MODE_REPLAY = "replay"
+RECORDING_SPEED_ORIGINAL = "original"
+RECORDING_SPEED_FAST = "fast"
+RECORDING_FLUSH_SIZE = 20
+# Values that identify a guest are replaced by a stable hash when recording.
+RECORDING_ANONYMIZED_KEYS = (
+    "lastName",
+    "resNo",
+    "basketReference",
+    "bookingReference",
+    "reservationId",
+    "givenName",
+    "surName",
+    "token",
+)
+
+DATA_PRICES = f"{DOMAIN}_prices"
+PRICES_STORAGE_KEY = f"{DOMAIN}_prices"
+PRICES_STORAGE_VERSION = 1
+PRICES_SAVE_DELAY = 60
+# Price changes kept per booking; older changes are overwritten.
+PRICES_HISTORY_SIZE = 64
+# Booking totals tracked for changes, followed by the sum of the room prices.
+PRICE_FIELDS = (
+    "totalCost",
+    "previousTotal",
+    "newTotal",
+    "balanceOutstanding",
+    "roomPrice",
+)
+
+DATA_NOTICES = f"{DOMAIN}_notices"
+NOTICES_STORAGE_KEY = f"{DOMAIN}_notices"
+NOTICES_STORAGE_VERSION = 1
+NOTICES_SAVE_DELAY = 60
+EVENT_IMPORTANT_INFO = f"{DOMAIN}_important_info"
+NOTICE_NEW = "new"
+NOTICE_CHANGED = "changed"
+
+DATA_CALENDARS = f"{DOMAIN}_calendars"
+DATA_HANDOFF = f"{DOMAIN}_handoff"
+# How long data validated by the config flow may seed a new entry's setup.
+HANDOFF_TTL = 120
+
+DATA_STAYS = f"{DOMAIN}_stays"
+DATA_SWEEPER = f"{DOMAIN}_sweeper"
+PURGE_INTERVAL = 3600
+# Entries removed at the same time, and calendar events deleted per batch.
+PURGE_CONCURRENCY = 4
+PURGE_BATCH_SIZE = 10
+# Bookings that never load are removed this many days after arrival.
+PURGE_GRACE_DAYS = 30
+
+DATA_PROFILER = f"{DOMAIN}_profiler"
+CONF_SECONDS = "seconds"
+CONF_TOP = "top"
+PROFILE_SECONDS = 60
+PROFILE_MAX_SECONDS = 3600
+# Functions listed in the log summary of a profile.
+PROFILE_TOP = 20
+
+# On-demand refreshes within this many seconds of the last one reuse it.
+REFRESH_COOLDOWN = 10
+
+DATA_SCHEDULER = f"{DOMAIN}_scheduler"
+SCHEDULER_WORKERS = 3
+CONF_STARTUP_CONCURRENCY = "startup_concurrency"
+# Bookings refreshed at the same time while Home Assistant starts.
+STARTUP_CONCURRENCY = 2
+DATA_COORDINATORS = f"{DOMAIN}_coordinators"
+# Sent when a booking's coordinator is added or removed.
+SIGNAL_BOOKINGS_CHANGED = f"{DOMAIN}_bookings_changed"
+SCHEDULER_MAX_SPACING = 5
+SCHEDULER_RETRY_INTERVAL = 60
+SCHEDULER_ARRIVAL_INTERVAL = 120
+SCHEDULER_DEFAULT_INTERVAL = 300
+SCHEDULER_DISTANT_INTERVAL = 1800
+# Bookings checking in within a day are refreshed more often, and those more
+# than a week away less often.
+SCHEDULER_ARRIVAL_WINDOW = 86400
+SCHEDULER_DISTANT_WINDOW = 604800
+FEED_URL = f"/api/{DOMAIN}/calendar.ics"
+METRICS_URL = f"/api/{DOMAIN}/metrics"
+
+PROXIMITY_TRACKED_DOMAINS = ("device_tracker", "person")
+PROXIMITY_ARRIVED_RADIUS = 200
+PROXIMITY_TOLERANCE = 50
+PROXIMITY_ARRIVED = "arrived"
+PROXIMITY_TOWARDS = "towards"
+PROXIMITY_AWAY_FROM = "away_from"
+PROXIMITY_STATIONARY = "stationary"
 
 REQUEST_HEADER = {
     "User-Agent": "PostmanRuntime/7.41.2",
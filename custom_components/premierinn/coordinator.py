@@ -1,22 +1,26 @@
 """PremmierInn Coordinator."""
 
-from datetime import timedelta
+import asyncio
+from collections.abc import Callable
+from datetime import datetime, timedelta
 import logging
+import time
+from typing import Any
 
-import aiohttp
-
-from homeassistant.core import HomeAssistant
-from homeassistant.exceptions import ConfigEntryAuthFailed, HomeAssistantError
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util import dt as dt_util
 
+from .api import PremierInnApiClient
+from .booking import PremierInnBooking, parse_booking
 from .const import (
     BOOKING_CONF_POST_BODY,
+    CATALOGUE_MAX_AGE,
     CONF_ARRIVAL_DATE,
     CONF_ARRIVALDATE,
     CONF_BASKET_REFERENCE,
     CONF_BOOKING_CONFIRMATION,
     CONF_COUNTRY,
-    CONF_DATA,
     CONF_DE,
     CONF_FIND_BOOKING,
     CONF_FIND_BOOKING_CRITERIA,
@@ -26,16 +30,27 @@ from .const import (
     CONF_HOTEL_INFORMATION,
     CONF_LAST_NAME,
     CONF_LASTNAME,
-    CONF_POST,
     CONF_RES_NO,
     CONF_RESNO,
     CONF_VARIABLES,
+    DATA_CATALOGUE,
+    DATA_HANDOFF,
+    DATA_INSTRUMENTATION,
     DOMAIN,
     FIND_BOOKING_POST_BODY,
-    HOST,
     HOTEL_INFORMATION_POST_BODY,
-    REQUEST_HEADER,
+    REFRESH_COOLDOWN,
+)
+from .exceptions import (
+    APIRatelimitExceeded,
+    InvalidAuth,
+    InvalidResponse,
+    PremierInnError,
+    UnknownError,
 )
+from .instrumentation import PremierInnInstrumentation
+from .query import async_get_fields, compose_query, top_level
+from .response import parse_response
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -53,9 +68,17 @@ class PremierInnCoordinator(DataUpdateCoordinator):
     """Data coordinator."""
 
     def __init__(
-        self, hass: HomeAssistant, session: aiohttp.ClientSession, data: dict
+        self,
+        hass: HomeAssistant,
+        client: PremierInnApiClient,
+        data: dict,
+        basket_reference: str | None = None,
     ) -> None:
-        """Initialize coordinator."""
+        """Initialize coordinator.
+
+        A basket reference already found for the booking saves the first
+        refresh from looking it up again.
+        """
 
         super().__init__(
             hass,
@@ -65,96 +88,243 @@ class PremierInnCoordinator(DataUpdateCoordinator):
             # Polling interval. Will only be polled if there are subscribers.
             update_interval=timedelta(seconds=300),
         )
-        self.session = session
+        self.client = client
         self.res_no = data[CONF_RES_NO]
         self.arrival_date = data[CONF_ARRIVAL_DATE]
         self.last_name = data[CONF_LAST_NAME]
         self.country = get_country(data)
-
-    async def _async_update_data(self):
-        """Fetch data from API endpoint."""
-
-        def validate_response(body):
-            if not isinstance(body, dict):
-                raise TypeError("Unexpected response format")
+        self.instrumentation: PremierInnInstrumentation | None = hass.data.get(
+            DATA_INSTRUMENTATION
+        )
+        self.basket_reference = basket_reference
+        self.booking: PremierInnBooking | None = None
+        self.last_refreshed: datetime | None = None
+        self._refresh_task: asyncio.Task | None = None
+
+    async def async_refresh_shared(self, cooldown: float = 0) -> None:
+        """Refresh, or join the refresh that is already running.
+
+        Scheduled and on demand refreshes both go through here, so they never
+        overlap. Calls within cooldown seconds of the last refresh share its
+        result too.
+        """
+        task = self._refresh_task
+        if task is None or (
+            task.done()
+            and (
+                self.last_refreshed is None
+                or (dt_util.utcnow() - self.last_refreshed).total_seconds() >= cooldown
+            )
+        ):
+            task = self._refresh_task = self.hass.async_create_task(
+                self.async_refresh(), f"{DOMAIN} refresh {self.res_no}"
+            )
+        await asyncio.shield(task)
+
+    async def async_refresh_debounced(self) -> None:
+        """Refresh on demand, collapsing bursts of requests into one refresh."""
+        await self.async_refresh_shared(REFRESH_COOLDOWN)
+
+    def summary(self) -> dict[str, Any]:
+        """Return the state of the booking in brief."""
+        summary: dict[str, Any] = {
+            "available": bool(self.data) and self.last_update_success,
+            "last_refreshed": self.last_refreshed,
+        }
+        if not self.data or self.booking is None:
+            return summary
+
+        booking_confirmation = self.data[CONF_BOOKING_CONFIRMATION]
+        return {
+            **summary,
+            "hotel": self.data.get(CONF_HOTEL_INFORMATION, {}).get("name"),
+            "check_in": self.booking.check_in,
+            "check_out": self.booking.check_out,
+            "rooms": [room.name for room in self.booking.rooms],
+            "balance_outstanding": booking_confirmation.get("balanceOutstanding"),
+            "total_cost": booking_confirmation.get("totalCost"),
+            "currency": booking_confirmation.get("currencyCode"),
+        }
+
+    @callback
+    def async_use_handoff(self) -> bool:
+        """Seed the coordinator with data the config flow just validated.
+
+        Returns False when there is no fresh handoff for the booking.
+        """
+        handoff = self.hass.data.get(DATA_HANDOFF)
+        if handoff is None or not (data := handoff.async_get(self.res_no)):
+            return False
 
         try:
-            body = {}
-            FIND_BOOKING_POST_BODY[CONF_VARIABLES][CONF_FIND_BOOKING_CRITERIA][
-                CONF_ARRIVALDATE
-            ] = self.arrival_date
-            FIND_BOOKING_POST_BODY[CONF_VARIABLES][CONF_FIND_BOOKING_CRITERIA][
-                CONF_LASTNAME
-            ] = self.last_name
-            FIND_BOOKING_POST_BODY[CONF_VARIABLES][CONF_FIND_BOOKING_CRITERIA][
-                CONF_RESNO
-            ] = self.res_no
-            FIND_BOOKING_POST_BODY[CONF_VARIABLES][CONF_FIND_BOOKING_CRITERIA][
-                CONF_COUNTRY
-            ] = self.country
-
-            find_booking_resp = await self.session.request(
-                method=CONF_POST,
-                url=HOST,
-                json=FIND_BOOKING_POST_BODY,
-                headers=REQUEST_HEADER,
+            self.booking = parse_booking(
+                data, dt_util.get_time_zone(self.hass.config.time_zone)
             )
+        except (KeyError, TypeError, ValueError):
+            return False
+
+        # The config flow fetched the data moments ago.
+        self.last_refreshed = dt_util.utcnow()
+        self.async_set_updated_data(data)
+        return True
+
+    @callback
+    def async_when_ready(
+        self, action: Callable[[], CALLBACK_TYPE | None]
+    ) -> CALLBACK_TYPE:
+        """Run an action once the booking has data.
+
+        Returns a function that stops waiting, or undoes the action.
+        """
+        undo: CALLBACK_TYPE | None = None
+        remove_listener: CALLBACK_TYPE | None = None
+
+        @callback
+        def async_check() -> None:
+            nonlocal undo, remove_listener
+            if not self.data or self.booking is None:
+                return
+            if remove_listener is not None:
+                remove_listener()
+                remove_listener = None
+            undo = action()
+
+        remove_listener = self.async_add_listener(async_check)
+        async_check()
+
+        @callback
+        def async_cancel() -> None:
+            if remove_listener is not None:
+                remove_listener()
+            if undo is not None:
+                undo()
+
+        return async_cancel
 
-            if find_booking_resp.status == 200:
-                find_booking = await find_booking_resp.json()
-
-                validate_response(find_booking)
-
-                BOOKING_CONF_POST_BODY[CONF_VARIABLES][CONF_BASKET_REFERENCE] = (
-                    find_booking.get(
-                        CONF_DATA
-                    )[CONF_FIND_BOOKING][CONF_BASKET_REFERENCE]
+    async def _async_update_data(self):
+        """Fetch data from API endpoint, recording how long it took."""
+        success = False
+        start = time.perf_counter()
+        try:
+            body = await self._async_fetch_data()
+            # Parse every room once, so entities do not walk the payload.
+            try:
+                self.booking = parse_booking(
+                    body, dt_util.get_time_zone(self.hass.config.time_zone)
                 )
-                BOOKING_CONF_POST_BODY[CONF_VARIABLES][CONF_COUNTRY] = self.country
-
-                booking_conf_resp = await self.session.request(
-                    method=CONF_POST,
-                    url=HOST,
-                    json=BOOKING_CONF_POST_BODY,
-                    headers=REQUEST_HEADER,
+            except (KeyError, TypeError, ValueError) as err:
+                raise UpdateFailed(f"Unexpected reservation: {err}") from err
+            success = True
+            self.last_refreshed = dt_util.utcnow()
+            return body
+        finally:
+            if self.instrumentation is not None:
+                self.instrumentation.record_refresh(
+                    self.country, time.perf_counter() - start, success
                 )
 
-                if booking_conf_resp.status == 200:
-                    booking_conf = await booking_conf_resp.json()
+    async def _async_fetch_data(self):
+        """Fetch data from API endpoint."""
 
-                    validate_response(booking_conf)
+        try:
+            # Only request the fields that enabled entities use.
+            fields = async_get_fields(self.hass, self.res_no)
+
+            # A basket found by the lookup is only used once, later refreshes
+            # open their own.
+            basket_reference, self.basket_reference = self.basket_reference, None
+            if basket_reference is None:
+                FIND_BOOKING_POST_BODY[CONF_VARIABLES][CONF_FIND_BOOKING_CRITERIA][
+                    CONF_ARRIVALDATE
+                ] = self.arrival_date
+                FIND_BOOKING_POST_BODY[CONF_VARIABLES][CONF_FIND_BOOKING_CRITERIA][
+                    CONF_LASTNAME
+                ] = self.last_name
+                FIND_BOOKING_POST_BODY[CONF_VARIABLES][CONF_FIND_BOOKING_CRITERIA][
+                    CONF_RESNO
+                ] = self.res_no
+                FIND_BOOKING_POST_BODY[CONF_VARIABLES][CONF_FIND_BOOKING_CRITERIA][
+                    CONF_COUNTRY
+                ] = self.country
+
+                find_booking = await self.client.async_post(
+                    CONF_FIND_BOOKING, self.country, FIND_BOOKING_POST_BODY
+                )
+                basket_reference = parse_response(CONF_FIND_BOOKING, find_booking)[
+                    CONF_BASKET_REFERENCE
+                ]
 
-                    booking_confirmation = booking_conf.get(CONF_DATA)[
-                        CONF_BOOKING_CONFIRMATION
-                    ]
-                    body[CONF_BOOKING_CONFIRMATION] = booking_confirmation
+            BOOKING_CONF_POST_BODY[CONF_VARIABLES][CONF_BASKET_REFERENCE] = (
+                basket_reference
+            )
+            BOOKING_CONF_POST_BODY[CONF_VARIABLES][CONF_COUNTRY] = self.country
+
+            booking_conf = await self.client.async_post(
+                CONF_BOOKING_CONFIRMATION,
+                self.country,
+                {
+                    **BOOKING_CONF_POST_BODY,
+                    "query": compose_query(
+                        CONF_BOOKING_CONFIRMATION,
+                        fields[CONF_BOOKING_CONFIRMATION],
+                    ),
+                },
+            )
+            booking_confirmation = parse_response(
+                CONF_BOOKING_CONFIRMATION, booking_conf
+            )
 
-                    HOTEL_INFORMATION_POST_BODY[CONF_VARIABLES][CONF_HOTEL_ID] = (
-                        booking_confirmation[CONF_HOTEL_ID]
-                    )
-                    HOTEL_INFORMATION_POST_BODY[CONF_VARIABLES][CONF_COUNTRY] = (
-                        self.country
-                    )
+            # Known hotels are served from the catalogue.
+            hotel_id = booking_confirmation[CONF_HOTEL_ID]
+            fields = async_get_fields(self.hass, self.res_no, hotel_id)
+            catalogue = self.hass.data.get(DATA_CATALOGUE)
+            hotel_information = (
+                catalogue.get(hotel_id, CATALOGUE_MAX_AGE)
+                if catalogue is not None
+                else None
+            )
 
-                    hotel_info_resp = await self.session.request(
-                        method=CONF_POST,
-                        url=HOST,
-                        json=HOTEL_INFORMATION_POST_BODY,
-                        headers=REQUEST_HEADER,
+            if hotel_information is not None and top_level(
+                fields[CONF_HOTEL_INFORMATION], CONF_HOTEL_INFORMATION
+            ).issubset(hotel_information):
+                if self.instrumentation is not None:
+                    self.instrumentation.record_cache_hit(
+                        CONF_HOTEL_INFORMATION, self.country
                     )
+            else:
+                HOTEL_INFORMATION_POST_BODY[CONF_VARIABLES][CONF_HOTEL_ID] = hotel_id
+                HOTEL_INFORMATION_POST_BODY[CONF_VARIABLES][CONF_COUNTRY] = self.country
+
+                hotel_info = await self.client.async_post(
+                    CONF_HOTEL_INFORMATION,
+                    self.country,
+                    {
+                        **HOTEL_INFORMATION_POST_BODY,
+                        "query": compose_query(
+                            CONF_HOTEL_INFORMATION,
+                            fields[CONF_HOTEL_INFORMATION],
+                        ),
+                    },
+                )
+                hotel_information = parse_response(CONF_HOTEL_INFORMATION, hotel_info)
 
-                    if hotel_info_resp.status == 200:
-                        hotel_info = await hotel_info_resp.json()
-
-                        validate_response(hotel_info)
+                if catalogue is not None:
+                    catalogue.async_add(hotel_information)
 
-                        hotel_information = hotel_info.get(CONF_DATA)[
-                            CONF_HOTEL_INFORMATION
-                        ]
-                        body[CONF_HOTEL_INFORMATION] = hotel_information
+            # Both parts are always present, or the update fails as a whole.
+            body = {
+                CONF_BOOKING_CONFIRMATION: booking_confirmation,
+                CONF_HOTEL_INFORMATION: hotel_information,
+            }
 
         except InvalidAuth as err:
-            raise ConfigEntryAuthFailed from err
+            # There are no credentials to ask for again, so this is no reauth.
+            raise UpdateFailed(f"Refused: {err}") from err
+        except APIRatelimitExceeded as err:
+            raise UpdateFailed(f"Rate limited: {err}") from err
+        except InvalidResponse as err:
+            _LOGGER.debug("Invalid response for %s: %s", self.res_no, err)
+            raise UpdateFailed(f"Unexpected response: {err}") from err
         except PremierInnError as err:
             raise UpdateFailed(str(err)) from err
         except ValueError as err:
@@ -165,19 +335,3 @@ class PremierInnCoordinator(DataUpdateCoordinator):
             raise UnknownError from err
         else:
             return body
-
-
-class PremierInnError(HomeAssistantError):
-    """Base error."""
-
-
-class InvalidAuth(PremierInnError):
-    """Raised when invalid authentication credentials are provided."""
-
-
-class APIRatelimitExceeded(PremierInnError):
-    """Raised when the API rate limit is exceeded."""
-
-
-class UnknownError(PremierInnError):
-    """Raised when an unknown error occurs."""
@@ -0,0 +1,33 @@
+"""Diagnostics support for Premier Inn."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import (
+    CONF_LAST_NAME,
+    CONF_RES_NO,
+    DATA_INSTRUMENTATION,
+    DATA_PRICES,
+    DATA_PROXIMITY,
+)
+
+# The title and unique id of an entry are its booking reference.
+TO_REDACT = {CONF_LAST_NAME, CONF_RES_NO, "title", "unique_id"}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    return {
+        "entry": async_redact_data(entry.as_dict(), TO_REDACT),
+        "requests": hass.data[DATA_INSTRUMENTATION].snapshot(),
+        "functions": hass.data[DATA_INSTRUMENTATION].function_timings(),
+        "price_history": hass.data[DATA_PRICES].changes(entry.data[CONF_RES_NO]),
+        "distances": hass.data[DATA_PROXIMITY].distances(entry.entry_id),
+    }
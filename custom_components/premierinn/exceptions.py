@@ -0,0 +1,27 @@
+"""Premier Inn exceptions."""
+
+from homeassistant.exceptions import HomeAssistantError
+
+
+class PremierInnError(HomeAssistantError):
+    """Base error."""
+
+
+class InvalidAuth(PremierInnError):
+    """Raised when invalid authentication credentials are provided."""
+
+
+class CannotConnect(PremierInnError):
+    """Raised when the API cannot be reached or answers with an error status."""
+
+
+class APIRatelimitExceeded(PremierInnError):
+    """Raised when the API rate limit is exceeded."""
+
+
+class InvalidResponse(PremierInnError):
+    """Raised when a response does not have the expected shape."""
+
+
+class UnknownError(PremierInnError):
+    """Raised when an unknown error occurs."""
@@ -0,0 +1,209 @@
+"""Premier Inn iCalendar feed."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator
+from datetime import datetime
+import hashlib
+import logging
+
+from aiohttp import hdrs, web
+
+from homeassistant.components.http import HomeAssistantView
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.util import dt as dt_util
+
+from .calendar import booking_events, generate_uuid_from_json
+from .const import DOMAIN, FEED_URL
+from .coordinator import PremierInnCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+CALENDAR_HEADER = (
+    "BEGIN:VCALENDAR\r\n"
+    "VERSION:2.0\r\n"
+    f"PRODID:-//{DOMAIN}//Premier Inn bookings//EN\r\n"
+    "CALSCALE:GREGORIAN\r\n"
+    "METHOD:PUBLISH\r\n"
+    "X-WR-CALNAME:Premier Inn\r\n"
+)
+CALENDAR_FOOTER = "END:VCALENDAR\r\n"
+
+
+def escape_text(value: str) -> str:
+    """Escape a TEXT value as described in RFC 5545."""
+    return (
+        value.replace("\\", "\\\\")
+        .replace(";", "\\;")
+        .replace(",", "\\,")
+        .replace("\r\n", "\\n")
+        .replace("\n", "\\n")
+    )
+
+
+def fold_line(line: str) -> str:
+    """Fold a content line at 75 octets."""
+    encoded = line.encode("utf-8")
+    if len(encoded) <= 75:
+        return f"{line}\r\n"
+
+    parts = []
+    current = ""
+    limit = 75
+    for char in line:
+        if len((current + char).encode("utf-8")) > limit:
+            parts.append(current)
+            current = ""
+            # Continuation lines lose one octet to the leading space.
+            limit = 74
+        current += char
+    parts.append(current)
+    return "\r\n ".join(parts) + "\r\n"
+
+
+def format_datetime(value: datetime) -> str:
+    """Format a datetime as an iCalendar UTC date-time."""
+    return dt_util.as_utc(value).strftime("%Y%m%dT%H%M%SZ")
+
+
+def iter_chunks(components: Iterable[str]) -> Iterator[str]:
+    """Yield a feed one booking at a time."""
+    yield CALENDAR_HEADER
+    yield from components
+    yield CALENDAR_FOOTER
+
+
+class PremierInnCalendarFeed:
+    """Keep a pre-rendered iCalendar component per booking."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize."""
+        self.hass = hass
+        self._snapshot: tuple[str, tuple[str, ...]] = ("", ())
+        self._sources: dict[str, tuple[PremierInnCoordinator, str]] = {}
+        self._fingerprints: dict[str, str] = {}
+        self._components: dict[str, str] = {}
+        self._update_etag()
+
+    @callback
+    def async_add_booking(
+        self, entry_id: str, coordinator: PremierInnCoordinator, name: str
+    ) -> CALLBACK_TYPE:
+        """Add a booking to the feed and follow its coordinator."""
+        self._sources[entry_id] = (coordinator, name)
+        self._async_update_booking(entry_id)
+
+        remove_listener = coordinator.async_add_listener(
+            lambda: self._async_update_booking(entry_id)
+        )
+
+        @callback
+        def async_remove_booking() -> None:
+            remove_listener()
+            self._sources.pop(entry_id, None)
+            self._fingerprints.pop(entry_id, None)
+            if self._components.pop(entry_id, None) is not None:
+                self._update_etag()
+
+        return async_remove_booking
+
+    @callback
+    def _async_update_booking(self, entry_id: str) -> None:
+        """Re-render a booking only when its data has changed."""
+        coordinator, name = self._sources[entry_id]
+        if not coordinator.data:
+            return
+
+        fingerprint = generate_uuid_from_json(coordinator.data)
+        if self._fingerprints.get(entry_id) == fingerprint:
+            return
+
+        try:
+            component = self._render_booking(entry_id, coordinator, name)
+        except (KeyError, IndexError, TypeError, ValueError) as err:
+            _LOGGER.warning("Unable to add booking %s to feed: %s", name, err)
+            return
+
+        self._fingerprints[entry_id] = fingerprint
+        self._components[entry_id] = component
+        self._update_etag()
+
+    def _render_booking(
+        self, entry_id: str, coordinator: PremierInnCoordinator, name: str
+    ) -> str:
+        """Render the VEVENT components for a booking."""
+        events = booking_events(coordinator, datetime.min)
+        stamp = format_datetime(dt_util.utcnow())
+
+        lines = []
+        for index, event in enumerate(events):
+            lines.extend(
+                [
+                    "BEGIN:VEVENT\r\n",
+                    fold_line(f"UID:{entry_id}-{index}@{DOMAIN}"),
+                    f"DTSTAMP:{stamp}\r\n",
+                    f"DTSTART:{format_datetime(event.start)}\r\n",
+                    f"DTEND:{format_datetime(event.end)}\r\n",
+                    fold_line(f"SUMMARY:{escape_text(event.summary)}"),
+                    fold_line(f"LOCATION:{escape_text(f'{event.location}')}"),
+                    fold_line(f"DESCRIPTION:{escape_text(f'{event.description}')}"),
+                    "END:VEVENT\r\n",
+                ]
+            )
+        return "".join(lines)
+
+    def _update_etag(self) -> None:
+        """Derive the ETag from the fingerprints of every booking.
+
+        The components are captured with it, so a response always matches
+        the ETag it was sent with, however the bookings change meanwhile.
+        """
+        digest = hashlib.sha1(usedforsecurity=False)
+        entry_ids = sorted(self._components)
+        for entry_id in entry_ids:
+            digest.update(f"{entry_id}:{self._fingerprints[entry_id]};".encode())
+        self._snapshot = (
+            f'"{digest.hexdigest()}"',
+            tuple(self._components[entry_id] for entry_id in entry_ids),
+        )
+
+    @property
+    def etag(self) -> str:
+        """Return the ETag of the current feed."""
+        return self._snapshot[0]
+
+    def snapshot(self) -> tuple[str, tuple[str, ...]]:
+        """Return the ETag together with the components it describes."""
+        return self._snapshot
+
+
+class PremierInnCalendarFeedView(HomeAssistantView):
+    """Serve all bookings as a single iCalendar feed."""
+
+    url = FEED_URL
+    name = f"api:{DOMAIN}:calendar"
+
+    def __init__(self, feed: PremierInnCalendarFeed) -> None:
+        """Initialize."""
+        self.feed = feed
+
+    async def get(self, request: web.Request) -> web.StreamResponse:
+        """Stream the feed, or confirm the client's copy is current."""
+        etag, components = self.feed.snapshot()
+
+        if_none_match = request.headers.get(hdrs.IF_NONE_MATCH, "")
+        if etag in (tag.strip() for tag in if_none_match.split(",")):
+            return web.Response(status=304, headers={hdrs.ETAG: etag})
+
+        response = web.StreamResponse(
+            headers={
+                hdrs.CONTENT_TYPE: "text/calendar; charset=utf-8",
+                hdrs.ETAG: etag,
+                hdrs.CACHE_CONTROL: "no-cache",
+            }
+        )
+        await response.prepare(request)
+        for chunk in iter_chunks(components):
+            await response.write(chunk.encode("utf-8"))
+        await response.write_eof()
+        return response
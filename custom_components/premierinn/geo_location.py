@@ -8,19 +8,23 @@ from bs4 import BeautifulSoup
 from homeassistant.components.geo_location import GeolocationEvent
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import ATTR_LATITUDE, ATTR_LONGITUDE
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
-from homeassistant.helpers.entity import DeviceInfo
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity, UpdateFailed
+from homeassistant.util import slugify
 
 from .const import (
     CONF_BOOKING_CONFIRMATION,
+    CONF_HOTEL_ID,
     CONF_HOTEL_INFORMATION,
     CONF_RES_NO,
+    DATA_COORDINATORS,
+    DATA_HOTELS,
+    DATA_NOTICES,
     DOMAIN,
 )
 from .coordinator import PremierInnCoordinator
+from .instrumentation import timed
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -35,100 +39,268 @@ async def async_setup_entry(
     if entry.options:
         config.update(entry.options)
 
-    session = async_get_clientsession(hass)
-    coordinator = PremierInnCoordinator(hass, session, entry.data)
+    coordinator: PremierInnCoordinator = hass.data[DATA_COORDINATORS][entry.entry_id]
+    name = entry.data[CONF_RES_NO]
 
-    await coordinator.async_refresh()
+    @callback
+    def async_booking_ready() -> CALLBACK_TYPE:
+        """Put the hotel on the map once the booking has data."""
+        # Bookings at the same hotel share a single geolocation entity.
+        return hass.data[DATA_HOTELS].async_add_booking(
+            entry.entry_id, coordinator, name, async_add_entities
+        )
 
-    name = entry.data[CONF_RES_NO]
+    entry.async_on_unload(coordinator.async_when_ready(async_booking_ready))
+
+
+@callback
+def async_migrate_entries(hass: HomeAssistant, hotel_info: dict[str, Any]) -> None:
+    """Move the entity of a hotel from its name to its id as unique id.
+
+    Older versions identified the entity by the hotel name, which changes
+    with the hotel's branding.
+    """
+    registry = er.async_get(hass)
+    old_unique_id = f"{DOMAIN}-{hotel_info['name']}".lower()
+    new_unique_id = f"{DOMAIN}-{hotel_info[CONF_HOTEL_ID]}".lower()
+    if (
+        old_unique_id == new_unique_id
+        or (
+            entity_id := registry.async_get_entity_id(
+                "geo_location", DOMAIN, old_unique_id
+            )
+        )
+        is None
+    ):
+        return
+
+    if registry.async_get_entity_id("geo_location", DOMAIN, new_unique_id) is None:
+        registry.async_update_entity(entity_id, new_unique_id=new_unique_id)
+    else:
+        registry.async_remove(entity_id)
+
+
+class PremierInnHotelRegistry:
+    """Track one geolocation entity per hotel and the bookings that use it."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize."""
+        self.hass = hass
+        self._entities: dict[str, PremierInnGeolocationEvent] = {}
+        self._owners: dict[str, str] = {}
+        self._bookings: dict[str, dict[str, str]] = {}
+        self._hotel_ids: dict[str, str] = {}
+        self._add_entities: dict[str, AddEntitiesCallback] = {}
+
+    @callback
+    def async_add_booking(
+        self,
+        entry_id: str,
+        coordinator: PremierInnCoordinator,
+        name: str,
+        async_add_entities: AddEntitiesCallback,
+    ) -> CALLBACK_TYPE:
+        """Reference the hotel of a booking, creating its entity if needed."""
+        self._add_entities[entry_id] = async_add_entities
+        self._async_reference(entry_id, coordinator, name)
+
+        remove_listener = coordinator.async_add_listener(
+            lambda: self._async_coordinator_updated(entry_id, coordinator, name)
+        )
+
+        @callback
+        def async_remove_booking() -> None:
+            remove_listener()
+            self._async_release(entry_id, unloading=True)
+            self._add_entities.pop(entry_id, None)
+            # The platform removed every entity it owned, including those of
+            # hotels the booking moved away from.
+            for hotel_id in [
+                hotel_id
+                for hotel_id, owner in self._owners.items()
+                if owner == entry_id
+            ]:
+                self._async_rehome(hotel_id)
+
+        return async_remove_booking
+
+    @callback
+    def _async_reference(
+        self, entry_id: str, coordinator: PremierInnCoordinator, name: str
+    ) -> None:
+        """Add a booking to the bookings of its current hotel."""
+        hotel_info = coordinator.data[CONF_HOTEL_INFORMATION]
+        hotel_id = hotel_info[CONF_HOTEL_ID]
+        booking_reference = coordinator.data[CONF_BOOKING_CONFIRMATION].get(
+            "bookingReference", name.upper()
+        )
+
+        self._hotel_ids[entry_id] = hotel_id
+        bookings = self._bookings.setdefault(hotel_id, {})
+        bookings[entry_id] = booking_reference
+
+        if hotel_id not in self._entities:
+            async_migrate_entries(self.hass, hotel_info)
+            self._async_create_entity(hotel_id, hotel_info, entry_id)
+        else:
+            self._entities[hotel_id].async_update_hotel(hotel_info, force=True)
+        self._async_update_notices(hotel_info)
+
+    @callback
+    def _async_create_entity(
+        self, hotel_id: str, hotel_info: dict[str, Any], entry_id: str
+    ) -> None:
+        """Create the hotel entity on the platform of the given booking."""
+        entity = PremierInnGeolocationEvent(
+            hotel_id, hotel_info, self._bookings[hotel_id]
+        )
+        self._entities[hotel_id] = entity
+        self._owners[hotel_id] = entry_id
+        self._add_entities[entry_id]([entity])
+
+    @callback
+    def _async_coordinator_updated(
+        self, entry_id: str, coordinator: PremierInnCoordinator, name: str
+    ) -> None:
+        """Pass fresh hotel information on to the shared entity."""
+        if not coordinator.data:
+            return
+
+        hotel_info = coordinator.data[CONF_HOTEL_INFORMATION]
+        if hotel_info[CONF_HOTEL_ID] != self._hotel_ids.get(entry_id):
+            # The booking was moved to another hotel.
+            self._async_release(entry_id, unloading=False)
+            self._async_reference(entry_id, coordinator, name)
+        elif entity := self._entities.get(hotel_info[CONF_HOTEL_ID]):
+            entity.async_update_hotel(hotel_info)
+            self._async_update_notices(hotel_info)
+
+    @callback
+    def _async_update_notices(self, hotel_info: dict[str, Any]) -> None:
+        """Announce the hotel's new important information."""
+        if (notices := self.hass.data.get(DATA_NOTICES)) is not None:
+            notices.async_update_hotel(hotel_info)
+
+    @callback
+    def _async_release(self, entry_id: str, unloading: bool) -> None:
+        """Drop a booking's reference to its hotel."""
+        if (hotel_id := self._hotel_ids.pop(entry_id, None)) is None:
+            return
+        bookings = self._bookings.get(hotel_id, {})
+        bookings.pop(entry_id, None)
+        if (entity := self._entities.get(hotel_id)) is None:
+            return
 
-    sensors = [PremierInnGeolocationEvent(coordinator, name)]
-    async_add_entities(sensors, update_before_add=True)
+        owned = self._owners.get(hotel_id) == entry_id
+        if bookings:
+            # An unloaded owner hands the hotel on once released.
+            if not (unloading and owned):
+                entity.async_update_hotel(entity.hotel_info, force=True)
+            return
 
+        self._bookings.pop(hotel_id, None)
+        self._entities.pop(hotel_id, None)
+        self._owners.pop(hotel_id, None)
+        # An unloading owner's platform removes the entity itself.
+        if not (unloading and owned) and entity.hass is not None:
+            self.hass.async_create_task(entity.async_remove())
 
-class PremierInnGeolocationEvent(
-    CoordinatorEntity[PremierInnCoordinator], GeolocationEvent
-):
+    @callback
+    def _async_rehome(self, hotel_id: str) -> None:
+        """Hand a hotel whose owning platform was unloaded to another booking."""
+        entity = self._entities.pop(hotel_id)
+        self._owners.pop(hotel_id, None)
+        if not (bookings := self._bookings.get(hotel_id)):
+            self._bookings.pop(hotel_id, None)
+        elif not self.hass.is_stopping:
+            self._async_create_entity(hotel_id, entity.hotel_info, next(iter(bookings)))
+
+
+class PremierInnGeolocationEvent(GeolocationEvent):
     """Representation of a geolocation entity."""
 
     _attr_should_poll = False
     _attr_source = DOMAIN
+    _attr_icon = "mdi:home-modern"
 
     def __init__(
         self,
-        coordinator: PremierInnCoordinator,
-        name: str,
+        hotel_id: str,
+        hotel_info: dict[str, Any],
+        bookings: dict[str, str],
     ) -> None:
         """Initialize."""
-        super().__init__(coordinator)
-        self.data = coordinator.data
-        self.booking_confirmation = self.data.get(CONF_BOOKING_CONFIRMATION)
-        self.hotel_info = self.data.get(CONF_HOTEL_INFORMATION)
-        self.hotel_name = self.hotel_info["name"]
-        self.hotel_coordinates = self.hotel_info["coordinates"]
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, f"{name}")},
-            manufacturer="Premier Inn",
-            model=self.hotel_name,
-            name=name.upper(),
-            configuration_url="https://github.com/jampez77/PremierInn/",
-        )
-        self._attr_unique_id = f"{DOMAIN}-{self.hotel_name}".lower()
-        self.entity_id = f"geo_location.{DOMAIN}_{self.hotel_name}".lower()
+        self.hotel_id = hotel_id
+        self.bookings = bookings
+        self.hotel_info: dict[str, Any] = {}
         self.attrs: dict[str, Any] = {}
-        self._attr_name = "Premier Inn - " + self.hotel_name
-        self._attr_latitude = self.hotel_coordinates[ATTR_LATITUDE]
-        self._attr_longitude = self.hotel_coordinates[ATTR_LONGITUDE]
+        self._attr_unique_id = f"{DOMAIN}-{hotel_id}".lower()
+        self.entity_id = f"geo_location.{DOMAIN}_{slugify(hotel_info['name'])}"
         self._attr_accuracy = None
-        self.formatted_address = [
+        self.set_hotel_info(hotel_info)
+
+    @timed
+    def set_hotel_info(self, hotel_info: dict[str, Any]) -> None:
+        """Derive state and attributes from the hotel information."""
+        self.hotel_info = hotel_info
+        hotel_coordinates = hotel_info["coordinates"]
+        self._attr_name = "Premier Inn - " + hotel_info["name"]
+        self._attr_latitude = hotel_coordinates[ATTR_LATITUDE]
+        self._attr_longitude = hotel_coordinates[ATTR_LONGITUDE]
+
+        formatted_address = [
             value
-            for key, value in self.hotel_info["address"].items()
+            for key, value in hotel_info["address"].items()
             if value and value not in {"None", ""} and key != "country"
         ]
-
-    @property
-    def state(self) -> str | None:
-        """Return the state of the entity."""
-        return ", ".join(self.formatted_address)
-
-    @property
-    def icon(self) -> str:
-        """Return a representative icon of the hotel."""
-        return "mdi:home-modern"
-
-    async def async_update(self) -> None:
-        """Fetch new state data for the entity."""
-        try:
-            self._attr_latitude = self.hotel_coordinates["latitude"]
-            self._attr_longitude = self.hotel_coordinates["longitude"]
-        except Exception as e:
-            _LOGGER.error("Error updating geolocation: %s", e)
-            raise UpdateFailed("Failed to update location data") from e
-
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return additional state attributes."""
-
         formatted_contact = [
             value
-            for key, value in self.hotel_info["contactDetails"].items()
+            for key, value in (hotel_info.get("contactDetails") or {}).items()
             if value and value not in {"None", ""}
         ]
 
         parkingSoup = BeautifulSoup(
-            self.hotel_info.get("parkingDescription", "Not provided"), "html.parser"
+            hotel_info.get("parkingDescription") or "Not provided", "html.parser"
         )
-        parking = parkingSoup.get_text()
-
         directionsSoup = BeautifulSoup(
-            self.hotel_info.get("directions", "Not provided"), "html.parser"
+            hotel_info.get("directions") or "Not provided", "html.parser"
         )
-        directions = directionsSoup.get_text()
 
-        return {
-            "Booking Reference": self.booking_confirmation["bookingReference"],
-            "Parking": parking,
-            "Directions": directions,
-            "Address": ", ".join(self.formatted_address),
+        self._attr_state = ", ".join(formatted_address)
+        self.attrs = {
+            "Parking": parkingSoup.get_text(),
+            "Directions": directionsSoup.get_text(),
+            "Address": ", ".join(formatted_address),
             "Contact": ", ".join(formatted_contact),
         }
+
+    @callback
+    def async_update_hotel(
+        self, hotel_info: dict[str, Any], force: bool = False
+    ) -> None:
+        """Write state when the hotel information or its bookings change."""
+        if hotel_info != self.hotel_info:
+            try:
+                self.set_hotel_info(hotel_info)
+            except (KeyError, TypeError) as e:
+                _LOGGER.error("Error updating geolocation: %s", e)
+                return
+        elif not force:
+            return
+
+        if self.hass is not None:
+            self.async_write_ha_state()
+
+    @property
+    def state(self) -> str | None:
+        """Return the state of the entity."""
+        return self._attr_state
+
+    @property
+    @timed
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return additional state attributes."""
+        return {
+            "Bookings": list(self.bookings.values()),
+            **self.attrs,
+        }
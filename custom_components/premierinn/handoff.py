@@ -0,0 +1,46 @@
+"""Premier Inn config flow handoff."""
+
+from __future__ import annotations
+
+import time
+from typing import Any
+
+from homeassistant.core import callback
+
+from .const import HANDOFF_TTL
+
+
+class PremierInnHandoff:
+    """Hold booking data validated by a config flow until the entry is set up.
+
+    The entry's coordinator is seeded from the data once, so the first
+    refresh happens on the scheduler's timetable instead. Later setups of the
+    entry, such as reloads, fetch their own data.
+    """
+
+    def __init__(self, ttl: float = HANDOFF_TTL) -> None:
+        """Initialize."""
+        self.ttl = ttl
+        self._data: dict[str, tuple[float, dict[str, Any]]] = {}
+
+    @callback
+    def async_put(self, res_no: str, data: dict[str, Any]) -> None:
+        """Keep the validated data of a booking."""
+        self._purge()
+        self._data[res_no] = (time.monotonic() + self.ttl, data)
+
+    @callback
+    def async_get(self, res_no: str) -> dict[str, Any] | None:
+        """Take the validated data of a booking, if still fresh."""
+        self._purge()
+        if (item := self._data.pop(res_no, None)) is None:
+            return None
+        return item[1]
+
+    def _purge(self) -> None:
+        """Drop data that has outlived the handoff."""
+        now = time.monotonic()
+        for res_no in [
+            key for key, (expires, _) in self._data.items() if expires < now
+        ]:
+            del self._data[res_no]
@@ -0,0 +1,260 @@
+"""Premier Inn API instrumentation."""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+from collections.abc import Callable
+from dataclasses import dataclass, field
+import functools
+import inspect
+import time
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+
+from .const import DATA_INSTRUMENTATION, INSTRUMENTATION_BUCKETS
+
+
+@dataclass
+class OperationStats:
+    """Counters and latency histogram of one GraphQL operation."""
+
+    requests: int = 0
+    errors: int = 0
+    retries: int = 0
+    hedges: int = 0
+    cache_hits: int = 0
+    bytes: int = 0
+    latency_sum: float = 0.0
+    statuses: dict[int, int] = field(default_factory=dict)
+    buckets: list[int] = field(
+        default_factory=lambda: [0] * (len(INSTRUMENTATION_BUCKETS) + 1)
+    )
+
+    def observe(self, status: int, latency: float, size: int) -> None:
+        """Record a completed request."""
+        self.requests += 1
+        if status != 200:
+            self.errors += 1
+        self.bytes += size
+        self.latency_sum += latency
+        self.statuses[status] = self.statuses.get(status, 0) + 1
+        self.buckets[bisect_left(INSTRUMENTATION_BUCKETS, latency)] += 1
+
+    def merge(self, other: OperationStats) -> None:
+        """Add the counters of another operation."""
+        self.requests += other.requests
+        self.errors += other.errors
+        self.retries += other.retries
+        self.hedges += other.hedges
+        self.cache_hits += other.cache_hits
+        self.bytes += other.bytes
+        self.latency_sum += other.latency_sum
+        for status, count in other.statuses.items():
+            self.statuses[status] = self.statuses.get(status, 0) + count
+        self.buckets = [a + b for a, b in zip(self.buckets, other.buckets)]
+
+    def quantile(self, quantile: float) -> float | None:
+        """Estimate a latency quantile from the histogram, in seconds."""
+        if not self.requests:
+            return None
+        target = quantile * self.requests
+        cumulative = 0
+        for bound, count in zip(INSTRUMENTATION_BUCKETS, self.buckets):
+            cumulative += count
+            if cumulative >= target:
+                return bound
+        return None
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the counters as a serializable dict."""
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "retries": self.retries,
+            "hedges": self.hedges,
+            "cache_hits": self.cache_hits,
+            "bytes": self.bytes,
+            "latency_sum": round(self.latency_sum, 4),
+            "latency_mean": (
+                round(self.latency_sum / self.requests, 4) if self.requests else None
+            ),
+            "latency_p50": self.quantile(0.5),
+            "latency_p95": self.quantile(0.95),
+            "statuses": dict(self.statuses),
+            "histogram": dict(
+                zip([*map(str, INSTRUMENTATION_BUCKETS), "+Inf"], self.buckets)
+            ),
+        }
+
+
+@dataclass
+class RefreshStats:
+    """Counters and duration histogram of coordinator refreshes."""
+
+    refreshes: int = 0
+    failures: int = 0
+    duration_sum: float = 0.0
+    buckets: list[int] = field(
+        default_factory=lambda: [0] * (len(INSTRUMENTATION_BUCKETS) + 1)
+    )
+
+    def observe(self, duration: float, success: bool) -> None:
+        """Record a completed refresh."""
+        self.refreshes += 1
+        if not success:
+            self.failures += 1
+        self.duration_sum += duration
+        self.buckets[bisect_left(INSTRUMENTATION_BUCKETS, duration)] += 1
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the counters as a serializable dict."""
+        return {
+            "refreshes": self.refreshes,
+            "failures": self.failures,
+            "duration_sum": round(self.duration_sum, 4),
+            "histogram": dict(
+                zip([*map(str, INSTRUMENTATION_BUCKETS), "+Inf"], self.buckets)
+            ),
+        }
+
+
+@dataclass
+class FunctionStats:
+    """Call counter and timings of one instrumented function."""
+
+    calls: int = 0
+    time_sum: float = 0.0
+    time_max: float = 0.0
+
+    def observe(self, duration: float) -> None:
+        """Record a completed call."""
+        self.calls += 1
+        self.time_sum += duration
+        self.time_max = max(self.time_max, duration)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the counters as a serializable dict."""
+        return {
+            "calls": self.calls,
+            "time_sum": round(self.time_sum, 6),
+            "time_mean": round(self.time_sum / self.calls, 6) if self.calls else None,
+            "time_max": round(self.time_max, 6),
+        }
+
+
+def _get_instrumentation(args: tuple[Any, ...]) -> PremierInnInstrumentation | None:
+    """Return the instrumentation of the hass passed to or owning a function."""
+    owner = args[0] if args else None
+    hass = owner if isinstance(owner, HomeAssistant) else getattr(owner, "hass", None)
+    if hass is None:
+        return None
+    return hass.data.get(DATA_INSTRUMENTATION)
+
+
+def timed(func: Callable) -> Callable:
+    """Count the calls and time spent in a method or a function taking hass.
+
+    Coroutines are timed from start to finish, including the time they spend
+    waiting.
+    """
+    name = func.__qualname__
+
+    if inspect.iscoroutinefunction(func):
+
+        @functools.wraps(func)
+        async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+            start = time.perf_counter()
+            try:
+                return await func(*args, **kwargs)
+            finally:
+                if (instrumentation := _get_instrumentation(args)) is not None:
+                    instrumentation.record_call(name, time.perf_counter() - start)
+
+        return async_wrapper
+
+    @functools.wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            if (instrumentation := _get_instrumentation(args)) is not None:
+                instrumentation.record_call(name, time.perf_counter() - start)
+
+    return wrapper
+
+
+class PremierInnInstrumentation:
+    """Collect request statistics per operation and country."""
+
+    def __init__(self) -> None:
+        """Initialize."""
+        self.stats: dict[tuple[str, str], OperationStats] = {}
+        self.refreshes: dict[str, RefreshStats] = {}
+        self.calendar: dict[tuple[str, bool], int] = {}
+        self.functions: dict[str, FunctionStats] = {}
+
+    def _get(self, operation: str, country: str) -> OperationStats:
+        """Return the statistics of an operation, creating them if needed."""
+        if (stats := self.stats.get((operation, country))) is None:
+            stats = self.stats[(operation, country)] = OperationStats()
+        return stats
+
+    def record_request(
+        self, operation: str, country: str, status: int, latency: float, size: int
+    ) -> None:
+        """Record a completed request."""
+        self._get(operation, country).observe(status, latency, size)
+
+    def record_retry(self, operation: str, country: str) -> None:
+        """Record a retried request."""
+        self._get(operation, country).retries += 1
+
+    def record_hedge(self, operation: str, country: str) -> None:
+        """Record a hedged request sent alongside a slow one."""
+        self._get(operation, country).hedges += 1
+
+    def record_cache_hit(self, operation: str, country: str) -> None:
+        """Record a request that was served without calling the API."""
+        self._get(operation, country).cache_hits += 1
+
+    def record_refresh(self, country: str, duration: float, success: bool) -> None:
+        """Record a completed coordinator refresh."""
+        if (stats := self.refreshes.get(country)) is None:
+            stats = self.refreshes[country] = RefreshStats()
+        stats.observe(duration, success)
+
+    def record_calendar(self, operation: str, success: bool) -> None:
+        """Record a calendar service call."""
+        key = (operation, success)
+        self.calendar[key] = self.calendar.get(key, 0) + 1
+
+    def record_call(self, name: str, duration: float) -> None:
+        """Record a completed call of an instrumented function."""
+        if (stats := self.functions.get(name)) is None:
+            stats = self.functions[name] = FunctionStats()
+        stats.observe(duration)
+
+    def function_timings(self) -> dict[str, dict[str, Any]]:
+        """Return the timings of each instrumented function, slowest first."""
+        return {
+            name: stats.as_dict()
+            for name, stats in sorted(
+                self.functions.items(), key=lambda item: -item[1].time_sum
+            )
+        }
+
+    def snapshot(self) -> dict[str, dict[str, dict[str, Any]]]:
+        """Return the statistics per operation and country."""
+        data: dict[str, dict[str, dict[str, Any]]] = {}
+        for (operation, country), stats in sorted(self.stats.items()):
+            data.setdefault(operation, {})[country] = stats.as_dict()
+        return data
+
+    def summary(self) -> dict[str, OperationStats]:
+        """Return the statistics per operation across countries."""
+        totals: dict[str, OperationStats] = {}
+        for (operation, _), stats in self.stats.items():
+            totals.setdefault(operation, OperationStats()).merge(stats)
+        return totals
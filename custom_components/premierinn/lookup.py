@@ -0,0 +1,141 @@
+"""Premier Inn booking lookup."""
+
+from __future__ import annotations
+
+import asyncio
+import copy
+from datetime import date, timedelta
+import logging
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+
+from .api import PremierInnApiClient, async_get_api_client
+from .const import (
+    CONF_ARRIVAL_DATE,
+    CONF_ARRIVALDATE,
+    CONF_BASKET_REFERENCE,
+    CONF_COUNTRY,
+    CONF_FIND_BOOKING,
+    CONF_FIND_BOOKING_CRITERIA,
+    CONF_LAST_NAME,
+    CONF_LASTNAME,
+    CONF_RES_NO,
+    CONF_RESNO,
+    CONF_VARIABLES,
+    COUNTRIES,
+    DATA_LOOKUP,
+    FIND_BOOKING_POST_BODY,
+    LOOKUP_CONCURRENCY,
+    LOOKUP_MAX_PROBES,
+)
+from .exceptions import APIRatelimitExceeded, PremierInnError
+from .response import parse_response
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def find_booking_body(data: dict[str, Any], country: str) -> dict[str, Any]:
+    """Return a findBooking request for a booking in a country."""
+    body = copy.deepcopy(FIND_BOOKING_POST_BODY)
+    body[CONF_VARIABLES][CONF_FIND_BOOKING_CRITERIA].update(
+        {
+            CONF_ARRIVALDATE: data[CONF_ARRIVAL_DATE],
+            CONF_LASTNAME: data[CONF_LAST_NAME],
+            CONF_RESNO: data[CONF_RES_NO],
+            CONF_COUNTRY: country,
+        }
+    )
+    return body
+
+
+async def async_find_booking(
+    client: PremierInnApiClient, data: dict[str, Any], country: str
+) -> str | None:
+    """Return the basket reference if findBooking knows the booking in a country.
+
+    Failures to reach the API, including being rate limited, are raised.
+    """
+    payload = await client.async_post(
+        CONF_FIND_BOOKING, country, find_booking_body(data, country)
+    )
+    try:
+        return parse_response(CONF_FIND_BOOKING, payload)[CONF_BASKET_REFERENCE] or None
+    except APIRatelimitExceeded:
+        raise
+    except PremierInnError as err:
+        # The API answered, so the booking is not in this country.
+        _LOGGER.debug("No booking %s in %s: %s", data[CONF_RES_NO], country, err)
+        return None
+
+
+def arrival_dates(arrival_date: str, window: int) -> list[str]:
+    """Return the arrival date and its neighbours, nearest first."""
+    day = date.fromisoformat(arrival_date)
+    offsets = [0]
+    for offset in range(1, window + 1):
+        offsets += [-offset, offset]
+    return [(day + timedelta(days=offset)).isoformat() for offset in offsets]
+
+
+async def async_locate_booking(
+    hass: HomeAssistant,
+    data: dict[str, Any],
+    countries: list[str],
+    window: int = 0,
+) -> tuple[str, str, str] | None:
+    """Return the country, arrival date and basket reference of a booking.
+
+    Every country on the arrival date, then on the dates either side up to
+    window days away, nearest first, is queued at once up to the probe budget.
+    A semaphore shared by all lookups bounds how many run together and starts
+    them in that order. The first match cancels the rest, so probes that have
+    not started yet open no basket. Being rate limited or unable to connect
+    ends the search too.
+    """
+    client = async_get_api_client(hass)
+    if (semaphore := hass.data.get(DATA_LOOKUP)) is None:
+        semaphore = hass.data[DATA_LOOKUP] = asyncio.Semaphore(LOOKUP_CONCURRENCY)
+
+    async def async_probe(country: str, arrival_date: str) -> str | None:
+        async with semaphore:
+            return await async_find_booking(
+                client,
+                {**data, CONF_ARRIVAL_DATE: arrival_date},
+                COUNTRIES[country],
+            )
+
+    candidates = [
+        (country, arrival_date)
+        for arrival_date in arrival_dates(data[CONF_ARRIVAL_DATE], window)
+        for country in countries
+    ]
+    if len(candidates) > LOOKUP_MAX_PROBES:
+        _LOGGER.debug(
+            "Trying only the nearest %s of %s lookups for %s",
+            LOOKUP_MAX_PROBES,
+            len(candidates),
+            data[CONF_RES_NO],
+        )
+    probes = {
+        asyncio.create_task(async_probe(*candidate)): candidate
+        for candidate in candidates[:LOOKUP_MAX_PROBES]
+    }
+
+    pending = set(probes)
+    try:
+        while pending:
+            done, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in done:
+                if basket_reference := task.result():
+                    return *probes[task], basket_reference
+    finally:
+        for task in probes:
+            if not task.done():
+                task.cancel()
+            elif not task.cancelled():
+                # Only the first failure is raised, the rest are dropped.
+                task.exception()
+    return None
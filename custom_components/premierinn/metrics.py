@@ -0,0 +1,206 @@
+"""Premier Inn Prometheus metrics."""
+
+from __future__ import annotations
+
+from collections import Counter
+from typing import Any
+
+from aiohttp import hdrs, web
+
+from homeassistant.components.http import HomeAssistantView
+from homeassistant.core import HomeAssistant, callback
+
+from .const import DOMAIN, METRICS_URL
+from .instrumentation import PremierInnInstrumentation
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def escape_label(value: Any) -> str:
+    """Escape a Prometheus label value."""
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def format_labels(**labels: Any) -> str:
+    """Format Prometheus labels."""
+    if not labels:
+        return ""
+    return (
+        "{"
+        + ",".join(f'{key}="{escape_label(value)}"' for key, value in labels.items())
+        + "}"
+    )
+
+
+def format_histogram(
+    lines: list[str],
+    name: str,
+    histogram: dict[str, int],
+    total: float,
+    count: int,
+    **labels: Any,
+) -> None:
+    """Append the cumulative buckets, sum and count of a histogram."""
+    cumulative = 0
+    for bound, bucket in histogram.items():
+        cumulative += bucket
+        lines.append(f"{name}_bucket{format_labels(**labels, le=bound)} {cumulative}")
+    lines.append(f"{name}_sum{format_labels(**labels)} {total}")
+    lines.append(f"{name}_count{format_labels(**labels)} {count}")
+
+
+def render_metrics(snapshot: dict[str, Any]) -> str:
+    """Render a metrics snapshot in the Prometheus text format."""
+    lines = [
+        f"# HELP {DOMAIN}_api_requests_total Requests made to the Premier Inn API.",
+        f"# TYPE {DOMAIN}_api_requests_total counter",
+    ]
+    for operation, countries in snapshot["requests"].items():
+        for country, data in countries.items():
+            for status, count in data["statuses"].items():
+                labels = format_labels(
+                    operation=operation, country=country, status=status
+                )
+                lines.append(f"{DOMAIN}_api_requests_total{labels} {count}")
+
+    lines += [
+        f"# HELP {DOMAIN}_api_retries_total Retried requests to the Premier Inn API.",
+        f"# TYPE {DOMAIN}_api_retries_total counter",
+    ]
+    for operation, countries in snapshot["requests"].items():
+        for country, data in countries.items():
+            labels = format_labels(operation=operation, country=country)
+            lines.append(f"{DOMAIN}_api_retries_total{labels} {data['retries']}")
+
+    lines += [
+        f"# HELP {DOMAIN}_api_hedges_total Hedged requests to the Premier Inn API.",
+        f"# TYPE {DOMAIN}_api_hedges_total counter",
+    ]
+    for operation, countries in snapshot["requests"].items():
+        for country, data in countries.items():
+            labels = format_labels(operation=operation, country=country)
+            lines.append(f"{DOMAIN}_api_hedges_total{labels} {data['hedges']}")
+
+    lines += [
+        f"# HELP {DOMAIN}_api_response_bytes_total Bytes received from the API.",
+        f"# TYPE {DOMAIN}_api_response_bytes_total counter",
+    ]
+    for operation, countries in snapshot["requests"].items():
+        for country, data in countries.items():
+            labels = format_labels(operation=operation, country=country)
+            lines.append(f"{DOMAIN}_api_response_bytes_total{labels} {data['bytes']}")
+
+    lines += [
+        f"# HELP {DOMAIN}_cache_hits_total Requests served without calling the API.",
+        f"# TYPE {DOMAIN}_cache_hits_total counter",
+    ]
+    for operation, countries in snapshot["requests"].items():
+        for country, data in countries.items():
+            labels = format_labels(operation=operation, country=country)
+            lines.append(f"{DOMAIN}_cache_hits_total{labels} {data['cache_hits']}")
+
+    lines += [
+        f"# HELP {DOMAIN}_cache_hit_ratio Share of lookups served without the API.",
+        f"# TYPE {DOMAIN}_cache_hit_ratio gauge",
+    ]
+    for operation, countries in snapshot["requests"].items():
+        for country, data in countries.items():
+            lookups = data["cache_hits"] + data["requests"]
+            if not lookups:
+                continue
+            labels = format_labels(operation=operation, country=country)
+            ratio = round(data["cache_hits"] / lookups, 4)
+            lines.append(f"{DOMAIN}_cache_hit_ratio{labels} {ratio}")
+
+    lines += [
+        f"# HELP {DOMAIN}_api_latency_seconds Latency of Premier Inn API requests.",
+        f"# TYPE {DOMAIN}_api_latency_seconds histogram",
+    ]
+    for operation, countries in snapshot["requests"].items():
+        for country, data in countries.items():
+            format_histogram(
+                lines,
+                f"{DOMAIN}_api_latency_seconds",
+                data["histogram"],
+                data["latency_sum"],
+                data["requests"],
+                operation=operation,
+                country=country,
+            )
+
+    lines += [
+        f"# HELP {DOMAIN}_refresh_duration_seconds Duration of booking refreshes.",
+        f"# TYPE {DOMAIN}_refresh_duration_seconds histogram",
+    ]
+    for country, data in snapshot["refreshes"].items():
+        format_histogram(
+            lines,
+            f"{DOMAIN}_refresh_duration_seconds",
+            data["histogram"],
+            data["duration_sum"],
+            data["refreshes"],
+            country=country,
+        )
+
+    lines += [
+        f"# HELP {DOMAIN}_refresh_failures_total Booking refreshes that failed.",
+        f"# TYPE {DOMAIN}_refresh_failures_total counter",
+    ]
+    for country, data in snapshot["refreshes"].items():
+        labels = format_labels(country=country)
+        lines.append(f"{DOMAIN}_refresh_failures_total{labels} {data['failures']}")
+
+    lines += [
+        f"# HELP {DOMAIN}_calendar_operations_total Calendar service calls.",
+        f"# TYPE {DOMAIN}_calendar_operations_total counter",
+    ]
+    for (operation, success), count in snapshot["calendar"]:
+        labels = format_labels(
+            operation=operation, result="success" if success else "failure"
+        )
+        lines.append(f"{DOMAIN}_calendar_operations_total{labels} {count}")
+
+    lines += [
+        f"# HELP {DOMAIN}_bookings Tracked bookings by config entry state.",
+        f"# TYPE {DOMAIN}_bookings gauge",
+    ]
+    for state, count in snapshot["bookings"].items():
+        lines.append(f"{DOMAIN}_bookings{format_labels(state=state)} {count}")
+
+    return "\n".join(lines) + "\n"
+
+
+class PremierInnMetricsView(HomeAssistantView):
+    """Export the integration's metrics for Prometheus."""
+
+    url = METRICS_URL
+    name = f"api:{DOMAIN}:metrics"
+
+    def __init__(
+        self, hass: HomeAssistant, instrumentation: PremierInnInstrumentation
+    ) -> None:
+        """Initialize."""
+        self.hass = hass
+        self.instrumentation = instrumentation
+
+    @callback
+    def _async_snapshot(self) -> dict[str, Any]:
+        """Copy the current counters so they can be rendered off the event loop."""
+        entries = self.hass.config_entries.async_entries(DOMAIN)
+        return {
+            "requests": self.instrumentation.snapshot(),
+            "refreshes": {
+                country: stats.as_dict()
+                for country, stats in self.instrumentation.refreshes.items()
+            },
+            "calendar": sorted(self.instrumentation.calendar.items()),
+            "bookings": dict(Counter(entry.state.value for entry in entries)),
+        }
+
+    async def get(self, request: web.Request) -> web.Response:
+        """Return the metrics in the Prometheus text format."""
+        snapshot = self._async_snapshot()
+        body = await self.hass.async_add_executor_job(render_metrics, snapshot)
+        return web.Response(
+            body=body.encode("utf-8"), headers={hdrs.CONTENT_TYPE: CONTENT_TYPE}
+        )
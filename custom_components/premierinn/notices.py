@@ -0,0 +1,127 @@
+"""Premier Inn important information notices."""
+
+from __future__ import annotations
+
+from datetime import date
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    CONF_HOTEL_ID,
+    EVENT_IMPORTANT_INFO,
+    NOTICE_CHANGED,
+    NOTICE_NEW,
+    NOTICES_SAVE_DELAY,
+    NOTICES_STORAGE_KEY,
+    NOTICES_STORAGE_VERSION,
+)
+
+
+def parse_date(value: Any) -> date | None:
+    """Return the date part of a notice date."""
+    if not value:
+        return None
+    return dt_util.parse_date(str(value)[:10])
+
+
+def iter_info_items(important_info: Any) -> list[tuple[str | None, dict[str, Any]]]:
+    """Return every info item with the title of its section."""
+    sections = important_info if isinstance(important_info, list) else [important_info]
+    items = []
+    for section in sections:
+        if not isinstance(section, dict):
+            continue
+        info_items = section.get("infoItems") or []
+        if isinstance(info_items, dict):
+            info_items = [info_items]
+        items.extend(
+            (section.get("title"), item) for item in info_items if item.get("text")
+        )
+    return items
+
+
+class PremierInnHotelNotices:
+    """Announce new or changed important information once per hotel."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize."""
+        self.hass = hass
+        self._store: Store[dict[str, dict[str, str]]] = Store(
+            hass, NOTICES_STORAGE_VERSION, NOTICES_STORAGE_KEY
+        )
+        # Fingerprints of the notices already announced, by hotel and notice.
+        self._announced: dict[str, dict[str, str]] = {}
+        self._checked: dict[str, tuple[Any, date]] = {}
+
+    async def async_load(self) -> None:
+        """Load the announced notices from storage."""
+        self._announced = await self._store.async_load() or {}
+
+    @callback
+    def async_update_hotel(self, hotel_info: dict[str, Any]) -> None:
+        """Fire an event for each notice that is new or changed and current.
+
+        Bookings at the same hotel pass on the same information, so a hotel is
+        only diffed again when its notices or the date have changed.
+        """
+        if "importantInfo" not in hotel_info:
+            return
+
+        hotel_id = hotel_info[CONF_HOTEL_ID]
+        important_info = hotel_info["importantInfo"]
+        today = dt_util.now().date()
+        if self._checked.get(hotel_id) == (important_info, today):
+            return
+        self._checked[hotel_id] = (important_info, today)
+
+        announced = self._announced.setdefault(hotel_id, {})
+        current = set()
+        changed = False
+        for title, item in iter_info_items(important_info):
+            start = parse_date(item.get("startDate"))
+            end = parse_date(item.get("endDate"))
+            key = f"{item.get('startDate')}|{item['text']}"
+            current.add(key)
+            fingerprint = f"{title}|{item.get('priority')}|{item.get('endDate')}"
+
+            if announced.get(key) == fingerprint:
+                continue
+            # Notices outside their window are announced once they start.
+            if (start and today < start) or (end and today > end):
+                continue
+
+            self.hass.bus.async_fire(
+                EVENT_IMPORTANT_INFO,
+                {
+                    "hotel_id": hotel_id,
+                    "hotel_name": hotel_info.get("name"),
+                    "change": NOTICE_CHANGED if key in announced else NOTICE_NEW,
+                    "title": title,
+                    "text": item["text"],
+                    "priority": item.get("priority"),
+                    "start_date": item.get("startDate"),
+                    "end_date": item.get("endDate"),
+                },
+            )
+            announced[key] = fingerprint
+            changed = True
+
+        # Forget notices the hotel no longer lists.
+        for key in set(announced) - current:
+            del announced[key]
+            changed = True
+
+        if changed:
+            self._store.async_delay_save(self._data_to_save, NOTICES_SAVE_DELAY)
+
+    @callback
+    def _data_to_save(self) -> dict[str, dict[str, str]]:
+        """Return the announced notices of every hotel."""
+        return {
+            hotel_id: notices
+            for hotel_id, notices in self._announced.items()
+            if notices
+        }
@@ -0,0 +1,184 @@
+"""Premier Inn price history."""
+
+from __future__ import annotations
+
+from array import array
+import base64
+import math
+import time
+from typing import Any
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+from .const import (
+    CONF_BOOKING_CONFIRMATION,
+    PRICE_FIELDS,
+    PRICES_HISTORY_SIZE,
+    PRICES_SAVE_DELAY,
+    PRICES_STORAGE_KEY,
+    PRICES_STORAGE_VERSION,
+)
+from .coordinator import PremierInnCoordinator
+
+# Each row is the time of the change followed by every price field.
+ROW_WIDTH = len(PRICE_FIELDS) + 1
+
+
+def to_float(value: Any) -> float:
+    """Return a price as a float, or NaN if it is missing."""
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return math.nan
+
+
+def price_row(coordinator: PremierInnCoordinator) -> tuple[float, ...] | None:
+    """Return the current prices of a booking."""
+    if not coordinator.data or coordinator.booking is None:
+        return None
+
+    booking_confirmation = coordinator.data[CONF_BOOKING_CONFIRMATION]
+    room_prices = [
+        to_float(room.room_stay.get("roomPrice")) for room in coordinator.booking.rooms
+    ]
+    return (
+        *(to_float(booking_confirmation.get(key)) for key in PRICE_FIELDS[:-1]),
+        sum(room_prices),
+    )
+
+
+def same_prices(a: tuple[float, ...], b: tuple[float, ...]) -> bool:
+    """Compare two rows of prices, treating missing prices as equal."""
+    return all(x == y or (math.isnan(x) and math.isnan(y)) for x, y in zip(a, b))
+
+
+class PriceRing:
+    """Fixed-size ring of price changes in a flat array of doubles."""
+
+    def __init__(self) -> None:
+        """Initialize."""
+        self.values = array("d", [math.nan] * (PRICES_HISTORY_SIZE * ROW_WIDTH))
+        self.head = 0
+        self.count = 0
+
+    def __len__(self) -> int:
+        """Return the number of recorded changes."""
+        return self.count
+
+    def append(self, changed: float, prices: tuple[float, ...]) -> None:
+        """Record a change, overwriting the oldest once full."""
+        start = self.head * ROW_WIDTH
+        self.values[start : start + ROW_WIDTH] = array("d", (changed, *prices))
+        self.head = (self.head + 1) % PRICES_HISTORY_SIZE
+        self.count = min(self.count + 1, PRICES_HISTORY_SIZE)
+
+    def row(self, age: int) -> tuple[float, ...]:
+        """Return a change by age, zero being the latest."""
+        index = (self.head - 1 - age) % PRICES_HISTORY_SIZE
+        return tuple(self.values[index * ROW_WIDTH : (index + 1) * ROW_WIDTH])
+
+    def rows(self) -> list[tuple[float, ...]]:
+        """Return the changes from oldest to newest."""
+        return [self.row(age) for age in reversed(range(self.count))]
+
+    def encode(self) -> str:
+        """Return the recorded changes, oldest first, as packed doubles."""
+        rows = array("d")
+        for row in self.rows():
+            rows.extend(row)
+        return base64.b64encode(rows.tobytes()).decode("ascii")
+
+    @classmethod
+    def decode(cls, data: str) -> PriceRing:
+        """Return a ring holding the changes of its stored form."""
+        ring = cls()
+        rows = array("d")
+        try:
+            rows.frombytes(base64.b64decode(data))
+        except ValueError:
+            return ring
+        for start in range(0, len(rows) - ROW_WIDTH + 1, ROW_WIDTH):
+            ring.append(rows[start], tuple(rows[start + 1 : start + ROW_WIDTH]))
+        return ring
+
+
+class PremierInnPriceHistory:
+    """Record when the prices of each booking change."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize."""
+        self.hass = hass
+        self._store: Store[dict[str, Any]] = Store(
+            hass, PRICES_STORAGE_VERSION, PRICES_STORAGE_KEY
+        )
+        self._rings: dict[str, PriceRing] = {}
+
+    async def async_load(self) -> None:
+        """Load the history from storage."""
+        data = await self._store.async_load() or {}
+        self._rings = {
+            booking: PriceRing.decode(stored) for booking, stored in data.items()
+        }
+
+    @callback
+    def async_add_booking(
+        self, booking: str, coordinator: PremierInnCoordinator
+    ) -> CALLBACK_TYPE:
+        """Record the price changes of a booking as its coordinator updates."""
+        self._async_update(booking, coordinator)
+        return coordinator.async_add_listener(
+            lambda: self._async_update(booking, coordinator)
+        )
+
+    @callback
+    def async_remove_booking(self, booking: str) -> None:
+        """Forget the history of a booking."""
+        if self._rings.pop(booking, None) is not None:
+            self._store.async_delay_save(self._data_to_save, PRICES_SAVE_DELAY)
+
+    @callback
+    def _async_update(self, booking: str, coordinator: PremierInnCoordinator) -> None:
+        """Append the prices if any of them changed."""
+        if (prices := price_row(coordinator)) is None:
+            return
+
+        ring = self._rings.setdefault(booking, PriceRing())
+        if ring and same_prices(ring.row(0)[1:], prices):
+            return
+
+        ring.append(time.time(), prices)
+        self._store.async_delay_save(self._data_to_save, PRICES_SAVE_DELAY)
+
+    def changes(self, booking: str) -> list[dict[str, Any]]:
+        """Return the recorded changes of a booking, oldest first."""
+        if (ring := self._rings.get(booking)) is None:
+            return []
+        return [
+            {
+                "changed": row[0],
+                **{
+                    key: None if math.isnan(value) else value
+                    for key, value in zip(PRICE_FIELDS, row[1:])
+                },
+            }
+            for row in ring.rows()
+        ]
+
+    def previous(self, booking: str, key: str) -> tuple[float | None, float | None]:
+        """Return the value a price had before its latest change, and when."""
+        if (ring := self._rings.get(booking)) is None:
+            return None, None
+
+        column = PRICE_FIELDS.index(key) + 1
+        for age in range(1, len(ring)):
+            row, newer = ring.row(age), ring.row(age - 1)
+            if not same_prices((row[column],), (newer[column],)):
+                value = row[column]
+                return (None if math.isnan(value) else value), newer[0]
+        return None, None
+
+    @callback
+    def _data_to_save(self) -> dict[str, str]:
+        """Return every ring in its stored form."""
+        return {booking: ring.encode() for booking, ring in self._rings.items()}
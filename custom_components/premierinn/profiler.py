@@ -0,0 +1,71 @@
+"""Premier Inn event loop profiler."""
+
+from __future__ import annotations
+
+import asyncio
+import cProfile
+import io
+import logging
+import os
+import pstats
+import re
+import time
+
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError
+
+_LOGGER = logging.getLogger(__name__)
+
+# Only the integration's own functions are listed in the log summary.
+PACKAGE_PATTERN = re.escape(os.path.dirname(__file__))
+
+
+def write_stats(profile: cProfile.Profile, path: str, top: int) -> str:
+    """Write the stats file and return the top functions by cumulative time."""
+    profile.dump_stats(path)
+    stream = io.StringIO()
+    stats = pstats.Stats(profile, stream=stream)
+    stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(PACKAGE_PATTERN, top)
+    return stream.getvalue()
+
+
+class PremierInnProfiler:
+    """Profile the event loop, where every integration callback runs.
+
+    Only one profile can run at a time, as the interpreter allows a single
+    active profiler.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize."""
+        self.hass = hass
+        self._lock = asyncio.Lock()
+
+    async def async_profile(self, seconds: float, top: int) -> str:
+        """Profile for a number of seconds and return the stats file path."""
+        if self._lock.locked():
+            raise HomeAssistantError("A Premier Inn profile is already running.")
+
+        async with self._lock:
+            profile = cProfile.Profile()
+            try:
+                profile.enable()
+            except ValueError as err:
+                raise HomeAssistantError(f"Unable to start profiling: {err}") from err
+            try:
+                await asyncio.sleep(seconds)
+            finally:
+                profile.disable()
+
+            path = self.hass.config.path(f"premierinn_profile.{int(time.time())}.prof")
+            summary = await self.hass.async_add_executor_job(
+                write_stats, profile, path, top
+            )
+
+        _LOGGER.warning(
+            "Premier Inn profile written to %s, top %s functions:\n%s",
+            path,
+            top,
+            summary,
+        )
+        return path
@@ -0,0 +1,288 @@
+"""Premier Inn proximity engine."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import dataclass
+import logging
+
+import numpy as np
+
+from homeassistant.const import ATTR_LATITUDE, ATTR_LONGITUDE
+from homeassistant.core import (
+    CALLBACK_TYPE,
+    Event,
+    EventStateChangedData,
+    HomeAssistant,
+    State,
+    callback,
+)
+from homeassistant.helpers.event import TrackStates, async_track_state_change_filtered
+
+from .const import (
+    PROXIMITY_ARRIVED,
+    PROXIMITY_ARRIVED_RADIUS,
+    PROXIMITY_AWAY_FROM,
+    PROXIMITY_STATIONARY,
+    PROXIMITY_TOLERANCE,
+    PROXIMITY_TOWARDS,
+    PROXIMITY_TRACKED_DOMAINS,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+EARTH_RADIUS = 6371008.8
+
+
+def haversine(origins: np.ndarray, targets: np.ndarray) -> np.ndarray:
+    """Return the great-circle distance in metres between every pair of points.
+
+    Both arrays hold (latitude, longitude) rows in radians. The result has one
+    row per origin and one column per target.
+    """
+    lat1 = origins[:, 0, np.newaxis]
+    lon1 = origins[:, 1, np.newaxis]
+    lat2 = targets[np.newaxis, :, 0]
+    lon2 = targets[np.newaxis, :, 1]
+
+    a = (
+        np.sin((lat2 - lat1) / 2) ** 2
+        + np.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) / 2) ** 2
+    )
+    return 2 * EARTH_RADIUS * np.arcsin(np.sqrt(np.clip(a, 0, 1)))
+
+
+def position_from_state(state: State | None) -> tuple[float, float] | None:
+    """Return the position of a tracked entity in radians."""
+    if state is None:
+        return None
+    latitude = state.attributes.get(ATTR_LATITUDE)
+    longitude = state.attributes.get(ATTR_LONGITUDE)
+    if latitude is None or longitude is None:
+        return None
+    return np.radians(float(latitude)), np.radians(float(longitude))
+
+
+@dataclass
+class ProximityData:
+    """Proximity of the nearest traveller to a hotel."""
+
+    distance: float | None = None
+    nearest: str | None = None
+    direction: str | None = None
+
+    @property
+    def arrived(self) -> bool:
+        """Return True if a traveller is at the hotel."""
+        return self.direction == PROXIMITY_ARRIVED
+
+
+def is_significant(previous: ProximityData, current: ProximityData) -> bool:
+    """Return True if the proximity of a hotel changed enough to report.
+
+    Distances within the tolerance of the last reported one are GPS noise,
+    unless the nearest traveller or the arrival changes with them.
+    """
+    if previous.nearest != current.nearest or previous.arrived != current.arrived:
+        return True
+    if previous.distance is None or current.distance is None:
+        return previous.distance != current.distance
+    return abs(current.distance - previous.distance) > PROXIMITY_TOLERANCE
+
+
+class PremierInnProximity:
+    """Compute distances between all hotels and all travellers at once.
+
+    Bookings at the same hotel share its column of the distance matrix, and
+    their listeners are only called when the nearest traveller or the arrival
+    changes, or the distance moves by more than the tolerance.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize."""
+        self.hass = hass
+        self._hotel_ids: list[str] = []
+        self._hotels = np.empty((0, 2))
+        self._hotel_data: dict[str, ProximityData] = {}
+        self._bookings: dict[str, str] = {}
+        self._trackers: list[str] = []
+        self._positions = np.empty((0, 2))
+        self._distances = np.empty((0, 0))
+        self._listeners: dict[str, list[CALLBACK_TYPE]] = {}
+        self._unsub_track: Callable[[], None] | None = None
+
+    def get(self, entry_id: str) -> ProximityData | None:
+        """Return the proximity of a booking's hotel."""
+        if (hotel_id := self._bookings.get(entry_id)) is None:
+            return None
+        return self._hotel_data.get(hotel_id)
+
+    def distances(self, entry_id: str) -> dict[str, int]:
+        """Return the distance from every traveller to a booking's hotel."""
+        if (hotel_id := self._bookings.get(entry_id)) is None or not len(
+            self._trackers
+        ):
+            return {}
+        column = self._distances[:, self._hotel_ids.index(hotel_id)]
+        return {
+            tracker: round(float(value))
+            for tracker, value in zip(self._trackers, column)
+        }
+
+    @callback
+    def async_add_booking(
+        self, entry_id: str, hotel_id: str, latitude: float, longitude: float
+    ) -> CALLBACK_TYPE:
+        """Start measuring the distance to a booking's hotel."""
+        self._bookings[entry_id] = hotel_id
+        if hotel_id not in self._hotel_ids:
+            self._hotel_ids.append(hotel_id)
+            self._hotels = np.vstack(
+                [self._hotels, np.radians([[float(latitude), float(longitude)]])]
+            )
+            self._hotel_data[hotel_id] = ProximityData()
+
+            if self._unsub_track is None:
+                self._async_start()
+            else:
+                self._distances = np.hstack(
+                    [self._distances, haversine(self._positions, self._hotels[-1:])]
+                )
+                self._async_update_hotels()
+
+        @callback
+        def async_remove_booking() -> None:
+            self._bookings.pop(entry_id, None)
+            self._listeners.pop(entry_id, None)
+            if hotel_id not in self._bookings.values():
+                index = self._hotel_ids.index(hotel_id)
+                self._hotel_ids.pop(index)
+                self._hotels = np.delete(self._hotels, index, axis=0)
+                self._distances = np.delete(self._distances, index, axis=1)
+                self._hotel_data.pop(hotel_id, None)
+            if not self._bookings:
+                self._async_stop()
+
+        return async_remove_booking
+
+    @callback
+    def async_add_listener(
+        self, entry_id: str, update_callback: CALLBACK_TYPE
+    ) -> CALLBACK_TYPE:
+        """Listen for proximity changes of a booking."""
+        listeners = self._listeners.setdefault(entry_id, [])
+        listeners.append(update_callback)
+
+        @callback
+        def remove_listener() -> None:
+            if update_callback in self._listeners.get(entry_id, []):
+                self._listeners[entry_id].remove(update_callback)
+
+        return remove_listener
+
+    @callback
+    def _async_start(self) -> None:
+        """Load every traveller and follow their location changes."""
+        self._trackers = []
+        positions = []
+        for state in self.hass.states.async_all(PROXIMITY_TRACKED_DOMAINS):
+            if (position := position_from_state(state)) is not None:
+                self._trackers.append(state.entity_id)
+                positions.append(position)
+
+        self._positions = np.array(positions).reshape(-1, 2)
+        self._distances = haversine(self._positions, self._hotels)
+        self._async_update_hotels()
+
+        self._unsub_track = async_track_state_change_filtered(
+            self.hass,
+            TrackStates(False, set(), set(PROXIMITY_TRACKED_DOMAINS)),
+            self._async_state_changed,
+        ).async_remove
+
+    @callback
+    def _async_stop(self) -> None:
+        """Stop following travellers."""
+        if self._unsub_track is not None:
+            self._unsub_track()
+            self._unsub_track = None
+        self._trackers = []
+        self._positions = np.empty((0, 2))
+        self._distances = np.empty((0, len(self._hotel_ids)))
+
+    @callback
+    def _async_state_changed(self, event: Event[EventStateChangedData]) -> None:
+        """Update the distances of the traveller that moved."""
+        entity_id = event.data["entity_id"]
+        position = position_from_state(event.data["new_state"])
+
+        if entity_id in self._trackers:
+            index = self._trackers.index(entity_id)
+            if position is None:
+                self._trackers.pop(index)
+                self._positions = np.delete(self._positions, index, axis=0)
+                self._distances = np.delete(self._distances, index, axis=0)
+            else:
+                self._positions[index] = position
+                self._distances[index] = haversine(
+                    self._positions[index : index + 1], self._hotels
+                )[0]
+        elif position is not None:
+            self._trackers.append(entity_id)
+            self._positions = np.vstack([self._positions, [position]])
+            self._distances = np.vstack(
+                [self._distances, haversine(self._positions[-1:], self._hotels)]
+            )
+        else:
+            return
+
+        self._async_update_hotels()
+
+    @callback
+    def _async_update_hotels(self) -> None:
+        """Summarise the distance matrix per hotel and notify on changes."""
+        if self._distances.shape[0]:
+            nearest = np.argmin(self._distances, axis=0)
+            minimum = self._distances[nearest, np.arange(len(self._hotel_ids))]
+        else:
+            nearest = minimum = None
+
+        changed = set()
+        for column, hotel_id in enumerate(self._hotel_ids):
+            previous = self._hotel_data.get(hotel_id, ProximityData())
+
+            if minimum is None:
+                current = ProximityData()
+            else:
+                distance = float(minimum[column])
+                current = ProximityData(
+                    distance=round(distance),
+                    nearest=self._trackers[nearest[column]],
+                    direction=self._direction(previous, distance),
+                )
+
+            if is_significant(previous, current):
+                self._hotel_data[hotel_id] = current
+                changed.add(hotel_id)
+
+        if not changed:
+            return
+        for entry_id, hotel_id in self._bookings.items():
+            if hotel_id in changed:
+                for update_callback in self._listeners.get(entry_id, []):
+                    update_callback()
+
+    @staticmethod
+    def _direction(previous: ProximityData, distance: float) -> str:
+        """Return the direction of travel relative to the hotel."""
+        if distance <= PROXIMITY_ARRIVED_RADIUS:
+            return PROXIMITY_ARRIVED
+        if previous.direction == PROXIMITY_ARRIVED:
+            return PROXIMITY_AWAY_FROM
+        if previous.distance is None:
+            return PROXIMITY_STATIONARY
+        if distance < previous.distance - PROXIMITY_TOLERANCE:
+            return PROXIMITY_TOWARDS
+        if distance > previous.distance + PROXIMITY_TOLERANCE:
+            return PROXIMITY_AWAY_FROM
+        return previous.direction or PROXIMITY_STATIONARY
@@ -0,0 +1,231 @@
+"""Premier Inn GraphQL query composer."""
+
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
+
+from .const import (
+    CONF_BOOKING_CONFIRMATION,
+    CONF_HOTEL_INFORMATION,
+    DATA_NOTICES,
+    DOMAIN,
+)
+
+# Every field the integration knows about, by operation. A leaf is None.
+SCHEMAS: dict[str, dict[str, Any]] = {
+    CONF_BOOKING_CONFIRMATION: {
+        "reservationByIdList": {
+            "reservationId": None,
+            "reservationGuestList": {"givenName": None, "surName": None},
+            "roomStay": {
+                "checkInTime": None,
+                "checkOutTime": None,
+                "ratePlanCode": None,
+                "arrivalDate": None,
+                "departureDate": None,
+                "bookingChannel": None,
+                "roomPrice": None,
+                "cot": None,
+                "adultsNumber": None,
+                "roomExtraInfo": {"roomName": None},
+                "childrenNumber": None,
+            },
+            "reservationOverrideReasons": {
+                "reasonCode": None,
+                "callerName": None,
+                "managerName": None,
+                "reasonName": None,
+            },
+            "reservationOverridden": None,
+            "guaranteeCode": None,
+            "reservationStatus": None,
+            "additionalGuestInfo": {"purposeOfStay": None},
+        },
+        "balanceOutstanding": None,
+        "currencyCode": None,
+        "newTotal": None,
+        "policyCode": None,
+        "previousTotal": None,
+        "totalCost": None,
+        "hotelId": None,
+        "hotelName": None,
+        "rateMessage": None,
+        "bookingReference": None,
+        "basketReference": None,
+    },
+    CONF_HOTEL_INFORMATION: {
+        "address": {
+            "addressLine1": None,
+            "addressLine2": None,
+            "addressLine3": None,
+            "addressLine4": None,
+            "postalCode": None,
+            "country": None,
+        },
+        "hotelId": None,
+        "hotelOpeningDate": None,
+        "name": None,
+        "brand": None,
+        "parkingDescription": None,
+        "directions": None,
+        "county": None,
+        "contactDetails": {"phone": None, "hotelNationalPhone": None, "email": None},
+        "coordinates": {"latitude": None, "longitude": None},
+        "importantInfo": {
+            "title": None,
+            "infoItems": {
+                "text": None,
+                "priority": None,
+                "startDate": None,
+                "endDate": None,
+            },
+        },
+    },
+}
+
+QUERY_TEMPLATES = {
+    CONF_BOOKING_CONFIRMATION: (
+        "query bookingConfirmation($basketReference: String!, $language: String!, "
+        "$country: String!, $bookingChannel: String) { bookingConfirmation("
+        "basketReference: $basketReference, language: $language, "
+        "country: $country, bookingChannel: $bookingChannel) {selection} }"
+    ),
+    CONF_HOTEL_INFORMATION: (
+        "query GetHotelInformation($hotelId: String!, $country: String!, "
+        "$language: String!) { hotelInformation(hotelId: $hotelId, "
+        "country: $country, language: $language) {selection} }"
+    ),
+}
+
+# Fields read by the calendar, the scheduler, the price history and the
+# entity setup, which are always requested.
+CORE_FIELDS = {
+    CONF_BOOKING_CONFIRMATION: frozenset(
+        {
+            "reservationByIdList.reservationId",
+            "reservationByIdList.roomStay.arrivalDate",
+            "reservationByIdList.roomStay.departureDate",
+            "reservationByIdList.roomStay.checkInTime",
+            "reservationByIdList.roomStay.checkOutTime",
+            "reservationByIdList.roomStay.roomExtraInfo",
+            # Used by the price sensors and history.
+            "reservationByIdList.roomStay.roomPrice",
+            "totalCost",
+            "previousTotal",
+            "newTotal",
+            "balanceOutstanding",
+            "currencyCode",
+            "hotelId",
+            "hotelName",
+            "bookingReference",
+            "basketReference",
+        }
+    ),
+    CONF_HOTEL_INFORMATION: frozenset({"hotelId", "name", "address", "coordinates"}),
+}
+
+# Fields only requested while the sensor that shows them is enabled. The hotel
+# sensor shows every field it receives as an attribute, including the HTML
+# descriptions the geolocation entity also shows.
+SENSOR_FIELDS = {
+    "roomStay": {
+        CONF_BOOKING_CONFIRMATION: frozenset(SCHEMAS[CONF_BOOKING_CONFIRMATION])
+    },
+    "hotelInformation": {
+        CONF_HOTEL_INFORMATION: frozenset(
+            {
+                "address",
+                "hotelId",
+                "hotelOpeningDate",
+                "name",
+                "brand",
+                "county",
+                "coordinates",
+                "contactDetails",
+                "parkingDescription",
+                "directions",
+            }
+        )
+    },
+}
+
+# Fields of the shared hotel geolocation entity.
+GEO_LOCATION_FIELDS = frozenset({"contactDetails", "parkingDescription", "directions"})
+
+# Fields of the important information notices.
+NOTICE_FIELDS = frozenset({"importantInfo"})
+
+
+def select(schema: dict[str, Any], paths: list[list[str]]) -> str:
+    """Return the selection set of the given field paths."""
+    children: dict[str, list[list[str]]] = {}
+    for path in paths:
+        children.setdefault(path[0], []).append(path[1:])
+
+    selection = []
+    for name, subtree in schema.items():
+        if name not in children:
+            continue
+        if subtree is None:
+            selection.append(name)
+        elif any(not rest for rest in children[name]):
+            selection.append(f"{name} {select(subtree, [[key] for key in subtree])}")
+        else:
+            selection.append(f"{name} {select(subtree, children[name])}")
+    return "{ " + " ".join(selection) + " }"
+
+
+@lru_cache(maxsize=16)
+def compose_query(operation: str, fields: frozenset[str] | None = None) -> str:
+    """Return the query of an operation selecting only the given fields."""
+    schema = SCHEMAS[operation]
+    paths = [field.split(".") for field in sorted(fields or schema)]
+    return QUERY_TEMPLATES[operation].replace("{selection}", select(schema, paths))
+
+
+def top_level(fields: frozenset[str] | None, operation: str) -> set[str]:
+    """Return the top-level keys a response will contain."""
+    return {field.split(".")[0] for field in fields or SCHEMAS[operation]}
+
+
+def is_enabled(registry: er.EntityRegistry, domain: str, unique_id: str) -> bool:
+    """Return True unless the entity is registered and disabled.
+
+    Entities that are not registered yet count as enabled, since new entities
+    are enabled by default.
+    """
+    entity_id = registry.async_get_entity_id(domain, DOMAIN, unique_id)
+    entity = registry.async_get(entity_id) if entity_id else None
+    return entity is None or not entity.disabled
+
+
+@callback
+def async_get_fields(
+    hass: HomeAssistant, res_no: str, hotel_id: str | None = None
+) -> dict[str, frozenset[str]]:
+    """Return the fields each operation needs for the enabled consumers.
+
+    The hotel geolocation entity is only known once the hotel is, so its
+    fields are requested until then.
+    """
+    registry = er.async_get(hass)
+    fields = {operation: set(core) for operation, core in CORE_FIELDS.items()}
+
+    for key, needed in SENSOR_FIELDS.items():
+        if is_enabled(registry, "sensor", f"{DOMAIN}-{res_no}-{key}".lower()):
+            for operation, operation_fields in needed.items():
+                fields[operation] |= operation_fields
+
+    if hotel_id is None or is_enabled(
+        registry, "geo_location", f"{DOMAIN}-{hotel_id}".lower()
+    ):
+        fields[CONF_HOTEL_INFORMATION] |= GEO_LOCATION_FIELDS
+
+    if hass.data.get(DATA_NOTICES) is not None:
+        fields[CONF_HOTEL_INFORMATION] |= NOTICE_FIELDS
+
+    return {operation: frozenset(value) for operation, value in fields.items()}
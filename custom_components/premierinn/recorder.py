@@ -0,0 +1,215 @@
+"""Premier Inn API traffic recorder."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import defaultdict
+import gzip
+import hashlib
+import hmac
+import json
+import logging
+import secrets
+import time
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError
+
+from .const import (
+    CONF_VARIABLES,
+    RECORDING_ANONYMIZED_KEYS,
+    RECORDING_FLUSH_SIZE,
+    RECORDING_MODE_RECORD,
+    RECORDING_MODE_REPLAY,
+    RECORDING_SPEED_FAST,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+ANONYMIZED_PREFIX = "anon-"
+
+# Status, latency, offset from the first request and payload.
+Exchange = tuple[int, float, float | None, bytes]
+
+
+def anonymize(value: Any, secret: bytes) -> Any:
+    """Replace identifying values with a keyed hash.
+
+    Hashing keeps values that link requests together, such as the basket
+    reference returned by findBooking, consistent across the recording. The
+    secret is never written out, so names and references cannot be recovered
+    by hashing guesses.
+    """
+    if isinstance(value, dict):
+        return {
+            key: anonymize_value(item, secret)
+            if key in RECORDING_ANONYMIZED_KEYS
+            else anonymize(item, secret)
+            for key, item in value.items()
+        }
+    if isinstance(value, list):
+        return [anonymize(item, secret) for item in value]
+    return value
+
+
+def anonymize_value(value: Any, secret: bytes) -> Any:
+    """Return the keyed hash of a single identifying value."""
+    if not isinstance(value, str) or value.startswith(ANONYMIZED_PREFIX):
+        return value
+    digest = hmac.new(secret, value.encode(), hashlib.sha256).hexdigest()
+    return ANONYMIZED_PREFIX + digest[:16]
+
+
+def request_key(operation: str, post_body: dict[str, Any], secret: bytes) -> str:
+    """Return the key matching a request to its recorded response."""
+    variables = anonymize(post_body.get(CONF_VARIABLES, {}), secret)
+    return f"{operation}:{json.dumps(variables, sort_keys=True)}"
+
+
+def write_exchanges(path: str, lines: list[str]) -> None:
+    """Append exchanges to the recording as a new gzip member."""
+    with gzip.open(path, "at", encoding="utf-8") as file:
+        file.writelines(lines)
+
+
+def read_exchanges(path: str) -> list[list[Any]]:
+    """Read every exchange from a recording."""
+    with gzip.open(path, "rt", encoding="utf-8") as file:
+        return [json.loads(line) for line in file if line.strip()]
+
+
+class PremierInnRecorder:
+    """Record API exchanges to a file, or replay them from one.
+
+    Each exchange is a JSON line of operation, request key, status, latency,
+    offset from the first request and the anonymized response, in a gzip
+    compressed file. Values are hashed with a key drawn for each recording,
+    so only values already anonymized, such as recorded basket references,
+    match their recorded requests when replaying.
+    """
+
+    def __init__(self, hass: HomeAssistant, mode: str, path: str, speed: str) -> None:
+        """Initialize."""
+        self.hass = hass
+        self.mode = mode
+        self.path = path
+        self.speed = speed
+        self._secret = secrets.token_bytes(32)
+        self._started: float | None = None
+        self._pending: list[str] = []
+        self._exchanges: dict[str, list[Exchange]] = {}
+        self._by_operation: dict[str, list[Exchange]] = {}
+        self._positions: defaultdict[str, int] = defaultdict(int)
+
+    @property
+    def replaying(self) -> bool:
+        """Return whether responses are served from the recording."""
+        return self.mode == RECORDING_MODE_REPLAY
+
+    async def async_load(self) -> None:
+        """Load the recording when replaying."""
+        if not self.replaying:
+            return
+
+        try:
+            rows = await self.hass.async_add_executor_job(read_exchanges, self.path)
+        except (OSError, ValueError) as err:
+            raise HomeAssistantError(
+                f"Unable to read recording {self.path}: {err}"
+            ) from err
+
+        exchanges: dict[str, list[Exchange]] = {}
+        by_operation: dict[str, list[Exchange]] = {}
+        for operation, key, status, latency, *row in rows:
+            # Exchanges recorded without an offset replay back to back.
+            offset, response = row if len(row) == 2 else (None, row[0])
+            # Encode once so replaying costs the same as a network read.
+            exchange = (status, latency, offset, json.dumps(response).encode())
+            exchanges.setdefault(key, []).append(exchange)
+            by_operation.setdefault(operation, []).append(exchange)
+
+        self._exchanges = exchanges
+        self._by_operation = by_operation
+        _LOGGER.debug("Loaded %s exchanges from %s", len(rows), self.path)
+
+    async def async_replay(
+        self, operation: str, post_body: dict[str, Any]
+    ) -> tuple[int, bytes]:
+        """Return the recorded status and payload of a request.
+
+        Requests without an exact match cycle through the recordings of the
+        same operation, so any number of bookings can be replayed. Unless
+        replaying fast, each request waits for its recorded offset from the
+        first one, then for its recorded latency.
+        """
+        key = request_key(operation, post_body, self._secret)
+        if key not in self._exchanges:
+            key = operation
+        exchanges = self._exchanges.get(key) or self._by_operation.get(operation)
+        if not exchanges:
+            raise HomeAssistantError(f"No recorded {operation} exchanges")
+
+        status, latency, offset, payload = exchanges[
+            self._positions[key] % len(exchanges)
+        ]
+        self._positions[key] += 1
+
+        if self.speed != RECORDING_SPEED_FAST:
+            now = time.monotonic()
+            if self._started is None:
+                self._started = now - (offset or 0)
+            if offset is not None:
+                await asyncio.sleep(max(self._started + offset - now, 0))
+            await asyncio.sleep(latency)
+        return status, payload
+
+    async def async_record(
+        self,
+        operation: str,
+        post_body: dict[str, Any],
+        status: int,
+        latency: float,
+        payload: bytes,
+    ) -> None:
+        """Record an exchange, writing them out in batches."""
+        if self.mode != RECORDING_MODE_RECORD:
+            return
+
+        try:
+            response = anonymize(json.loads(payload), self._secret)
+        except ValueError:
+            response = None
+
+        # The offset is taken from when the request was sent.
+        sent = time.monotonic() - latency
+        if self._started is None:
+            self._started = sent
+
+        self._pending.append(
+            json.dumps(
+                [
+                    operation,
+                    request_key(operation, post_body, self._secret),
+                    status,
+                    round(latency, 4),
+                    round(sent - self._started, 4),
+                    response,
+                ],
+                separators=(",", ":"),
+            )
+            + "\n"
+        )
+        if len(self._pending) >= RECORDING_FLUSH_SIZE:
+            await self.async_flush()
+
+    async def async_flush(self) -> None:
+        """Write pending exchanges to the recording."""
+        if not self._pending:
+            return
+
+        lines, self._pending = self._pending, []
+        try:
+            await self.hass.async_add_executor_job(write_exchanges, self.path, lines)
+        except OSError as err:
+            _LOGGER.error("Unable to write recording %s: %s", self.path, err)
@@ -0,0 +1,130 @@
+"""Premier Inn GraphQL response parsing."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import Any
+
+from homeassistant.util.json import json_loads
+
+from .const import (
+    CONF_BASKET_REFERENCE,
+    CONF_BOOKING_CONFIRMATION,
+    CONF_DATA,
+    CONF_FIND_BOOKING,
+    CONF_HOTEL_ID,
+    CONF_HOTEL_INFORMATION,
+)
+from .exceptions import (
+    APIRatelimitExceeded,
+    InvalidAuth,
+    InvalidResponse,
+    PremierInnError,
+)
+
+Validator = Callable[[Any, str], None]
+
+AUTH_ERROR_CODES = {"UNAUTHENTICATED", "UNAUTHORIZED", "FORBIDDEN"}
+RATE_LIMIT_ERROR_CODES = {"TOO_MANY_REQUESTS", "RATE_LIMITED", "THROTTLED"}
+
+# The parts of each response the integration relies on. A type is a leaf, a
+# dict is an object whose listed keys are required and a single item list is a
+# non-empty list whose items all match the item schema.
+SCHEMAS: dict[str, dict[str, Any]] = {
+    CONF_FIND_BOOKING: {CONF_BASKET_REFERENCE: str},
+    CONF_BOOKING_CONFIRMATION: {
+        CONF_HOTEL_ID: str,
+        "bookingReference": str,
+        "reservationByIdList": [
+            {
+                "roomStay": {
+                    "arrivalDate": str,
+                    "departureDate": str,
+                    "checkInTime": str,
+                    "checkOutTime": str,
+                }
+            }
+        ],
+    },
+    CONF_HOTEL_INFORMATION: {
+        CONF_HOTEL_ID: str,
+        "name": str,
+        "address": dict,
+        "coordinates": {"latitude": (int, float), "longitude": (int, float)},
+    },
+}
+
+
+def compile_schema(schema: Any) -> Validator:
+    """Turn a schema into nested validation closures."""
+    if isinstance(schema, dict):
+        fields = [(key, compile_schema(value)) for key, value in schema.items()]
+
+        def validate_object(value: Any, path: str) -> None:
+            if not isinstance(value, dict):
+                raise InvalidResponse(f"Expected an object at {path}")
+            for key, validate in fields:
+                if key not in value:
+                    raise InvalidResponse(f"Missing {path}.{key}")
+                validate(value[key], f"{path}.{key}")
+
+        return validate_object
+
+    if isinstance(schema, list):
+        validate_item = compile_schema(schema[0])
+
+        def validate_list(value: Any, path: str) -> None:
+            if not isinstance(value, list) or not value:
+                raise InvalidResponse(f"Expected a non-empty list at {path}")
+            for index, item in enumerate(value):
+                validate_item(item, f"{path}[{index}]")
+
+        return validate_list
+
+    def validate_leaf(value: Any, path: str) -> None:
+        if not isinstance(value, schema):
+            raise InvalidResponse(f"Unexpected value at {path}")
+
+    return validate_leaf
+
+
+VALIDATORS: dict[str, Validator] = {
+    operation: compile_schema(schema) for operation, schema in SCHEMAS.items()
+}
+
+
+def raise_for_errors(errors: list[dict[str, Any]]) -> None:
+    """Raise the exception matching a GraphQL errors array."""
+    messages = []
+    for error in errors:
+        code = str((error.get("extensions") or {}).get("code", "")).upper()
+        message = error.get("message", code or "Unknown error")
+        if code in AUTH_ERROR_CODES:
+            raise InvalidAuth(message)
+        if code in RATE_LIMIT_ERROR_CODES:
+            raise APIRatelimitExceeded(message)
+        messages.append(message)
+    raise PremierInnError("; ".join(messages))
+
+
+def parse_response(operation: str, payload: bytes) -> dict[str, Any]:
+    """Decode a GraphQL response and return the data of the operation."""
+    try:
+        body = json_loads(payload)
+    except ValueError as err:
+        raise InvalidResponse(f"Invalid JSON in {operation} response") from err
+
+    if not isinstance(body, dict):
+        raise InvalidResponse(f"Unexpected {operation} response format")
+
+    data = body.get(CONF_DATA)
+    errors = body.get("errors")
+    # Partial data is still usable, so only fail if the operation is missing.
+    if errors and (not isinstance(data, dict) or data.get(operation) is None):
+        raise_for_errors(errors if isinstance(errors, list) else [errors])
+
+    if not isinstance(data, dict) or data.get(operation) is None:
+        raise InvalidResponse(f"No {operation} in response")
+
+    VALIDATORS[operation](data[operation], operation)
+    return data[operation]
@@ -0,0 +1,208 @@
+"""Premier Inn refresh scheduler."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime
+import heapq
+import itertools
+import logging
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    SCHEDULER_ARRIVAL_INTERVAL,
+    SCHEDULER_ARRIVAL_WINDOW,
+    SCHEDULER_DEFAULT_INTERVAL,
+    SCHEDULER_DISTANT_INTERVAL,
+    SCHEDULER_DISTANT_WINDOW,
+    SCHEDULER_MAX_SPACING,
+    SCHEDULER_RETRY_INTERVAL,
+    SCHEDULER_WORKERS,
+    STARTUP_CONCURRENCY,
+)
+from .coordinator import PremierInnCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def refresh_interval(hass: HomeAssistant, coordinator: PremierInnCoordinator) -> float:
+    """Return how long the data of a booking stays fresh, in seconds."""
+    if not coordinator.data or not coordinator.last_update_success:
+        return SCHEDULER_RETRY_INTERVAL
+
+    if coordinator.booking is None:
+        return SCHEDULER_DEFAULT_INTERVAL
+
+    until_check_in = (coordinator.booking.check_in - dt_util.now()).total_seconds()
+    if 0 < until_check_in <= SCHEDULER_ARRIVAL_WINDOW:
+        return SCHEDULER_ARRIVAL_INTERVAL
+    if until_check_in > SCHEDULER_DISTANT_WINDOW:
+        return SCHEDULER_DISTANT_INTERVAL
+    return SCHEDULER_DEFAULT_INTERVAL
+
+
+class PremierInnRefreshScheduler:
+    """Refresh every booking from one deadline-ordered queue.
+
+    Each booking has a single scheduled coordinator. Adding another for the
+    same booking replaces the first, so no booking is ever polled twice.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        workers: int = SCHEDULER_WORKERS,
+        startup_concurrency: int = STARTUP_CONCURRENCY,
+    ) -> None:
+        """Initialize."""
+        self.hass = hass
+        self._workers = workers
+        self._startup = asyncio.Semaphore(startup_concurrency)
+        self._heap: list[tuple[float, int, PremierInnCoordinator]] = []
+        self._tokens: dict[PremierInnCoordinator, int] = {}
+        self._bookings: dict[str, PremierInnCoordinator] = {}
+        self._counter = itertools.count()
+        self._queue: asyncio.Queue[PremierInnCoordinator] = asyncio.Queue()
+        self._tasks: list[asyncio.Task] = []
+        self._last_dispatch = 0.0
+        self._unsub_timer: CALLBACK_TYPE | None = None
+
+    @callback
+    def async_add_coordinator(
+        self, coordinator: PremierInnCoordinator, first_refresh: bool = False
+    ) -> CALLBACK_TYPE:
+        """Take over the polling of a coordinator.
+
+        With first_refresh the coordinator is refreshed in the background
+        straight away, a few at a time, before joining the queue.
+        """
+        booking = coordinator.res_no.upper()
+        if (replaced := self._bookings.get(booking)) not in (None, coordinator):
+            _LOGGER.warning(
+                "Replacing the scheduled coordinator of booking %s", booking
+            )
+            self._tokens.pop(replaced, None)
+        self._bookings[booking] = coordinator
+
+        # The scheduler decides when to refresh, not the coordinator's own timer.
+        coordinator.update_interval = None
+        first_refresh_task: asyncio.Task | None = None
+        if first_refresh:
+            # A token that is never queued, so the coordinator counts as added.
+            self._tokens[coordinator] = -1
+            first_refresh_task = self.hass.async_create_background_task(
+                self._async_first_refresh(coordinator),
+                f"premierinn first refresh {coordinator.res_no}",
+            )
+        else:
+            self._schedule(coordinator)
+
+        if not self._tasks:
+            self._tasks = [
+                self.hass.async_create_background_task(
+                    self._async_worker(), f"premierinn refresh worker {index}"
+                )
+                for index in range(self._workers)
+            ]
+
+        @callback
+        def async_remove_coordinator() -> None:
+            if first_refresh_task is not None:
+                first_refresh_task.cancel()
+            self._tokens.pop(coordinator, None)
+            if self._bookings.get(booking) is coordinator:
+                del self._bookings[booking]
+            if not self._tokens:
+                self._async_stop()
+
+        return async_remove_coordinator
+
+    def _schedule(self, coordinator: PremierInnCoordinator) -> None:
+        """Queue the next refresh of a coordinator by its deadline."""
+        deadline = self.hass.loop.time() + refresh_interval(self.hass, coordinator)
+        token = next(self._counter)
+        self._tokens[coordinator] = token
+        heapq.heappush(self._heap, (deadline, token, coordinator))
+        self._async_schedule_dispatch()
+
+    @callback
+    def _async_schedule_dispatch(self) -> None:
+        """Wake up when the earliest deadline is due."""
+        if self._unsub_timer is not None:
+            self._unsub_timer()
+            self._unsub_timer = None
+
+        # Drop entries of coordinators that were removed or rescheduled.
+        while self._heap and self._tokens.get(self._heap[0][2]) != self._heap[0][1]:
+            heapq.heappop(self._heap)
+
+        if not self._heap:
+            return
+
+        now = self.hass.loop.time()
+        due = max(self._heap[0][0], self._last_dispatch + self._spacing())
+        self._unsub_timer = async_call_later(
+            self.hass, max(due - now, 0), self._async_dispatch
+        )
+
+    def _spacing(self) -> float:
+        """Return the gap between refreshes that spreads them over the interval."""
+        return min(
+            SCHEDULER_DEFAULT_INTERVAL / max(len(self._tokens), 1),
+            SCHEDULER_MAX_SPACING,
+        )
+
+    @callback
+    def _async_dispatch(self, _now: datetime) -> None:
+        """Hand the most urgent coordinator to the worker pool."""
+        self._unsub_timer = None
+
+        if self._heap and self._heap[0][0] <= self.hass.loop.time():
+            _, token, coordinator = heapq.heappop(self._heap)
+            if self._tokens.get(coordinator) == token:
+                self._last_dispatch = self.hass.loop.time()
+                self._queue.put_nowait(coordinator)
+
+        self._async_schedule_dispatch()
+
+    async def _async_first_refresh(self, coordinator: PremierInnCoordinator) -> None:
+        """Refresh a newly added coordinator, then queue it."""
+        try:
+            async with self._startup:
+                if coordinator in self._tokens:
+                    await coordinator.async_refresh_shared()
+        except Exception:  # pylint: disable=broad-except
+            _LOGGER.exception("Unexpected error refreshing %s", coordinator.name)
+        finally:
+            if coordinator in self._tokens:
+                self._schedule(coordinator)
+
+    async def _async_worker(self) -> None:
+        """Refresh coordinators as they are dispatched."""
+        while True:
+            coordinator = await self._queue.get()
+            try:
+                if coordinator in self._tokens:
+                    await coordinator.async_refresh_shared()
+            except Exception:  # pylint: disable=broad-except
+                _LOGGER.exception("Unexpected error refreshing %s", coordinator.name)
+            finally:
+                if coordinator in self._tokens:
+                    self._schedule(coordinator)
+                self._queue.task_done()
+
+    @callback
+    def _async_stop(self) -> None:
+        """Stop the worker pool once no bookings are left."""
+        if self._unsub_timer is not None:
+            self._unsub_timer()
+            self._unsub_timer = None
+        for task in self._tasks:
+            task.cancel()
+        self._tasks = []
+        self._heap = []
+        self._bookings = {}
+        self._queue = asyncio.Queue()
@@ -1,28 +1,51 @@
 """Premier Inn sensor platform."""
 
-from datetime import date, datetime
+from datetime import date, datetime, timedelta
+import math
 from typing import Any
 
 from homeassistant.components.sensor import (
     SensorDeviceClass,
     SensorEntity,
     SensorEntityDescription,
+    SensorStateClass,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant, callback
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.const import EntityCategory, UnitOfLength
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.util import dt as dt_util
 
 from .const import (
     CONF_BOOKING_CONFIRMATION,
+    CONF_HOTEL_ID,
     CONF_HOTEL_INFORMATION,
     CONF_RES_NO,
+    DATA_COORDINATORS,
+    DATA_INSTRUMENTATION,
+    DATA_PRICES,
+    DATA_PROXIMITY,
+    DATA_STAYS,
+    DATA_SWEEPER,
     DOMAIN,
+    PRICE_FIELDS,
+    PROXIMITY_ARRIVED,
+    PROXIMITY_AWAY_FROM,
+    PROXIMITY_STATIONARY,
+    PROXIMITY_TOWARDS,
 )
 from .coordinator import PremierInnCoordinator
+from .instrumentation import PremierInnInstrumentation, timed
+from .prices import PremierInnPriceHistory, price_row
+from .proximity import PremierInnProximity
+from .stays import PremierInnStays
+
+# Only the integration-wide sensors poll, the others follow their coordinators.
+SCAN_INTERVAL = timedelta(minutes=1)
 
 SENSOR_TYPES = [
     SensorEntityDescription(
@@ -45,34 +68,107 @@ SENSOR_TYPES = [
     ),
 ]
 
+# Sensors describing a single room rather than the whole booking.
+ROOM_SENSOR_KEYS = {"roomStay", "checkInTime", "checkOutTime"}
 
-def hasBookingExpired(hass: HomeAssistant, expiry_date_raw: str) -> bool:
-    """Check if booking has expired."""
-    user_timezone = dt_util.get_time_zone(hass.config.time_zone)
+PROXIMITY_SENSOR_TYPES = [
+    SensorEntityDescription(
+        key="distance",
+        name="Distance",
+        icon="mdi:map-marker-distance",
+        device_class=SensorDeviceClass.DISTANCE,
+        native_unit_of_measurement=UnitOfLength.METERS,
+        suggested_unit_of_measurement=UnitOfLength.KILOMETERS,
+    ),
+    SensorEntityDescription(
+        key="direction",
+        name="Direction",
+        icon="mdi:compass-outline",
+        device_class=SensorDeviceClass.ENUM,
+        options=[
+            PROXIMITY_ARRIVED,
+            PROXIMITY_TOWARDS,
+            PROXIMITY_AWAY_FROM,
+            PROXIMITY_STATIONARY,
+        ],
+    ),
+]
 
-    dt_utc = datetime.strptime(expiry_date_raw, "%Y-%m-%dT%H:%M:%S").replace(
-        tzinfo=user_timezone
-    )
-    # Convert the datetime to the default timezone
-    expiry_date = dt_utc.astimezone(user_timezone)
+PRICE_SENSOR_TYPES = [
+    SensorEntityDescription(
+        key="totalCost",
+        name="Total Cost",
+        icon="mdi:cash",
+        device_class=SensorDeviceClass.MONETARY,
+        state_class=SensorStateClass.TOTAL,
+    ),
+    SensorEntityDescription(
+        key="previousTotal",
+        name="Previous Total",
+        icon="mdi:cash-refund",
+        device_class=SensorDeviceClass.MONETARY,
+        state_class=SensorStateClass.TOTAL,
+    ),
+    SensorEntityDescription(
+        key="newTotal",
+        name="New Total",
+        icon="mdi:cash-plus",
+        device_class=SensorDeviceClass.MONETARY,
+        state_class=SensorStateClass.TOTAL,
+    ),
+    SensorEntityDescription(
+        key="balanceOutstanding",
+        name="Balance Outstanding",
+        icon="mdi:cash-clock",
+        device_class=SensorDeviceClass.MONETARY,
+        state_class=SensorStateClass.TOTAL,
+    ),
+    SensorEntityDescription(
+        key="roomPrice",
+        name="Room Price",
+        icon="mdi:bed-double",
+        device_class=SensorDeviceClass.MONETARY,
+        state_class=SensorStateClass.TOTAL,
+    ),
+]
 
+API_SENSOR_TYPE = SensorEntityDescription(
+    key="api_requests",
+    name="Premier Inn API requests",
+    icon="mdi:api",
+    entity_category=EntityCategory.DIAGNOSTIC,
+    state_class=SensorStateClass.TOTAL_INCREASING,
+)
+
+STAYS_SENSOR_TYPE = SensorEntityDescription(
+    key="upcoming_stays",
+    name="Premier Inn upcoming stays",
+    icon="mdi:bed-clock",
+)
+
+
+def hasBookingExpired(expiry_date: datetime) -> bool:
+    """Check if booking has expired."""
     return (expiry_date.timestamp() - datetime.today().timestamp()) <= 0
 
 
-async def removeBooking(hass: HomeAssistant, booking_reference: str):
-    """Remove expired booking."""
-    entry = next(
-        (
-            entry
-            for entry in hass.config_entries.async_entries(DOMAIN)
-            if entry.data.get(CONF_RES_NO) == booking_reference
-        ),
-        None,
+async def async_setup_platform(
+    hass: HomeAssistant,
+    config: ConfigType,
+    async_add_entities: AddEntitiesCallback,
+    discovery_info: DiscoveryInfoType | None = None,
+) -> None:
+    """Set up the integration-wide sensors."""
+    if discovery_info is None:
+        return
+
+    async_add_entities(
+        [
+            PremierInnApiSensor(hass.data[DATA_INSTRUMENTATION], API_SENSOR_TYPE),
+            PremierInnStaysSensor(hass.data[DATA_STAYS], STAYS_SENSOR_TYPE),
+        ]
     )
 
-    # Remove the config entry
-    await hass.config_entries.async_remove(entry.entry_id)
-
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -85,29 +181,93 @@ async def async_setup_entry(
     if entry.options:
         config.update(entry.options)
 
-    if entry.data:
-        session = async_get_clientsession(hass)
+    coordinator: PremierInnCoordinator = hass.data[DATA_COORDINATORS][entry.entry_id]
+    name = entry.data[CONF_RES_NO]
 
-        coordinator = PremierInnCoordinator(hass, session, entry.data)
+    if coordinator.booking is not None and hasBookingExpired(
+        coordinator.booking.check_out
+    ):
+        hass.data[DATA_SWEEPER].async_request_purge()
+        return
 
-        await coordinator.async_refresh()
+    # Entities start unavailable and fill in once the booking has data.
+    async_add_entities(
+        PremierInnSensor(coordinator, name, description) for description in SENSOR_TYPES
+    )
 
-        name = entry.data[CONF_RES_NO]
+    stays: PremierInnStays = hass.data[DATA_STAYS]
+    entry.async_on_unload(stays.async_add_booking(name, coordinator))
 
-        room_stay = coordinator.data.get(CONF_BOOKING_CONFIRMATION)[
-            "reservationByIdList"
-        ][0]["roomStay"]
+    prices: PremierInnPriceHistory = hass.data[DATA_PRICES]
+    entry.async_on_unload(prices.async_add_booking(name, coordinator))
+    async_add_entities(
+        PremierInnPriceSensor(prices, coordinator, name, description)
+        for description in PRICE_SENSOR_TYPES
+    )
 
-        check_out_time = f"{room_stay['departureDate']}T{room_stay['checkOutTime']}:00"
+    proximity: PremierInnProximity = hass.data[DATA_PROXIMITY]
+    async_add_entities(
+        PremierInnProximitySensor(
+            proximity, entry.entry_id, coordinator, name, description
+        )
+        for description in PROXIMITY_SENSOR_TYPES
+    )
 
-        if hasBookingExpired(hass, check_out_time):
-            await removeBooking(hass, name)
-        else:
-            sensors = [
-                PremierInnSensor(coordinator, name, description)
-                for description in SENSOR_TYPES
-            ]
-            async_add_entities(sensors, update_before_add=True)
+    @callback
+    def async_booking_ready() -> CALLBACK_TYPE | None:
+        """Name the hotel and measure the distance to it once it is known."""
+        hotel_info = coordinator.data.get(CONF_HOTEL_INFORMATION) or {}
+
+        # Entities added before the booking had data left the model unset.
+        device_registry = dr.async_get(hass)
+        device = device_registry.async_get_device(identifiers={(DOMAIN, f"{name}")})
+        if device is not None and hotel_info.get("name"):
+            device_registry.async_update_device(device.id, model=hotel_info["name"])
+
+        if (coordinates := hotel_info.get("coordinates")) is None:
+            return None
+        return proximity.async_add_booking(
+            entry.entry_id,
+            hotel_info[CONF_HOTEL_ID],
+            coordinates["latitude"],
+            coordinates["longitude"],
+        )
+
+    entry.async_on_unload(coordinator.async_when_ready(async_booking_ready))
+
+    room_indexes = {0}
+
+    @callback
+    def async_add_rooms() -> None:
+        """Add sensors for every further room of a multi-room booking."""
+        if coordinator.booking is None:
+            return
+        rooms = [
+            room for room in coordinator.booking.rooms if room.index not in room_indexes
+        ]
+        room_indexes.update(room.index for room in rooms)
+        async_add_entities(
+            PremierInnSensor(coordinator, name, description, room.index)
+            for room in rooms
+            for description in SENSOR_TYPES
+            if description.key in ROOM_SENSOR_KEYS
+        )
+
+    async_add_rooms()
+    entry.async_on_unload(coordinator.async_add_listener(async_add_rooms))
+
+
+def booking_device_info(coordinator: PremierInnCoordinator, name: str) -> DeviceInfo:
+    """Return the device of a booking, naming the hotel once it is known."""
+    device_info = DeviceInfo(
+        identifiers={(DOMAIN, f"{name}")},
+        manufacturer="Premier Inn",
+        name=name.upper(),
+        configuration_url="https://github.com/jampez77/PremierInn/",
+    )
+    if coordinator.data:
+        device_info["model"] = coordinator.data.get(CONF_HOTEL_INFORMATION)["name"]
+    return device_info
 
 
 class PremierInnSensor(CoordinatorEntity[PremierInnCoordinator], SensorEntity):
@@ -118,70 +278,56 @@ class PremierInnSensor(CoordinatorEntity[PremierInnCoordinator], SensorEntity):
         coordinator: PremierInnCoordinator,
         name: str,
         description: SensorEntityDescription,
+        room_index: int = 0,
     ) -> None:
         """Initialize."""
         super().__init__(coordinator)
         self.data = coordinator.data
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, f"{name}")},
-            manufacturer="Premier Inn",
-            model=self.data.get(CONF_HOTEL_INFORMATION)["name"],
-            name=name.upper(),
-            configuration_url="https://github.com/jampez77/PremierInn/",
-        )
-        self._attr_unique_id = f"{DOMAIN}-{name}-{description.key}".lower()
-        self.entity_id = f"sensor.{DOMAIN}_{name}_{description.key}".lower()
+        self.booking_name = name
+        self.room_index = room_index
+        self._attr_device_info = booking_device_info(coordinator, name)
+        key = description.key
+        if room_index:
+            key = f"{key}_room_{room_index + 1}"
+        self._attr_unique_id = f"{DOMAIN}-{name}-{key}".lower()
+        self.entity_id = f"sensor.{DOMAIN}_{name}_{key}".lower()
         self.attrs: dict[str, Any] = {}
         self.entity_description = description
         self.name = self.entity_description.name
+        if room_index:
+            self.name = f"{self.name} Room {room_index + 1}"
         self._state = None
 
+    @timed
     def update_from_coordinator(self):
         """Update sensor state and attributes from coordinator data."""
-        room_stay = self.data.get(CONF_BOOKING_CONFIRMATION)["reservationByIdList"][0][
-            "roomStay"
-        ]
-
-        check_out_time = f"{room_stay['departureDate']}T{room_stay['checkOutTime']}:00"
-
-        if hasBookingExpired(self.hass, check_out_time):
-            self.hass.async_add_job(removeBooking(self.hass, self.name))
+        self.data = self.coordinator.data
+        booking = self.coordinator.booking
+        room = booking.room(self.room_index) if booking is not None else None
+
+        if booking is None or room is None:
+            self._state = None
+        elif hasBookingExpired(booking.check_out):
+            self.hass.data[DATA_SWEEPER].async_request_purge()
         else:
             value = self.data.get(self.entity_description.key)
 
             if self.entity_description.key == "roomStay":
-                room_stay = self.data.get(CONF_BOOKING_CONFIRMATION)[
-                    "reservationByIdList"
-                ][0]["roomStay"]
-
-                value = room_stay["roomExtraInfo"]["roomName"]
+                value = room.name
 
             if self.entity_description.key == "hotelInformation":
                 value = self.data.get(CONF_HOTEL_INFORMATION)["name"]
 
-            if self.entity_description.device_class == SensorDeviceClass.TIMESTAMP:
-                room_stay = self.data.get(CONF_BOOKING_CONFIRMATION)[
-                    "reservationByIdList"
-                ][0]["roomStay"]
-
-                if self.entity_description.key == "checkInTime":
-                    value = f"{room_stay['arrivalDate']}T{room_stay['checkInTime']}:00"
-                elif self.entity_description.key == "checkOutTime":
-                    value = (
-                        f"{room_stay['departureDate']}T{room_stay['checkOutTime']}:00"
-                    )
-
-                user_timezone = dt_util.get_time_zone(self.hass.config.time_zone)
-
-                dt_utc = datetime.strptime(value, "%Y-%m-%dT%H:%M:%S").replace(
-                    tzinfo=user_timezone
-                )
-                # Convert the datetime to the default timezone
-                value = dt_utc.astimezone(user_timezone)
+            if self.entity_description.key == "checkInTime":
+                value = room.check_in
+            elif self.entity_description.key == "checkOutTime":
+                value = room.check_out
 
             self._state = value
 
-            if self.entity_description.key == "roomStay":
+            if self.room_index:
+                value = room.reservation
+            elif self.entity_description.key == "roomStay":
                 value = self.data.get(CONF_BOOKING_CONFIRMATION)
             else:
                 value = self.data.get(self.entity_description.key)
@@ -203,7 +349,9 @@ class PremierInnSensor(CoordinatorEntity[PremierInnCoordinator], SensorEntity):
     async def async_added_to_hass(self) -> None:
         """Handle adding to Home Assistant."""
         await super().async_added_to_hass()
-        await self.async_update()
+        # Refreshes are left to the scheduler, so only read the current data.
+        if self.coordinator.data:
+            self.update_from_coordinator()
 
     async def async_remove(self) -> None:
         """Handle the removal of the entity."""
@@ -221,7 +369,174 @@ class PremierInnSensor(CoordinatorEntity[PremierInnCoordinator], SensorEntity):
         """Native value."""
         return self._state
 
+    @property
+    @timed
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Define entity attributes."""
+        return self.attrs
+
+
+class PremierInnPriceSensor(CoordinatorEntity[PremierInnCoordinator], SensorEntity):
+    """Define a sensor for one of the prices of a booking."""
+
+    def __init__(
+        self,
+        prices: PremierInnPriceHistory,
+        coordinator: PremierInnCoordinator,
+        name: str,
+        description: SensorEntityDescription,
+    ) -> None:
+        """Initialize."""
+        super().__init__(coordinator)
+        self.prices = prices
+        self.booking_name = name
+        self._attr_device_info = booking_device_info(coordinator, name)
+        self._attr_unique_id = f"{DOMAIN}-{name}-{description.key}".lower()
+        self.entity_id = f"sensor.{DOMAIN}_{name}_{description.key}".lower()
+        self.entity_description = description
+        self.name = self.entity_description.name
+
+    @property
+    def available(self) -> bool:
+        """Return True if entity is available."""
+        return super().available and self.coordinator.booking is not None
+
+    @property
+    def native_value(self) -> float | None:
+        """Native value."""
+        if (row := price_row(self.coordinator)) is None:
+            return None
+        value = row[PRICE_FIELDS.index(self.entity_description.key)]
+        return None if math.isnan(value) else value
+
+    @property
+    def native_unit_of_measurement(self) -> str | None:
+        """Return the currency of the booking."""
+        if not self.coordinator.data:
+            return None
+        return self.coordinator.data[CONF_BOOKING_CONFIRMATION].get("currencyCode")
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Define entity attributes."""
+        previous, changed = self.prices.previous(
+            self.booking_name, self.entity_description.key
+        )
+        return {
+            "previous": previous,
+            "changed": dt_util.utc_from_timestamp(changed) if changed else None,
+        }
+
+
+class PremierInnProximitySensor(SensorEntity):
+    """Define a sensor for the distance between travellers and the hotel."""
+
+    _attr_should_poll = False
+
+    def __init__(
+        self,
+        proximity: PremierInnProximity,
+        entry_id: str,
+        coordinator: PremierInnCoordinator,
+        name: str,
+        description: SensorEntityDescription,
+    ) -> None:
+        """Initialize."""
+        self.proximity = proximity
+        self.entry_id = entry_id
+        self._attr_device_info = booking_device_info(coordinator, name)
+        self._attr_unique_id = f"{DOMAIN}-{name}-{description.key}".lower()
+        self.entity_id = f"sensor.{DOMAIN}_{name}_{description.key}".lower()
+        self.entity_description = description
+        self.name = self.entity_description.name
+
+    async def async_added_to_hass(self) -> None:
+        """Handle adding to Home Assistant."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            self.proximity.async_add_listener(self.entry_id, self.async_write_ha_state)
+        )
+
+    @property
+    def native_value(self) -> float | str | None:
+        """Native value."""
+        data = self.proximity.get(self.entry_id)
+        if data is None:
+            return None
+        if self.entity_description.key == "distance":
+            return data.distance
+        return data.direction
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Define entity attributes."""
+        data = self.proximity.get(self.entry_id)
+        if data is None:
+            return {}
+        return {"nearest": data.nearest, "arrived": data.arrived}
+
+
+class PremierInnApiSensor(SensorEntity):
+    """Define a sensor summarising the requests made to the Premier Inn API."""
+
+    def __init__(
+        self,
+        instrumentation: PremierInnInstrumentation,
+        description: SensorEntityDescription,
+    ) -> None:
+        """Initialize."""
+        self.instrumentation = instrumentation
+        self._attr_unique_id = f"{DOMAIN}-{description.key}".lower()
+        self.entity_id = f"sensor.{DOMAIN}_{description.key}".lower()
+        self.entity_description = description
+        self._attr_name = description.name
+        self._attr_native_value = 0
+        self.attrs: dict[str, Any] = {}
+
+    async def async_update(self) -> None:
+        """Summarise the request statistics per operation."""
+        summary = self.instrumentation.summary()
+        self._attr_native_value = sum(stats.requests for stats in summary.values())
+        self.attrs = {
+            operation: {
+                key: value
+                for key, value in stats.as_dict().items()
+                if key not in ("histogram", "statuses")
+            }
+            for operation, stats in summary.items()
+        }
+
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Define entity attributes."""
         return self.attrs
+
+
+class PremierInnStaysSensor(SensorEntity):
+    """Define a sensor summarising the upcoming and current stays."""
+
+    _attr_should_poll = False
+
+    def __init__(
+        self, stays: PremierInnStays, description: SensorEntityDescription
+    ) -> None:
+        """Initialize."""
+        self.stays = stays
+        self._attr_unique_id = f"{DOMAIN}-{description.key}".lower()
+        self.entity_id = f"sensor.{DOMAIN}_{description.key}".lower()
+        self.entity_description = description
+        self._attr_name = description.name
+
+    async def async_added_to_hass(self) -> None:
+        """Write the state whenever the stays change."""
+        self.async_on_remove(self.stays.async_add_listener(self.async_write_ha_state))
+
+    @property
+    def native_value(self) -> int:
+        """Return the number of stays yet to check in."""
+        return self.stays.upcoming
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Define entity attributes."""
+        return self.stays.as_dict()
@@ -1,20 +1,29 @@
 """Premier Inn services platform."""
 
+import asyncio
 from datetime import datetime
 import functools
 
 import voluptuous as vol
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CONF_ENTITY_ID
-from homeassistant.core import HomeAssistant, ServiceCall
-from homeassistant.exceptions import HomeAssistantError
+from homeassistant.const import CONF_ENTITY_ID, CONF_PATH
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+)
+from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
 from homeassistant.helpers import config_validation as cv
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
+from .api import async_get_api_client
+from .calendars import async_get_calendar_index
 from .const import (
     CONF_ADD_BOOKING,
     CONF_ARRIVAL_DATE,
+    CONF_AUTO,
+    CONF_BASKET_REFERENCE,
     CONF_CALENDARS,
     CONF_COUNTRY,
     CONF_CREATE_CALENDAR,
@@ -22,12 +31,29 @@ from .const import (
     CONF_GB,
     CONF_GERMANY,
     CONF_GREAT_BRITAIN,
+    CONF_IMPORT_HOTELS,
     CONF_LAST_NAME,
+    CONF_PROFILE,
+    CONF_PURGE_EXPIRED,
+    CONF_REFRESH,
     CONF_REMOVE_BOOKING,
     CONF_RES_NO,
+    CONF_SEARCH_WINDOW,
+    CONF_SECONDS,
+    CONF_TOP,
+    COUNTRIES,
+    DATA_CATALOGUE,
+    DATA_COORDINATORS,
+    DATA_PROFILER,
+    DATA_SWEEPER,
     DOMAIN,
+    LOOKUP_MAX_WINDOW,
+    PROFILE_MAX_SECONDS,
+    PROFILE_SECONDS,
+    PROFILE_TOP,
 )
 from .coordinator import PremierInnCoordinator
+from .lookup import async_locate_booking
 
 # Define the schema for your service
 SERVICE_ADD_BOOKING_SCHEMA = vol.Schema(
@@ -38,7 +64,10 @@ SERVICE_ADD_BOOKING_SCHEMA = vol.Schema(
         vol.Required(CONF_LAST_NAME): cv.string,
         vol.Required(CONF_RES_NO): cv.string,
         vol.Required(CONF_COUNTRY, default=CONF_GREAT_BRITAIN): vol.In(
-            [CONF_GREAT_BRITAIN, CONF_GERMANY]
+            [CONF_GREAT_BRITAIN, CONF_GERMANY, CONF_AUTO]
+        ),
+        vol.Optional(CONF_SEARCH_WINDOW, default=0): vol.All(
+            vol.Coerce(int), vol.Range(min=0, max=LOOKUP_MAX_WINDOW)
         ),
     }
 )
@@ -49,13 +78,38 @@ SERVICE_REMOVE_BOOKING_SCHEMA = vol.Schema(
     }
 )
 
+SERVICE_REFRESH_SCHEMA = vol.Schema(
+    {
+        vol.Optional(CONF_RES_NO): vol.All(cv.ensure_list, [cv.string]),
+    }
+)
+
+SERVICE_PURGE_EXPIRED_SCHEMA = vol.Schema({})
+
+SERVICE_PROFILE_SCHEMA = vol.Schema(
+    {
+        vol.Optional(CONF_SECONDS, default=PROFILE_SECONDS): vol.All(
+            vol.Coerce(float), vol.Range(min=1, max=PROFILE_MAX_SECONDS)
+        ),
+        vol.Optional(CONF_TOP, default=PROFILE_TOP): vol.All(
+            vol.Coerce(int), vol.Range(min=1)
+        ),
+    }
+)
+
+SERVICE_IMPORT_HOTELS_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_PATH): cv.string,
+    }
+)
+
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Premier Inn from a config entry."""
 
     # Create a coordinator or other necessary components
-    session = async_get_clientsession(hass)
-    coordinator = PremierInnCoordinator(hass, session, entry.data)
+    client = async_get_api_client(hass)
+    coordinator = PremierInnCoordinator(hass, client, entry.data)
 
     # Store the coordinator so it can be accessed by other parts of the integration
     hass.data.setdefault(DOMAIN, {})
@@ -77,6 +131,10 @@ def async_cleanup_services(hass: HomeAssistant) -> None:
     """Cleanup Premier Inn services."""
     hass.services.async_remove(DOMAIN, CONF_ADD_BOOKING)
     hass.services.async_remove(DOMAIN, CONF_REMOVE_BOOKING)
+    hass.services.async_remove(DOMAIN, CONF_IMPORT_HOTELS)
+    hass.services.async_remove(DOMAIN, CONF_REFRESH)
+    hass.services.async_remove(DOMAIN, CONF_PROFILE)
+    hass.services.async_remove(DOMAIN, CONF_PURGE_EXPIRED)
 
 
 def async_setup_services(hass: HomeAssistant) -> None:
@@ -86,17 +144,45 @@ def async_setup_services(hass: HomeAssistant) -> None:
             CONF_ADD_BOOKING,
             functools.partial(add_booking, hass),
             SERVICE_ADD_BOOKING_SCHEMA,
+            SupportsResponse.NONE,
         ),
         (
             CONF_REMOVE_BOOKING,
             functools.partial(remove_booking, hass),
             SERVICE_REMOVE_BOOKING_SCHEMA,
+            SupportsResponse.NONE,
+        ),
+        (
+            CONF_IMPORT_HOTELS,
+            functools.partial(import_hotels, hass),
+            SERVICE_IMPORT_HOTELS_SCHEMA,
+            SupportsResponse.NONE,
+        ),
+        (
+            CONF_REFRESH,
+            functools.partial(refresh, hass),
+            SERVICE_REFRESH_SCHEMA,
+            SupportsResponse.OPTIONAL,
+        ),
+        (
+            CONF_PURGE_EXPIRED,
+            functools.partial(purge_expired, hass),
+            SERVICE_PURGE_EXPIRED_SCHEMA,
+            SupportsResponse.OPTIONAL,
+        ),
+        (
+            CONF_PROFILE,
+            functools.partial(profile, hass),
+            SERVICE_PROFILE_SCHEMA,
+            SupportsResponse.OPTIONAL,
         ),
     ]
-    for name, method, schema in services:
+    for name, method, schema, supports_response in services:
         if hass.services.has_service(DOMAIN, name):
             continue
-        hass.services.async_register(DOMAIN, name, method, schema=schema)
+        hass.services.async_register(
+            DOMAIN, name, method, schema=schema, supports_response=supports_response
+        )
 
 
 def get_country(data: dict) -> str:
@@ -131,9 +217,9 @@ async def add_booking(hass: HomeAssistant, call: ServiceCall) -> None:
     if create_calendar:
         calendar_entities["None"] = "Create a new calendar"
 
+    calendar_index = async_get_calendar_index(hass)
     for calendar in calendars:
-        calendar_entity = hass.states.get(calendar)
-        if calendar_entity:
+        if calendar in calendar_index:
             calendar_entities[calendar] = calendar
 
     entries = hass.config_entries.async_entries(DOMAIN)
@@ -144,6 +230,21 @@ async def add_booking(hass: HomeAssistant, call: ServiceCall) -> None:
     if any(entry.data.get(CONF_RES_NO) == booking_reference for entry in entries):
         raise HomeAssistantError(f"Booking {booking_reference} already exists.")
 
+    window = call.data[CONF_SEARCH_WINDOW]
+    basket_reference = None
+    if call.data[CONF_COUNTRY] == CONF_AUTO or window:
+        countries = (
+            list(COUNTRIES)
+            if call.data[CONF_COUNTRY] == CONF_AUTO
+            else [call.data[CONF_COUNTRY]]
+        )
+        found = await async_locate_booking(hass, call.data, countries, window)
+        if found is None:
+            raise HomeAssistantError(f"Booking {booking_reference} not found.")
+        country = get_country({CONF_COUNTRY: found[0]})
+        arrival_date = found[1]
+        basket_reference = found[2]
+
     # Initiate the config flow with the "import" step
     await hass.config_entries.flow.async_init(
         DOMAIN,
@@ -154,6 +255,7 @@ async def add_booking(hass: HomeAssistant, call: ServiceCall) -> None:
             CONF_LAST_NAME: surname,
             CONF_COUNTRY: country,
             CONF_CALENDARS: calendar_entities,
+            CONF_BASKET_REFERENCE: basket_reference,
         },
     )
 
@@ -174,3 +276,54 @@ async def remove_booking(hass: HomeAssistant, call: ServiceCall) -> None:
 
     # Remove the config entry
     await hass.config_entries.async_remove(entry.entry_id)
+
+
+async def import_hotels(hass: HomeAssistant, call: ServiceCall) -> None:
+    """Bulk-load hotel information into the hotel catalogue."""
+    path = call.data.get(CONF_PATH)
+
+    if not hass.config.is_allowed_path(path):
+        raise HomeAssistantError(f"Access to {path} is not allowed.")
+
+    await hass.data[DATA_CATALOGUE].async_import(path)
+
+
+async def refresh(hass: HomeAssistant, call: ServiceCall) -> ServiceResponse:
+    """Refresh some or all bookings now and return their summaries."""
+    coordinators: dict[str, PremierInnCoordinator] = {
+        coordinator.res_no.upper(): coordinator
+        for coordinator in hass.data[DATA_COORDINATORS].values()
+    }
+
+    if (booking_references := call.data.get(CONF_RES_NO)) is not None:
+        booking_references = [reference.upper() for reference in booking_references]
+        if unknown := [ref for ref in booking_references if ref not in coordinators]:
+            raise ServiceValidationError(f"Unknown booking {', '.join(unknown)}.")
+        coordinators = {ref: coordinators[ref] for ref in booking_references}
+
+    await asyncio.gather(
+        *(
+            coordinator.async_refresh_debounced()
+            for coordinator in coordinators.values()
+        )
+    )
+
+    return {
+        "bookings": {
+            reference: coordinator.summary()
+            for reference, coordinator in coordinators.items()
+        }
+    }
+
+
+async def profile(hass: HomeAssistant, call: ServiceCall) -> ServiceResponse:
+    """Profile the integration's callbacks and write a stats file."""
+    path = await hass.data[DATA_PROFILER].async_profile(
+        call.data[CONF_SECONDS], call.data[CONF_TOP]
+    )
+    return {"path": path}
+
+
+async def purge_expired(hass: HomeAssistant, call: ServiceCall) -> ServiceResponse:
+    """Remove every expired booking and the calendar events added for it."""
+    return {"purged": await hass.data[DATA_SWEEPER].async_purge()}
@@ -0,0 +1,211 @@
+"""Premier Inn upcoming stays across every booking."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import date, datetime
+import heapq
+import itertools
+from typing import Any
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_track_point_in_utc_time
+from homeassistant.util import dt as dt_util
+
+from .const import CONF_HOTEL_INFORMATION
+from .coordinator import PremierInnCoordinator
+
+STAY_UPCOMING = "upcoming"
+STAY_CURRENT = "current"
+STAY_ENDED = "ended"
+
+
+@dataclass(frozen=True)
+class Stay:
+    """Dates and hotel of one booking."""
+
+    booking: str
+    hotel: str | None
+    check_in: datetime
+    check_out: datetime
+
+    def nights_in(self, start: date, end: date) -> int:
+        """Return the nights of the stay between two dates."""
+        first = max(dt_util.as_local(self.check_in).date(), start)
+        last = min(dt_util.as_local(self.check_out).date(), end)
+        return max((last - first).days, 0)
+
+
+def stay_from(booking: str, coordinator: PremierInnCoordinator) -> Stay | None:
+    """Return the stay of a booking, if it has data."""
+    if not coordinator.data or coordinator.booking is None:
+        return None
+    hotel_info = coordinator.data.get(CONF_HOTEL_INFORMATION) or {}
+    return Stay(
+        booking,
+        hotel_info.get("name"),
+        coordinator.booking.check_in,
+        coordinator.booking.check_out,
+    )
+
+
+def month_bounds(today: date) -> tuple[date, date]:
+    """Return the first day of this month and of the next."""
+    start = today.replace(day=1)
+    if start.month == 12:
+        return start, start.replace(year=start.year + 1, month=1)
+    return start, start.replace(month=start.month + 1)
+
+
+class PremierInnStays:
+    """Keep the next and current stays of every booking.
+
+    Stays wait in a heap ordered by check in and move to a heap ordered by
+    check out once they start, so each change costs O(log n). Entries left
+    behind by changed or removed bookings are skipped when they surface.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize."""
+        self.hass = hass
+        self._stays: dict[str, Stay] = {}
+        self._stamps: dict[str, int] = {}
+        self._where: dict[str, str] = {}
+        self._upcoming: list[tuple[datetime, int, str]] = []
+        self._current: list[tuple[datetime, int, str]] = []
+        self._counter = itertools.count()
+        self.upcoming = 0
+        self._month: tuple[date, date] = month_bounds(dt_util.now().date())
+        self._nights: dict[str, int] = {}
+        self.nights_this_month = 0
+        self._listeners: list[CALLBACK_TYPE] = []
+        self._unsub_timer: CALLBACK_TYPE | None = None
+
+    @callback
+    def async_add_listener(self, update_callback: CALLBACK_TYPE) -> CALLBACK_TYPE:
+        """Call back whenever the summary changes."""
+        self._listeners.append(update_callback)
+
+        @callback
+        def remove_listener() -> None:
+            self._listeners.remove(update_callback)
+
+        return remove_listener
+
+    @callback
+    def async_add_booking(
+        self, booking: str, coordinator: PremierInnCoordinator
+    ) -> CALLBACK_TYPE:
+        """Follow the stay of a booking as its coordinator updates."""
+
+        @callback
+        def async_update() -> None:
+            self._async_set(booking, stay_from(booking, coordinator))
+
+        async_update()
+        remove_listener = coordinator.async_add_listener(async_update)
+
+        @callback
+        def async_remove() -> None:
+            remove_listener()
+            self._async_set(booking, None)
+
+        return async_remove
+
+    @property
+    def next_stay(self) -> Stay | None:
+        """Return the stay that checks in next."""
+        return self._stays[self._upcoming[0][2]] if self._upcoming else None
+
+    @property
+    def current_stay(self) -> Stay | None:
+        """Return the current stay that checks out first."""
+        return self._stays[self._current[0][2]] if self._current else None
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the summary as state attributes."""
+        next_stay = self.next_stay
+        current_stay = self.current_stay
+        return {
+            "next_check_in": next_stay.check_in if next_stay else None,
+            "next_booking": next_stay.booking if next_stay else None,
+            "next_hotel": next_stay.hotel if next_stay else None,
+            "current_booking": current_stay.booking if current_stay else None,
+            "current_hotel": current_stay.hotel if current_stay else None,
+            "current_check_out": current_stay.check_out if current_stay else None,
+            "nights_this_month": self.nights_this_month,
+        }
+
+    @callback
+    def _async_set(self, booking: str, stay: Stay | None) -> None:
+        """Replace the stay of a booking, or forget it."""
+        if self._stays.get(booking) == stay:
+            return
+
+        if self._stays.pop(booking, None) is not None:
+            if self._where.pop(booking) == STAY_UPCOMING:
+                self.upcoming -= 1
+            self.nights_this_month -= self._nights.pop(booking)
+            del self._stamps[booking]
+
+        if stay is not None:
+            stamp = next(self._counter)
+            self._stays[booking] = stay
+            self._stamps[booking] = stamp
+            self._where[booking] = STAY_UPCOMING
+            self.upcoming += 1
+            heapq.heappush(self._upcoming, (stay.check_in, stamp, booking))
+            self._nights[booking] = stay.nights_in(*self._month)
+            self.nights_this_month += self._nights[booking]
+
+        self._async_advance()
+
+    def _is_stale(self, item: tuple[datetime, int, str]) -> bool:
+        """Return True if a heap entry belongs to a changed or removed stay."""
+        return self._stamps.get(item[2]) != item[1]
+
+    @callback
+    def _async_advance(self, *_: Any) -> None:
+        """Move stays on as they start and end, then tell the listeners."""
+        now = dt_util.utcnow()
+
+        if (month := month_bounds(dt_util.now().date())) != self._month:
+            self._month = month
+            self._nights = {
+                booking: stay.nights_in(*month) for booking, stay in self._stays.items()
+            }
+            self.nights_this_month = sum(self._nights.values())
+
+        while self._upcoming and (
+            self._is_stale(self._upcoming[0]) or self._upcoming[0][0] <= now
+        ):
+            item = heapq.heappop(self._upcoming)
+            if self._is_stale(item):
+                continue
+            booking = item[2]
+            self.upcoming -= 1
+            self._where[booking] = STAY_CURRENT
+            heapq.heappush(
+                self._current, (self._stays[booking].check_out, item[1], booking)
+            )
+
+        while self._current and (
+            self._is_stale(self._current[0]) or self._current[0][0] <= now
+        ):
+            item = heapq.heappop(self._current)
+            if not self._is_stale(item):
+                self._where[item[2]] = STAY_ENDED
+
+        # Wake up for the next check in, check out or month.
+        if self._unsub_timer is not None:
+            self._unsub_timer()
+        wake_up = dt_util.as_utc(dt_util.start_of_local_day(self._month[1]))
+        for heap in (self._upcoming, self._current):
+            if heap:
+                wake_up = min(wake_up, dt_util.as_utc(heap[0][0]))
+        self._unsub_timer = async_track_point_in_utc_time(
+            self.hass, self._async_advance, wake_up
+        )
+
+        for update_callback in list(self._listeners):
+            update_callback()
@@ -0,0 +1,210 @@
+"""Premier Inn sweeper for expired bookings."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime, timedelta
+import logging
+
+from homeassistant.components.calendar import (
+    DOMAIN as CALENDAR_DOMAIN,
+    CalendarEntity,
+    CalendarEntityFeature,
+    CalendarEvent,
+)
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.util import dt as dt_util
+
+from .calendar import generate_uuid_from_json, record_calendar_call
+from .const import (
+    CONF_ARRIVAL_DATE,
+    CONF_CALENDARS,
+    CONF_RES_NO,
+    DATA_COORDINATORS,
+    DOMAIN,
+    PURGE_BATCH_SIZE,
+    PURGE_CONCURRENCY,
+    PURGE_GRACE_DAYS,
+    PURGE_INTERVAL,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def arrival_date(entry: ConfigEntry) -> datetime | None:
+    """Return the start of a booking's arrival day."""
+    if (day := dt_util.parse_date(entry.data.get(CONF_ARRIVAL_DATE) or "")) is None:
+        return None
+    return dt_util.start_of_local_day(day)
+
+
+def event_booking(event: CalendarEvent) -> str | None:
+    """Return the booking reference of an event added by the integration."""
+    parts = (event.description or "").split("|")
+    if len(parts) < 2 or parts[0] != "PremierInn":
+        return None
+    return parts[1].upper()
+
+
+def event_uid(calendar: str, event: CalendarEvent) -> str:
+    """Return the id the integration recorded when it added an event."""
+    return generate_uuid_from_json(
+        {
+            "entity_id": calendar,
+            "start_date_time": event.start,
+            "end_date_time": event.end,
+            "summary": event.summary,
+            "description": f"{event.description}",
+            "location": f"{event.location}",
+        }
+    )
+
+
+class PremierInnSweeper:
+    """Remove expired bookings together with the events added for them.
+
+    Expired bookings are found in one pass, each calendar is searched once for
+    all of their events, and the entries are removed a few at a time.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize."""
+        self.hass = hass
+        self._lock = asyncio.Lock()
+        self._task: asyncio.Task | None = None
+
+    @callback
+    def async_start(self) -> CALLBACK_TYPE:
+        """Sweep for expired bookings periodically."""
+        return async_track_time_interval(
+            self.hass, self._async_sweep, timedelta(seconds=PURGE_INTERVAL)
+        )
+
+    async def _async_sweep(self, now: datetime) -> None:
+        """Purge whatever expired since the last sweep."""
+        await self.async_purge()
+
+    @callback
+    def async_request_purge(self) -> None:
+        """Purge soon, however many bookings or entities asked for it."""
+        if self._task is None or self._task.done():
+            self._task = self.hass.async_create_background_task(
+                self.async_purge(), f"{DOMAIN} purge expired"
+            )
+
+    @callback
+    def expired_entries(self) -> list[ConfigEntry]:
+        """Return the entries of every booking that has checked out."""
+        now = dt_util.now()
+        coordinators = self.hass.data[DATA_COORDINATORS]
+        expired = []
+        for entry in self.hass.config_entries.async_entries(DOMAIN):
+            coordinator = coordinators.get(entry.entry_id)
+            if coordinator is not None and coordinator.booking is not None:
+                if coordinator.booking.check_out <= now:
+                    expired.append(entry)
+                continue
+
+            # Bookings that never load are given up on a while after arrival.
+            arrival = arrival_date(entry)
+            if arrival is not None and now - arrival > timedelta(days=PURGE_GRACE_DAYS):
+                expired.append(entry)
+        return expired
+
+    async def async_purge(self) -> list[str]:
+        """Remove every expired booking and return their references."""
+        async with self._lock:
+            if not (entries := self.expired_entries()):
+                return []
+
+            await self._async_delete_events(entries)
+
+            semaphore = asyncio.Semaphore(PURGE_CONCURRENCY)
+
+            async def async_remove(entry: ConfigEntry) -> None:
+                async with semaphore:
+                    await self.hass.config_entries.async_remove(entry.entry_id)
+
+            await asyncio.gather(*(async_remove(entry) for entry in entries))
+
+        purged = [entry.data[CONF_RES_NO] for entry in entries]
+        _LOGGER.info("Removed expired bookings %s", ", ".join(purged))
+        return purged
+
+    async def _async_delete_events(self, entries: list[ConfigEntry]) -> None:
+        """Delete the calendar events added for the given bookings."""
+        component = self.hass.data.get(CALENDAR_DOMAIN)
+        if component is None:
+            return
+
+        bookings: dict[str, list[ConfigEntry]] = {}
+        for entry in entries:
+            if not entry.data.get("uids"):
+                continue
+            for calendar in entry.data.get(CONF_CALENDARS, []):
+                if calendar != "None":
+                    bookings.setdefault(calendar, []).append(entry)
+        if not bookings:
+            return
+
+        now = dt_util.now()
+        start = min(
+            (arrival for entry in entries if (arrival := arrival_date(entry))),
+            default=now,
+        ) - timedelta(days=1)
+        end = now + timedelta(days=1)
+
+        for calendar, calendar_entries in bookings.items():
+            entity: CalendarEntity | None = component.get_entity(calendar)
+            if (
+                entity is None
+                or not (entity.supported_features or 0)
+                & CalendarEntityFeature.DELETE_EVENT
+            ):
+                continue
+
+            try:
+                events = await entity.async_get_events(self.hass, start, end)
+            except HomeAssistantError as err:
+                record_calendar_call(self.hass, "get_events", False)
+                _LOGGER.warning("Unable to read %s: %s", calendar, err)
+                continue
+            record_calendar_call(self.hass, "get_events", True)
+
+            uids = {uid for entry in calendar_entries for uid in entry.data["uids"]}
+            references = {entry.data[CONF_RES_NO].upper() for entry in calendar_entries}
+            matched = [
+                event
+                for event in events
+                if event.uid
+                and (
+                    event_booking(event) in references
+                    or event_uid(calendar, event) in uids
+                )
+            ]
+
+            for index in range(0, len(matched), PURGE_BATCH_SIZE):
+                batch = matched[index : index + PURGE_BATCH_SIZE]
+                results = await asyncio.gather(
+                    *(
+                        entity.async_delete_event(
+                            event.uid, recurrence_id=event.recurrence_id
+                        )
+                        for event in batch
+                    ),
+                    return_exceptions=True,
+                )
+                for event, result in zip(batch, results):
+                    record_calendar_call(
+                        self.hass, "delete_event", not isinstance(result, Exception)
+                    )
+                    if isinstance(result, Exception):
+                        _LOGGER.warning(
+                            "Unable to delete %s from %s: %s",
+                            event.summary,
+                            calendar,
+                            result,
+                        )
@@ -0,0 +1,146 @@
+"""Premier Inn WebSocket API."""
+
+from __future__ import annotations
+
+import functools
+from typing import Any
+
+import voluptuous as vol
+
+from homeassistant.components import websocket_api
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+
+from .const import DATA_COORDINATORS, DOMAIN, SIGNAL_BOOKINGS_CHANGED
+from .coordinator import PremierInnCoordinator
+
+
+def booking_model(coordinator: PremierInnCoordinator) -> dict[str, Any]:
+    """Return the parsed booking with the details of each room."""
+    model = coordinator.summary()
+    if coordinator.booking is None:
+        return model
+
+    model["rooms"] = [
+        {
+            "reservation_id": room.reservation_id,
+            "name": room.name,
+            "check_in": room.check_in,
+            "check_out": room.check_out,
+            "adults": room.room_stay.get("adultsNumber"),
+            "children": room.room_stay.get("childrenNumber"),
+            "price": room.room_stay.get("roomPrice"),
+            "status": room.reservation.get("reservationStatus"),
+        }
+        for room in coordinator.booking.rooms
+    ]
+    return model
+
+
+def flatten(value: Any, prefix: str = "") -> dict[str, Any]:
+    """Return the leaves of a model keyed by their dotted path."""
+    if isinstance(value, dict):
+        items = value.items()
+    elif isinstance(value, list):
+        items = enumerate(value)
+    else:
+        return {prefix: value}
+
+    fields: dict[str, Any] = {}
+    for key, item in items:
+        fields.update(flatten(item, f"{prefix}.{key}" if prefix else str(key)))
+    return fields
+
+
+@callback
+def async_register_websocket_commands(hass: HomeAssistant) -> None:
+    """Register the WebSocket commands."""
+    websocket_api.async_register_command(hass, ws_subscribe)
+
+
+@websocket_api.websocket_command({vol.Required("type"): f"{DOMAIN}/subscribe"})
+@callback
+def ws_subscribe(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Send a snapshot of every booking, then only the fields that change."""
+    msg_id = msg["id"]
+    fields: dict[str, dict[str, Any]] = {}
+    references: dict[str, str] = {}
+    unsubs: dict[str, CALLBACK_TYPE] = {}
+
+    @callback
+    def async_send(message: dict[str, Any]) -> None:
+        connection.send_message(websocket_api.event_message(msg_id, message))
+
+    @callback
+    def async_update(entry_id: str, coordinator: PremierInnCoordinator) -> None:
+        """Send the fields of a booking that changed with its update."""
+        old = fields[entry_id]
+        new = fields[entry_id] = flatten(booking_model(coordinator))
+        changed = {
+            key: value
+            for key, value in new.items()
+            if key not in old or old[key] != value
+        }
+        removed = [key for key in old if key not in new]
+        if changed or removed:
+            async_send(
+                {
+                    "type": "delta",
+                    "booking": references[entry_id],
+                    "changed": changed,
+                    "removed": removed,
+                }
+            )
+
+    @callback
+    def async_sync(initial: bool = False) -> None:
+        """Follow bookings that were added and drop those that were removed."""
+        coordinators: dict[str, PremierInnCoordinator] = hass.data[DATA_COORDINATORS]
+
+        for entry_id in [key for key in unsubs if key not in coordinators]:
+            unsubs.pop(entry_id)()
+            del fields[entry_id]
+            async_send({"type": "removed", "booking": references.pop(entry_id)})
+
+        for entry_id, coordinator in coordinators.items():
+            if entry_id in unsubs:
+                continue
+            references[entry_id] = coordinator.res_no.upper()
+            fields[entry_id] = flatten(booking_model(coordinator))
+            unsubs[entry_id] = coordinator.async_add_listener(
+                functools.partial(async_update, entry_id, coordinator)
+            )
+            if not initial:
+                async_send(
+                    {
+                        "type": "added",
+                        "booking": references[entry_id],
+                        "fields": fields[entry_id],
+                    }
+                )
+
+    async_sync(initial=True)
+    unsub_signal = async_dispatcher_connect(hass, SIGNAL_BOOKINGS_CHANGED, async_sync)
+
+    @callback
+    def async_unsubscribe() -> None:
+        unsub_signal()
+        for unsub in unsubs.values():
+            unsub()
+        unsubs.clear()
+
+    connection.subscriptions[msg_id] = async_unsubscribe
+    connection.send_result(msg_id)
+    async_send(
+        {
+            "type": "snapshot",
+            "bookings": {
+                references[entry_id]: booking_fields
+                for entry_id, booking_fields in fields.items()
+            },
+        }
+    )
@@ -0,0 +1 @@
+"""Tests for the Premier Inn integration."""
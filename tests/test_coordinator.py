@@ -0,0 +1,50 @@
+"""Tests for the booking coordinator."""
+
+import asyncio
+from unittest.mock import MagicMock, patch
+
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+
+from custom_components.premierinn.const import (
+    CONF_ARRIVAL_DATE,
+    CONF_LAST_NAME,
+    CONF_RES_NO,
+)
+from custom_components.premierinn.coordinator import PremierInnCoordinator
+
+BOOKING = {
+    CONF_RES_NO: "ABC123",
+    CONF_LAST_NAME: "Smith",
+    CONF_ARRIVAL_DATE: "2024-06-10",
+}
+
+
+async def test_refreshes_are_shared(hass: HomeAssistant) -> None:
+    """Test scheduled and on demand refreshes never overlap."""
+    coordinator = PremierInnCoordinator(hass, MagicMock(), BOOKING)
+    coordinator.update_interval = None
+    release = asyncio.Event()
+
+    async def async_update_data() -> dict:
+        await release.wait()
+        return {}
+
+    with patch.object(
+        coordinator, "_async_update_data", side_effect=async_update_data
+    ) as update:
+        scheduled = hass.async_create_task(coordinator.async_refresh_shared())
+        on_demand = hass.async_create_task(coordinator.async_refresh_debounced())
+        await asyncio.sleep(0)
+        release.set()
+        await asyncio.gather(scheduled, on_demand)
+        assert update.call_count == 1
+
+        # A refresh on demand shortly after shares the last result...
+        coordinator.last_refreshed = dt_util.utcnow()
+        await coordinator.async_refresh_debounced()
+        assert update.call_count == 1
+
+        # ...while the scheduler always refreshes once nothing is running.
+        await coordinator.async_refresh_shared()
+        assert update.call_count == 2
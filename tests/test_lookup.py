@@ -0,0 +1,148 @@
+"""Tests for the booking lookup."""
+
+import asyncio
+import json
+from typing import Any
+from unittest.mock import patch
+
+from homeassistant.core import HomeAssistant
+import pytest
+
+from custom_components.premierinn.const import (
+    CONF_ARRIVAL_DATE,
+    CONF_ARRIVALDATE,
+    CONF_COUNTRY,
+    CONF_DE,
+    CONF_FIND_BOOKING_CRITERIA,
+    CONF_GB,
+    CONF_GERMANY,
+    CONF_GREAT_BRITAIN,
+    CONF_LAST_NAME,
+    CONF_RES_NO,
+    CONF_VARIABLES,
+    LOOKUP_MAX_PROBES,
+)
+from custom_components.premierinn.exceptions import (
+    APIRatelimitExceeded,
+    CannotConnect,
+)
+from custom_components.premierinn.lookup import arrival_dates, async_locate_booking
+
+BOOKING = {
+    CONF_RES_NO: "ABC123",
+    CONF_LAST_NAME: "Smith",
+    CONF_ARRIVAL_DATE: "2024-06-10",
+}
+COUNTRIES = [CONF_GREAT_BRITAIN, CONF_GERMANY]
+
+
+class FakeClient:
+    """API client that knows a booking in one country on one date."""
+
+    def __init__(
+        self,
+        country: str | None = None,
+        arrival_date: str | None = None,
+        error: Exception | None = None,
+    ) -> None:
+        """Initialize."""
+        self.country = country
+        self.arrival_date = arrival_date
+        self.error = error
+        self.calls: list[tuple[str, str]] = []
+
+    async def async_post(
+        self, operation: str, country: str, post_body: dict[str, Any]
+    ) -> bytes:
+        """Answer a findBooking request."""
+        criteria = post_body[CONF_VARIABLES][CONF_FIND_BOOKING_CRITERIA]
+        assert criteria[CONF_COUNTRY] == country
+        self.calls.append((country, criteria[CONF_ARRIVALDATE]))
+        # Let the other lookups run meanwhile.
+        await asyncio.sleep(0)
+        if self.error is not None:
+            raise self.error
+        if (country, criteria[CONF_ARRIVALDATE]) != (self.country, self.arrival_date):
+            return json.dumps(
+                {"data": {operation: None}, "errors": [{"message": "Not found"}]}
+            ).encode()
+        return json.dumps({"data": {operation: {"basketReference": "basket"}}}).encode()
+
+
+async def locate(
+    hass: HomeAssistant, client: FakeClient, window: int = 0
+) -> tuple[str, str, str] | None:
+    """Search for the booking with a fake client."""
+    with patch(
+        "custom_components.premierinn.lookup.async_get_api_client",
+        return_value=client,
+    ):
+        return await async_locate_booking(hass, BOOKING, COUNTRIES, window)
+
+
+def test_arrival_dates() -> None:
+    """Test the arrival date comes first, then its neighbours nearest first."""
+    assert arrival_dates("2024-06-10", 0) == ["2024-06-10"]
+    assert arrival_dates("2024-06-30", 2) == [
+        "2024-06-30",
+        "2024-06-29",
+        "2024-07-01",
+        "2024-06-28",
+        "2024-07-02",
+    ]
+
+
+async def test_locate_country(hass: HomeAssistant) -> None:
+    """Test every country is tried and the one knowing the booking wins."""
+    client = FakeClient(CONF_DE, "2024-06-10")
+
+    assert await locate(hass, client) == (CONF_GERMANY, "2024-06-10", "basket")
+    assert sorted(client.calls) == [(CONF_DE, "2024-06-10"), (CONF_GB, "2024-06-10")]
+
+
+async def test_locate_not_found(hass: HomeAssistant) -> None:
+    """Test a booking no country knows is not found."""
+    client = FakeClient()
+
+    assert await locate(hass, client) is None
+    assert len(client.calls) == len(COUNTRIES)
+
+
+@pytest.mark.parametrize(
+    "error", [APIRatelimitExceeded("Slow down"), CannotConnect("Refused")]
+)
+async def test_locate_failure(hass: HomeAssistant, error: Exception) -> None:
+    """Test failing to reach the API is not mistaken for a missing booking."""
+    client = FakeClient(error=error)
+
+    with pytest.raises(type(error)):
+        await locate(hass, client)
+
+
+async def test_locate_nearby_date(hass: HomeAssistant) -> None:
+    """Test nearby dates are searched nearest first until one matches."""
+    client = FakeClient(CONF_GB, "2024-06-11")
+
+    assert await locate(hass, client, 3) == (
+        CONF_GREAT_BRITAIN,
+        "2024-06-11",
+        "basket",
+    )
+    assert [call[1] for call in client.calls[:6]] == [
+        "2024-06-10",
+        "2024-06-10",
+        "2024-06-09",
+        "2024-06-09",
+        "2024-06-11",
+        "2024-06-11",
+    ]
+    # Lookups still waiting for their turn are cancelled by the match.
+    assert len(client.calls) < LOOKUP_MAX_PROBES
+
+
+async def test_locate_budget(hass: HomeAssistant) -> None:
+    """Test the search gives up once it runs out of probes."""
+    client = FakeClient()
+
+    assert await locate(hass, client, 7) is None
+    assert len(client.calls) == LOOKUP_MAX_PROBES
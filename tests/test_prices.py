@@ -0,0 +1,92 @@
+"""Tests for the price history ring."""
+
+import base64
+import math
+
+from custom_components.premierinn.const import PRICES_HISTORY_SIZE
+from custom_components.premierinn.prices import (
+    ROW_WIDTH,
+    PriceRing,
+    same_prices,
+    to_float,
+)
+
+
+def prices(value: float) -> tuple[float, ...]:
+    """Return a row of prices, the second of which is missing."""
+    return (value, math.nan, value + 1, value + 2, value + 3)
+
+
+def assert_same_rows(actual, expected) -> None:
+    """Assert two lists of rows match, treating missing prices as equal."""
+    assert len(actual) == len(expected)
+    for row, other in zip(actual, expected):
+        assert same_prices(row, other)
+
+
+def test_to_float() -> None:
+    """Test prices are read as floats and missing ones as NaN."""
+    assert to_float("12.50") == 12.5
+    assert math.isnan(to_float(None))
+    assert math.isnan(to_float("n/a"))
+
+
+def test_same_prices() -> None:
+    """Test missing prices compare equal to each other."""
+    assert same_prices(prices(1.0), prices(1.0))
+    assert not same_prices(prices(1.0), prices(2.0))
+
+
+def test_append_and_read() -> None:
+    """Test changes are read by age and from oldest to newest."""
+    ring = PriceRing()
+    assert len(ring) == 0
+
+    ring.append(100.0, prices(1.0))
+    ring.append(200.0, prices(2.0))
+
+    assert len(ring) == 2
+    assert ring.row(0)[0] == 200.0
+    assert ring.row(1)[0] == 100.0
+    assert [row[0] for row in ring.rows()] == [100.0, 200.0]
+
+
+def test_wraps_when_full() -> None:
+    """Test the oldest changes are overwritten once the ring is full."""
+    ring = PriceRing()
+    for index in range(PRICES_HISTORY_SIZE + 3):
+        ring.append(float(index), prices(float(index)))
+
+    assert len(ring) == PRICES_HISTORY_SIZE
+    assert ring.rows()[0][0] == 3.0
+    assert ring.row(0)[0] == float(PRICES_HISTORY_SIZE + 2)
+
+
+def test_encode_round_trip() -> None:
+    """Test the stored form holds only the recorded rows."""
+    ring = PriceRing()
+    for index in range(3):
+        ring.append(float(index), prices(float(index)))
+
+    encoded = ring.encode()
+    decoded = PriceRing.decode(encoded)
+
+    assert len(decoded) == 3
+    assert_same_rows(decoded.rows(), ring.rows())
+    # Three rows of doubles, not every slot of the ring.
+    assert len(base64.b64decode(encoded)) == 3 * ROW_WIDTH * 8
+
+
+def test_encode_round_trip_after_wrapping() -> None:
+    """Test a wrapped ring is stored oldest first."""
+    ring = PriceRing()
+    for index in range(PRICES_HISTORY_SIZE + 5):
+        ring.append(float(index), prices(float(index)))
+
+    assert_same_rows(PriceRing.decode(ring.encode()).rows(), ring.rows())
+
+
+def test_decode_invalid() -> None:
+    """Test a damaged stored form gives an empty ring."""
+    assert len(PriceRing.decode("not base64!")) == 0
+    assert len(PriceRing.decode("AAAA")) == 0
@@ -0,0 +1,123 @@
+"""Tests for the GraphQL query composer."""
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
+
+from custom_components.premierinn.const import (
+    CONF_BOOKING_CONFIRMATION,
+    CONF_HOTEL_INFORMATION,
+    DATA_NOTICES,
+    DOMAIN,
+)
+from custom_components.premierinn.query import (
+    CORE_FIELDS,
+    GEO_LOCATION_FIELDS,
+    NOTICE_FIELDS,
+    SCHEMAS,
+    async_get_fields,
+    compose_query,
+    top_level,
+)
+
+HTML_FIELDS = {"contactDetails", "parkingDescription", "directions", "importantInfo"}
+
+
+def test_compose_query_selects_fields_in_schema_order() -> None:
+    """Test only the given fields are selected, in schema order."""
+    query = compose_query(
+        CONF_HOTEL_INFORMATION, frozenset({"coordinates", "name", "hotelId"})
+    )
+    assert "{ hotelId name coordinates { latitude longitude } }" in query
+    assert "address" not in query
+
+
+def test_compose_query_nested_paths() -> None:
+    """Test dotted paths select nested fields."""
+    query = compose_query(
+        CONF_BOOKING_CONFIRMATION,
+        frozenset(
+            {
+                "reservationByIdList.roomStay.arrivalDate",
+                "reservationByIdList.reservationId",
+                "hotelId",
+            }
+        ),
+    )
+    assert (
+        "{ reservationByIdList { reservationId roomStay { arrivalDate } } hotelId }"
+        in query
+    )
+
+
+def test_compose_query_every_field() -> None:
+    """Test a whole subtree is selected when its parent is given."""
+    query = compose_query(CONF_HOTEL_INFORMATION)
+    for field in SCHEMAS[CONF_HOTEL_INFORMATION]:
+        assert field in query
+    assert "infoItems { text priority startDate endDate }" in query
+
+
+def test_top_level() -> None:
+    """Test the top-level keys of a response are derived from the fields."""
+    assert top_level(
+        frozenset({"reservationByIdList.roomStay.arrivalDate", "hotelId"}),
+        CONF_BOOKING_CONFIRMATION,
+    ) == {"reservationByIdList", "hotelId"}
+    assert top_level(None, CONF_HOTEL_INFORMATION) == set(
+        SCHEMAS[CONF_HOTEL_INFORMATION]
+    )
+
+
+async def test_fields_of_new_booking(hass: HomeAssistant) -> None:
+    """Test entities that are not registered yet count as enabled."""
+    fields = async_get_fields(hass, "ABC123")
+
+    assert (
+        fields[CONF_BOOKING_CONFIRMATION]
+        == frozenset(SCHEMAS[CONF_BOOKING_CONFIRMATION])
+        | CORE_FIELDS[CONF_BOOKING_CONFIRMATION]
+    )
+    assert GEO_LOCATION_FIELDS <= fields[CONF_HOTEL_INFORMATION]
+    # No notices are kept until the integration is set up.
+    assert not NOTICE_FIELDS & fields[CONF_HOTEL_INFORMATION]
+
+
+async def test_fields_of_disabled_consumers(hass: HomeAssistant) -> None:
+    """Test disabled consumers leave only the core fields and no HTML."""
+    registry = er.async_get(hass)
+    for domain, unique_id in (
+        ("sensor", f"{DOMAIN}-abc123-roomstay"),
+        ("sensor", f"{DOMAIN}-abc123-hotelinformation"),
+        ("geo_location", f"{DOMAIN}-bribou"),
+    ):
+        registry.async_get_or_create(
+            domain, DOMAIN, unique_id, disabled_by=er.RegistryEntryDisabler.USER
+        )
+
+    fields = async_get_fields(hass, "ABC123", "BRIBOU")
+
+    assert fields == CORE_FIELDS
+    assert not HTML_FIELDS & fields[CONF_HOTEL_INFORMATION]
+
+
+async def test_fields_of_hotel_sensor(hass: HomeAssistant) -> None:
+    """Test the hotel sensor keeps its attributes without the geolocation."""
+    er.async_get(hass).async_get_or_create(
+        "geo_location",
+        DOMAIN,
+        f"{DOMAIN}-bribou",
+        disabled_by=er.RegistryEntryDisabler.USER,
+    )
+
+    fields = async_get_fields(hass, "ABC123", "BRIBOU")
+
+    assert GEO_LOCATION_FIELDS <= fields[CONF_HOTEL_INFORMATION]
+
+
+async def test_fields_of_notices(hass: HomeAssistant) -> None:
+    """Test the notices add the important information."""
+    hass.data[DATA_NOTICES] = object()
+
+    fields = async_get_fields(hass, "ABC123", "BRIBOU")
+
+    assert NOTICE_FIELDS <= fields[CONF_HOTEL_INFORMATION]
@@ -0,0 +1,109 @@
+"""Tests for the GraphQL response parser."""
+
+import json
+
+import pytest
+
+from custom_components.premierinn.const import (
+    CONF_BOOKING_CONFIRMATION,
+    CONF_FIND_BOOKING,
+    CONF_HOTEL_INFORMATION,
+)
+from custom_components.premierinn.exceptions import (
+    APIRatelimitExceeded,
+    InvalidAuth,
+    InvalidResponse,
+    PremierInnError,
+)
+from custom_components.premierinn.response import VALIDATORS, parse_response
+
+HOTEL = {
+    "hotelId": "BRIBOU",
+    "name": "Bristol City Centre",
+    "address": {"addressLine1": "Haymarket"},
+    "coordinates": {"latitude": 51.46, "longitude": -2.59},
+}
+
+
+def payload(operation: str, data, **extra) -> bytes:
+    """Return a GraphQL response holding the data of an operation."""
+    return json.dumps({"data": {operation: data}, **extra}).encode()
+
+
+def test_parse_valid_response() -> None:
+    """Test the data of the operation is returned."""
+    assert (
+        parse_response(CONF_HOTEL_INFORMATION, payload(CONF_HOTEL_INFORMATION, HOTEL))
+        == HOTEL
+    )
+
+
+def test_parse_missing_field() -> None:
+    """Test a response missing a required field is rejected with its path."""
+    hotel = {key: value for key, value in HOTEL.items() if key != "coordinates"}
+    with pytest.raises(InvalidResponse, match="hotelInformation.coordinates"):
+        parse_response(CONF_HOTEL_INFORMATION, payload(CONF_HOTEL_INFORMATION, hotel))
+
+
+def test_parse_wrong_type() -> None:
+    """Test a leaf of the wrong type is rejected."""
+    hotel = {**HOTEL, "coordinates": {"latitude": "51.46", "longitude": -2.59}}
+    with pytest.raises(InvalidResponse, match="coordinates.latitude"):
+        parse_response(CONF_HOTEL_INFORMATION, payload(CONF_HOTEL_INFORMATION, hotel))
+
+
+def test_parse_empty_reservation_list() -> None:
+    """Test a booking without reservations is rejected."""
+    booking = {
+        "hotelId": "BRIBOU",
+        "bookingReference": "ABC123",
+        "reservationByIdList": [],
+    }
+    with pytest.raises(InvalidResponse, match="non-empty list"):
+        parse_response(
+            CONF_BOOKING_CONFIRMATION, payload(CONF_BOOKING_CONFIRMATION, booking)
+        )
+
+
+def test_parse_invalid_json() -> None:
+    """Test a body that is not JSON is rejected."""
+    with pytest.raises(InvalidResponse, match="Invalid JSON"):
+        parse_response(CONF_FIND_BOOKING, b"<html>")
+
+
+def test_parse_missing_operation() -> None:
+    """Test a response without the operation is rejected."""
+    with pytest.raises(InvalidResponse, match="No findBooking"):
+        parse_response(CONF_FIND_BOOKING, json.dumps({"data": {}}).encode())
+
+
+@pytest.mark.parametrize(
+    ("code", "exception"),
+    [
+        ("UNAUTHENTICATED", InvalidAuth),
+        ("TOO_MANY_REQUESTS", APIRatelimitExceeded),
+        ("INTERNAL_SERVER_ERROR", PremierInnError),
+    ],
+)
+def test_parse_errors(code: str, exception: type[Exception]) -> None:
+    """Test GraphQL errors raise the matching exception."""
+    body = json.dumps(
+        {"data": None, "errors": [{"message": "Failed", "extensions": {"code": code}}]}
+    ).encode()
+    with pytest.raises(exception):
+        parse_response(CONF_FIND_BOOKING, body)
+
+
+def test_parse_partial_data_with_errors() -> None:
+    """Test errors are ignored while the operation still has data."""
+    body = payload(
+        CONF_FIND_BOOKING,
+        {"basketReference": "basket"},
+        errors=[{"message": "Deprecated field"}],
+    )
+    assert parse_response(CONF_FIND_BOOKING, body) == {"basketReference": "basket"}
+
+
+def test_validator_accepts_extra_fields() -> None:
+    """Test fields the integration does not rely on are allowed."""
+    VALIDATORS[CONF_HOTEL_INFORMATION]({**HOTEL, "brand": "PI"}, CONF_HOTEL_INFORMATION)
@@ -0,0 +1,150 @@
+"""Tests for the refresh scheduler."""
+
+from datetime import timedelta
+from unittest.mock import AsyncMock, MagicMock
+
+from freezegun.api import FrozenDateTimeFactory
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+import pytest
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+from custom_components.premierinn.const import (
+    SCHEDULER_ARRIVAL_INTERVAL,
+    SCHEDULER_DEFAULT_INTERVAL,
+    SCHEDULER_DISTANT_INTERVAL,
+    SCHEDULER_RETRY_INTERVAL,
+)
+from custom_components.premierinn.scheduler import (
+    PremierInnRefreshScheduler,
+    refresh_interval,
+)
+
+
+def mock_coordinator(
+    res_no: str = "ABC123",
+    data: dict | None = None,
+    check_in: timedelta | None = None,
+    last_update_success: bool = True,
+) -> MagicMock:
+    """Return a coordinator of a booking checking in after a delay."""
+    coordinator = MagicMock()
+    coordinator.res_no = res_no
+    coordinator.data = data
+    coordinator.last_update_success = last_update_success
+    coordinator.booking = None
+    if check_in is not None:
+        coordinator.booking = MagicMock(check_in=dt_util.now() + check_in)
+    coordinator.async_refresh_shared = AsyncMock()
+    return coordinator
+
+
+@pytest.mark.parametrize(
+    ("coordinator", "interval"),
+    [
+        (mock_coordinator(), SCHEDULER_RETRY_INTERVAL),
+        (
+            mock_coordinator(data={"data": 1}, last_update_success=False),
+            SCHEDULER_RETRY_INTERVAL,
+        ),
+        (mock_coordinator(data={"data": 1}), SCHEDULER_DEFAULT_INTERVAL),
+        (
+            mock_coordinator(data={"data": 1}, check_in=timedelta(hours=2)),
+            SCHEDULER_ARRIVAL_INTERVAL,
+        ),
+        (
+            mock_coordinator(data={"data": 1}, check_in=timedelta(days=3)),
+            SCHEDULER_DEFAULT_INTERVAL,
+        ),
+        (
+            mock_coordinator(data={"data": 1}, check_in=timedelta(days=30)),
+            SCHEDULER_DISTANT_INTERVAL,
+        ),
+        (
+            mock_coordinator(data={"data": 1}, check_in=timedelta(days=-1)),
+            SCHEDULER_DEFAULT_INTERVAL,
+        ),
+    ],
+)
+def test_refresh_interval(
+    hass: HomeAssistant, coordinator: MagicMock, interval: float
+) -> None:
+    """Test bookings are refreshed more often as check in nears."""
+    assert refresh_interval(hass, coordinator) == interval
+
+
+async def test_refresh_when_due(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test a coordinator is refreshed once its data is stale."""
+    scheduler = PremierInnRefreshScheduler(hass)
+    coordinator = mock_coordinator()
+    remove = scheduler.async_add_coordinator(coordinator)
+    assert coordinator.update_interval is None
+
+    freezer.tick(timedelta(seconds=SCHEDULER_RETRY_INTERVAL - 10))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    coordinator.async_refresh_shared.assert_not_awaited()
+
+    freezer.tick(timedelta(seconds=11))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    coordinator.async_refresh_shared.assert_awaited_once()
+
+    remove()
+
+
+async def test_first_refresh(hass: HomeAssistant) -> None:
+    """Test a coordinator can be refreshed as soon as it is added."""
+    scheduler = PremierInnRefreshScheduler(hass)
+    coordinator = mock_coordinator()
+    remove = scheduler.async_add_coordinator(coordinator, first_refresh=True)
+
+    await hass.async_block_till_done()
+    coordinator.async_refresh_shared.assert_awaited_once()
+
+    remove()
+
+
+async def test_duplicate_booking(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test a second coordinator of a booking replaces the first."""
+    scheduler = PremierInnRefreshScheduler(hass)
+    first = mock_coordinator("abc123")
+    second = mock_coordinator("ABC123")
+    remove_first = scheduler.async_add_coordinator(first)
+    remove_second = scheduler.async_add_coordinator(second)
+
+    # Removing the replaced coordinator leaves the booking scheduled.
+    remove_first()
+
+    freezer.tick(timedelta(seconds=SCHEDULER_RETRY_INTERVAL + 1))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+
+    first.async_refresh_shared.assert_not_awaited()
+    second.async_refresh_shared.assert_awaited_once()
+
+    remove_second()
+
+
+async def test_remove_coordinator(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test a removed coordinator is no longer refreshed."""
+    scheduler = PremierInnRefreshScheduler(hass)
+    kept = mock_coordinator("ABC123")
+    removed = mock_coordinator("DEF456")
+    remove_kept = scheduler.async_add_coordinator(kept)
+    scheduler.async_add_coordinator(removed)()
+
+    freezer.tick(timedelta(seconds=SCHEDULER_RETRY_INTERVAL + 1))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+
+    removed.async_refresh_shared.assert_not_awaited()
+    kept.async_refresh_shared.assert_awaited_once()
+
+    remove_kept()
@@ -0,0 +1,185 @@
+"""Tests for the upcoming stays summary."""
+
+from collections.abc import Callable
+from datetime import date, datetime, timedelta
+from types import SimpleNamespace
+
+from freezegun.api import FrozenDateTimeFactory
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+import pytest
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+from custom_components.premierinn.const import CONF_HOTEL_INFORMATION
+from custom_components.premierinn.stays import (
+    STAY_CURRENT,
+    STAY_ENDED,
+    PremierInnStays,
+    Stay,
+    month_bounds,
+)
+
+# The stays wake up for the next check in, check out or month.
+lingering_timer = pytest.mark.parametrize("expected_lingering_timers", [True])
+
+
+def local_time(day: date, hours: float) -> datetime:
+    """Return a local time on a day."""
+    return dt_util.start_of_local_day(day) + timedelta(hours=hours)
+
+
+class FakeCoordinator:
+    """Coordinator holding the dates of a booking."""
+
+    def __init__(self, hotel: str = "Bristol") -> None:
+        """Initialize."""
+        self.hotel = hotel
+        self.data: dict | None = None
+        self.booking: SimpleNamespace | None = None
+        self._listeners: list[Callable[[], None]] = []
+
+    def async_add_listener(self, update_callback: Callable[[], None]):
+        """Call back whenever the booking changes."""
+        self._listeners.append(update_callback)
+        return lambda: self._listeners.remove(update_callback)
+
+    def set_dates(self, check_in: datetime | None, check_out: datetime | None = None):
+        """Change the dates of the booking, or clear it."""
+        if check_in is None:
+            self.data = self.booking = None
+        else:
+            self.data = {CONF_HOTEL_INFORMATION: {"name": self.hotel}}
+            self.booking = SimpleNamespace(
+                check_in=check_in, check_out=check_out or check_in + timedelta(days=1)
+            )
+        for update_callback in list(self._listeners):
+            update_callback()
+
+
+def test_month_bounds() -> None:
+    """Test the month containing a day, including December."""
+    assert month_bounds(date(2024, 6, 15)) == (date(2024, 6, 1), date(2024, 7, 1))
+    assert month_bounds(date(2024, 12, 31)) == (date(2024, 12, 1), date(2025, 1, 1))
+
+
+def test_nights_in() -> None:
+    """Test only the nights within the dates are counted."""
+    stay = Stay(
+        "ABC123",
+        None,
+        local_time(date(2024, 1, 30), 15),
+        local_time(date(2024, 2, 2), 12),
+    )
+    assert stay.nights_in(date(2024, 1, 1), date(2024, 2, 1)) == 2
+    assert stay.nights_in(date(2024, 2, 1), date(2024, 3, 1)) == 1
+    assert stay.nights_in(date(2024, 3, 1), date(2024, 4, 1)) == 0
+
+
+@lingering_timer
+async def test_changed_and_removed_bookings(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test heap entries of changed and removed stays are skipped."""
+    freezer.move_to(local_time(date(2024, 6, 1), 12))
+    stays = PremierInnStays(hass)
+    updates = []
+    stays.async_add_listener(lambda: updates.append(stays.as_dict()))
+
+    first, second = FakeCoordinator("Bristol"), FakeCoordinator("Bath")
+    first.set_dates(local_time(date(2024, 6, 3), 15))
+    second.set_dates(local_time(date(2024, 6, 5), 15))
+    stays.async_add_booking("FIRST", first)
+    remove_second = stays.async_add_booking("SECOND", second)
+
+    assert stays.next_stay.booking == "FIRST"
+    assert stays.upcoming == 2
+
+    # The old entry of the first stay is left at the top of the heap.
+    first.set_dates(local_time(date(2024, 6, 10), 15))
+    assert stays.next_stay.booking == "SECOND"
+    assert stays.next_stay.hotel == "Bath"
+    assert stays.upcoming == 2
+
+    remove_second()
+    assert stays.next_stay.booking == "FIRST"
+    assert stays.next_stay.check_in == local_time(date(2024, 6, 10), 15)
+    assert stays.upcoming == 1
+
+    first.set_dates(None)
+    assert stays.next_stay is None
+    assert stays.upcoming == 0
+    assert updates[-1]["next_booking"] is None
+
+    # An update that leaves the stay unchanged is not announced.
+    count = len(updates)
+    first.set_dates(None)
+    assert len(updates) == count
+
+
+@lingering_timer
+async def test_check_in_and_out(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test stays become current at check in and end at check out."""
+    freezer.move_to(local_time(date(2024, 6, 1), 12))
+    stays = PremierInnStays(hass)
+    coordinator = FakeCoordinator()
+    coordinator.set_dates(
+        local_time(date(2024, 6, 1), 15), local_time(date(2024, 6, 3), 11)
+    )
+    stays.async_add_booking("ABC123", coordinator)
+    assert stays.next_stay.booking == "ABC123"
+
+    freezer.move_to(local_time(date(2024, 6, 1), 16))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+
+    assert stays.next_stay is None
+    assert stays.current_stay.booking == "ABC123"
+    assert stays.upcoming == 0
+    assert stays._where["ABC123"] == STAY_CURRENT
+
+    freezer.move_to(local_time(date(2024, 6, 3), 12))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+
+    assert stays.current_stay is None
+    assert stays._where["ABC123"] == STAY_ENDED
+
+
+@lingering_timer
+async def test_month_rollover(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test the nights are counted again when the month changes."""
+    freezer.move_to(local_time(date(2024, 1, 20), 12))
+    stays = PremierInnStays(hass)
+    updates = []
+    stays.async_add_listener(lambda: updates.append(stays.nights_this_month))
+
+    january, february = FakeCoordinator(), FakeCoordinator()
+    january.set_dates(
+        local_time(date(2024, 1, 31), 15), local_time(date(2024, 2, 3), 12)
+    )
+    february.set_dates(
+        local_time(date(2024, 2, 10), 15), local_time(date(2024, 2, 12), 12)
+    )
+    stays.async_add_booking("JANUARY", january)
+    stays.async_add_booking("FEBRUARY", february)
+    assert stays.nights_this_month == 1
+
+    # No check in or out is due, only the start of the month.
+    freezer.move_to(local_time(date(2024, 1, 31), 12))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert stays.nights_this_month == 1
+
+    freezer.move_to(local_time(date(2024, 2, 1), 0.5))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert stays.nights_this_month == 4
+    assert updates[-1] == 4
+
+    # Removing a stay takes away only its nights of the new month.
+    february.set_dates(None)
+    assert stays.nights_this_month == 2